@@ -1,15 +1,16 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import LoginReq, SignupReq
 from app.core.validators import validate_email, validate_password_pair, validate_nickname
 from app.core.exceptions import bad_request, conflict
 from app.models.user import User
 
 
-def login_controller(req: LoginReq, db: Session):
+async def login_controller(req: LoginReq, db: AsyncSession):
     """로그인 컨트롤러"""
     validate_email(req.email)
     
-    user = db.query(User).filter(User.email == req.email).first()
+    user = (await db.execute(select(User).where(User.email == req.email))).scalar_one_or_none()
     if not user:
         raise bad_request("invalid_credentials")
     
@@ -23,7 +24,7 @@ def login_controller(req: LoginReq, db: Session):
     }
 
 
-def signup_controller(req: SignupReq, db: Session):
+async def signup_controller(req: SignupReq, db: AsyncSession):
     """회원가입 컨트롤러"""
     validate_email(req.email)
     validate_password_pair(req.password, req.password_check)
@@ -33,9 +34,9 @@ def signup_controller(req: SignupReq, db: Session):
     if not req.profile_image_url:
         raise bad_request("profile_image_url_required")
 
-    if db.query(User).filter(User.email == req.email).first():
+    if (await db.execute(select(User.id).where(User.email == req.email))).first():
         raise conflict("duplicate_email")
-    if db.query(User).filter(User.nickname == req.nickname).first():
+    if (await db.execute(select(User.id).where(User.nickname == req.nickname))).first():
         raise conflict("duplicate_nickname")
 
     user = User(
@@ -46,7 +47,7 @@ def signup_controller(req: SignupReq, db: Session):
     )
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     
     return {"user_id": user.id}
@@ -1,19 +1,27 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from app.core.exceptions import not_found, forbidden
 from app.models.comment import Comment
 from app.models.post import Post
 from app.models.user import User
 from app.schemas import CommentCreateReq, CommentUpdateReq
 from app.services.model_client import analyze_sentiment
+from app.services.post_cache import post_cache
 
 
-def get_comments_controller(post_id: int, db: Session):
+async def get_comments_controller(post_id: int, db: AsyncSession):
     """댓글 목록 조회 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = (await db.execute(select(Post.id).where(Post.id == post_id))).first()
     if not post:
         raise not_found("post_not_found")
 
-    comments = db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.created_at.asc()).all()
+    comments = (await db.execute(
+        select(Comment)
+        .options(joinedload(Comment.user))
+        .where(Comment.post_id == post_id)
+        .order_by(Comment.created_at.asc())
+    )).scalars().all()
     
     comments_data = []
     for comment in comments:
@@ -27,9 +35,9 @@ def get_comments_controller(post_id: int, db: Session):
     return comments_data
 
 
-async def create_comment_controller(post_id: int, req: CommentCreateReq, user_id: int, db: Session):
+async def create_comment_controller(post_id: int, req: CommentCreateReq, user_id: int, db: AsyncSession):
     """댓글 작성 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = (await db.execute(select(Post.id).where(Post.id == post_id))).first()
     if not post:
         raise not_found("post_not_found")
     
@@ -44,15 +52,24 @@ async def create_comment_controller(post_id: int, req: CommentCreateReq, user_id
         content=req.content
     )
     db.add(comment)
-    db.commit()
-    db.refresh(comment)
+    # 댓글 수는 같은 트랜잭션에서 상대 증감으로 갱신
+    await db.execute(
+        update(Post).where(Post.id == post_id)
+        .values(comment_count=Post.comment_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    await db.refresh(comment)
+    post_cache.invalidate(post_id)
     
     return {"comment_id": comment.id}
 
 
-def update_comment_controller(post_id: int, comment_id: int, req: CommentUpdateReq, user_id: int, db: Session):
+async def update_comment_controller(post_id: int, comment_id: int, req: CommentUpdateReq, user_id: int, db: AsyncSession):
     """댓글 수정 컨트롤러"""
-    comment = db.query(Comment).filter(Comment.id == comment_id, Comment.post_id == post_id).first()
+    comment = (await db.execute(
+        select(Comment).where(Comment.id == comment_id, Comment.post_id == post_id)
+    )).scalar_one_or_none()
     if not comment:
         raise not_found("comment_not_found")
     
@@ -60,21 +77,30 @@ def update_comment_controller(post_id: int, comment_id: int, req: CommentUpdateR
         raise forbidden()
     
     comment.content = req.content
-    db.commit()
+    await db.commit()
+    post_cache.invalidate(post_id)
     
     return {"comment_id": comment_id}
 
 
-def delete_comment_controller(post_id: int, comment_id: int, user_id: int, db: Session):
+async def delete_comment_controller(post_id: int, comment_id: int, user_id: int, db: AsyncSession):
     """댓글 삭제 컨트롤러"""
-    comment = db.query(Comment).filter(Comment.id == comment_id, Comment.post_id == post_id).first()
+    comment = (await db.execute(
+        select(Comment).where(Comment.id == comment_id, Comment.post_id == post_id)
+    )).scalar_one_or_none()
     if not comment:
         raise not_found("comment_not_found")
     
     if comment.user_id != user_id:
         raise forbidden()
     
-    db.delete(comment)
-    db.commit()
+    await db.delete(comment)
+    await db.execute(
+        update(Post).where(Post.id == post_id)
+        .values(comment_count=Post.comment_count - 1)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    post_cache.invalidate(post_id)
     
     return {"comment_id": comment_id}
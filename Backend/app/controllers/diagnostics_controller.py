@@ -0,0 +1,27 @@
+from app.core import database
+from app.services.model_balancer import balancer
+from app.services.model_client import batcher
+from app.services.model_breaker import guards
+from app.services.model_cache import model_cache
+from app.services.model_discovery import prober
+
+
+def get_model_api_diagnostics_controller():
+    """Model API 연동 상태 (엔드포인트 탐색 / 레플리카 부하 / 서킷 브레이커 / 결과 캐시 / 자동 배치) 조회 컨트롤러"""
+    return {
+        "endpoints": prober.snapshot(),
+        "replicas": balancer.stats(),
+        "breakers": guards.snapshot(),
+        "cache": model_cache.stats(),
+        "batching": batcher.stats(),
+    }
+
+
+def get_db_pool_diagnostics_controller():
+    """DB 커넥션 풀 (API 요청용 async 엔진 / 백그라운드 작업용 동기 엔진 / 레플리카) 지표와 읽기 라우팅 조회 컨트롤러"""
+    return {
+        "api": database.api_pool.stats(),
+        "background": database.background_pool.stats(),
+        "replicas": {monitor.name: monitor.stats() for monitor in database.replica_pools},
+        "read_routing": database.read_router.stats(),
+    }
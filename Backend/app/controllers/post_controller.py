@@ -1,23 +1,42 @@
 import os
+import time
 import uuid
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+import json
+import base64
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import select, update, delete, or_, and_, insert, func
+from sqlalchemy.exc import IntegrityError, OperationalError
+from app.core.database import is_replica, read_router
 from app.core.validators import validate_title
 from app.core.exceptions import bad_request, not_found, forbidden, unprocessable, unauthorized
-from app.models.post import Post, PostLike, Tag
+from app.models.post import Post, PostLike, post_tags
 from app.models.user import User
 from app.models.comment import Comment
 from app.schemas import PostCreateReq, PostUpdateReq
-from app.services.model_client import predict_image, summarize_text, auto_tag_text, analyze_sentiment
+from app.services.model_client import predict_image
+from app.services import post_enrichment
+from app.services.post_enrichment import content_hash, enrich_post_content
+from app.services.enrichment_worker import enrichment_pool, STATUS_DONE, STATUS_PENDING
+from app.services.board_counter import board_counter
+from app.services.view_counter import view_buffer
+from app.services.post_cache import post_cache
+from app.services.tag_resolver import tag_resolver
+from app.services.tag_postings import merge_postings, tag_postings
 
 UPLOAD_DIR = os.path.abspath("./uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# 다시 실행하면 성공할 수 있는 잠금 충돌: MySQL 교착 상태(1213) / 잠금 대기 초과(1205), 직렬화 실패 / 교착 SQLSTATE
+_LOCK_CONFLICT_CODES = (1205, 1213)
+_LOCK_CONFLICT_SQLSTATES = ("40001", "40P01")
 
-async def create_post_controller(req: PostCreateReq, user_id: int, db: Session):
+
+async def create_post_controller(req: PostCreateReq, user_id: int, db: AsyncSession):
     """게시글 작성 컨트롤러"""
     # Check user existence
-    user = db.query(User).filter(User.id == user_id).first()
+    user = (await db.execute(select(User.id).where(User.id == user_id))).first()
     if not user:
         raise unauthorized()
 
@@ -26,28 +45,6 @@ async def create_post_controller(req: PostCreateReq, user_id: int, db: Session):
     
     validate_title(req.title)
     
-    # AI 서비스 호출
-    tags_list = await auto_tag_text(req.content)
-    summary_res = await summarize_text(req.content)
-    summary = summary_res.get("summary") if summary_res else None
-    
-    sentiment_res = await analyze_sentiment(req.content)
-    sentiment_score = None
-    sentiment_label = None
-    if sentiment_res:
-        sentiment_score = sentiment_res.get("confidence")
-        sentiment_label = sentiment_res.get("label")
-
-    # Handle Tags
-    db_tags = []
-    for tag_name in tags_list:
-        tag = db.query(Tag).filter(Tag.name == tag_name).first()
-        if not tag:
-            tag = Tag(name=tag_name)
-            db.add(tag)
-            db.flush() # Get ID
-        db_tags.append(tag)
-
     post = Post(
         user_id=user_id,
         title=req.title,
@@ -55,55 +52,223 @@ async def create_post_controller(req: PostCreateReq, user_id: int, db: Session):
         image_url=str(req.image_url) if req.image_url else None,
         image_class=req.image_class,  # 이미지 분류 결과 저장
         board_type=req.board_type,
-        tags=db_tags,
-        summary=summary,
-        sentiment_score=sentiment_score,
-        sentiment_label=sentiment_label,
         like_count=0,
-        view_count=0
+        view_count=0,
+        enrichment_hash=content_hash(req.content)
     )
+
+    deferred = post_enrichment.ENRICHMENT_MODE == "async"
+    tag_names = []
+    if deferred:
+        # 게시글을 먼저 저장하고 요약/감성/태그는 워커가 나중에 채움
+        post.enrichment_status = STATUS_PENDING
+    else:
+        # AI 서비스 호출 (태그 / 요약 / 감성 동시 호출, 예산 초과 시 받은 결과만 사용)
+        enrichment = await enrich_post_content(req.content)
+        tag_names = enrichment["tags"]
+        post.summary = enrichment["summary"]
+        post.sentiment_score = enrichment["sentiment_score"]
+        post.sentiment_label = enrichment["sentiment_label"]
+        post.enrichment_status = STATUS_DONE
     
     db.add(post)
-    db.commit()
-    db.refresh(post)
+    board_counter.track(db.sync_session, post.board_type, 1)
+    tag_ids = []
+    if tag_names:
+        # 태그 수와 무관하게 일괄 조회 / 생성 후 post_tags 한 번에 연결
+        await db.flush()
+        tag_ids = await db.run_sync(tag_resolver.attach, post.id, tag_names)
+    await db.commit()
+    await db.refresh(post)
+    if tag_ids:
+        tag_postings.add(post.board_type, tag_ids, post.created_at, post.id)
+
+    if deferred:
+        enrichment_pool.enqueue(post.id, post.enrichment_hash)
     
-    return {"post_id": post.id}
+    return {"post_id": post.id, "enrichment_status": post.enrichment_status}
+
+
+def _encode_cursor(post: Post) -> str:
+    """(created_at, id) 기준 다음 페이지 커서 생성 (클라이언트에는 불투명한 문자열)"""
+    payload = {"c": post.created_at.isoformat(), "i": post.id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """커서 문자열을 (created_at, id)로 복원"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise bad_request("invalid_cursor")
+
+
+def _tag_filter(tag_ids: list[int], tag_match: str):
+    """post_tags (tag_id, post_id) 인덱스로 태그가 달린 게시글 조건 (all = 모든 태그 / any = 하나 이상)"""
+    tagged = select(post_tags.c.post_id).where(post_tags.c.tag_id.in_(tag_ids))
+    if tag_match == "all" and len(tag_ids) > 1:
+        tagged = tagged.group_by(post_tags.c.post_id).having(func.count() == len(tag_ids))
+    return Post.id.in_(tagged)
+
+
+def _keyset_before(query, cursor: str):
+    """(created_at, id) 기준 커서보다 오래된 게시글만"""
+    cursor_created_at, cursor_id = _decode_cursor(cursor)
+    return query.where(or_(
+        Post.created_at < cursor_created_at,
+        and_(Post.created_at == cursor_created_at, Post.id < cursor_id)
+    ))
+
+
+async def _tagged_post_keys_from_cache(db: AsyncSession, board_type: str, tag_ids: list[int], tag_match: str,
+                                       cursor: str | None, count: int):
+    """태그별 최신 게시글 목록 캐시로 페이지의 (created_at, id) 계산 (캐시 구간을 벗어나면 None)"""
+    postings = []
+    for tag_id in tag_ids:
+        cached = tag_postings.get(board_type, tag_id)
+        if cached is None:
+            keys = (await db.execute(
+                select(Post.created_at, Post.id)
+                .join(post_tags, post_tags.c.post_id == Post.id)
+                .where(post_tags.c.tag_id == tag_id, Post.board_type == board_type)
+                .order_by(Post.created_at.desc(), Post.id.desc())
+                .limit(tag_postings.depth + 1)
+            )).all()
+            # 방금 바뀐 태그를 레플리카에서 읽었으면 복제 지연으로 빠진 글이 있을 수 있어 이번 요청에만 사용
+            store = not (is_replica(db) and tag_postings.touched_within(board_type, tag_id, read_router.sticky_seconds))
+            cached = tag_postings.set(board_type, tag_id, [tuple(key) for key in keys], store=store)
+        postings.append(cached)
+    before = _decode_cursor(cursor) if cursor else None
+    return merge_postings(postings, tag_match, before, count)
+
+
+async def _get_tagged_posts(db: AsyncSession, board_type: str, tag_ids: list[int], tag_match: str,
+                            cursor: str | None, limit: int):
+    """태그 필터 목록 (키셋 페이지네이션) -> (게시글 목록, 다음 커서)
+
+    자주 조회되는 태그는 메모리의 태그별 최신 게시글 목록으로 페이지를 정하고 게시글만 id로 로딩,
+    캐시 구간을 벗어나면 post_tags 인덱스로 조회합니다.
+    """
+    keys = await _tagged_post_keys_from_cache(db, board_type, tag_ids, tag_match, cursor, limit + 1)
+    if keys is not None:
+        post_ids = [post_id for _, post_id in keys]
+        found = {
+            post.id: post for post in (await db.execute(
+                select(Post)
+                .options(joinedload(Post.user), selectinload(Post.tags))
+                .where(Post.id.in_(post_ids))
+            )).scalars().unique()
+        }
+        if len(found) == len(post_ids):
+            posts = [found[post_id] for post_id in post_ids[:limit]]
+            return posts, _encode_cursor(posts[-1]) if len(keys) > limit else None
+        # 다른 워커에서 삭제된 게시글이 목록에 남아 있음 -> 제거 후 DB에서 조회
+        tag_postings.discard(set(post_ids) - found.keys())
+    tag_postings.record_fallback()
+    
+    query = select(Post)\
+        .options(joinedload(Post.user), selectinload(Post.tags))\
+        .where(Post.board_type == board_type, _tag_filter(tag_ids, tag_match))
+    if cursor:
+        query = _keyset_before(query, cursor)
+    rows = (await db.execute(
+        query.order_by(Post.created_at.desc(), Post.id.desc()).limit(limit + 1)
+    )).scalars().all()
+    posts = rows[:limit]
+    return posts, _encode_cursor(posts[-1]) if len(rows) > limit else None
+
 
+async def get_posts_controller(
+    page: int,
+    limit: int,
+    user_id: int | None,
+    board_type: str,
+    db: AsyncSession,
+    cursor: str | None = None,
+    include_total: bool | None = None,
+    tags: list[str] | None = None,
+    tag_match: str = "all",
+):
+    """게시글 목록 조회 컨트롤러
 
-def get_posts_controller(page: int, limit: int, user_id: int | None, board_type: str, db: Session):
-    """게시글 목록 조회 컨트롤러"""
+    게시글 수와 무관하게 고정된 수의 쿼리로 목록을 구성합니다.
+    (게시글+작성자 / 태그 / 좋아요 여부, 댓글 수는 posts.comment_count 컬럼)
+
+    - cursor가 None이면 기존 OFFSET 페이지네이션
+    - cursor가 주어지면(빈 문자열 = 첫 페이지) (created_at, id) 기준 키셋 페이지네이션
+    - include_total 미지정 시 OFFSET 모드는 total 포함, 커서 모드는 생략
+    - tags가 주어지면 태그 필터 (tag_match: all = 모든 태그 / any = 하나 이상), 항상 키셋 페이지네이션
+    """
     if page < 1:
         page = 1
     if limit < 1 or limit > 100:
         limit = 10
     
-    offset = (page - 1) * limit
-    
-    # Total count
-    total = db.query(func.count(Post.id)).filter(Post.board_type == board_type).scalar()
-    
-    # Query posts
-    posts = db.query(Post).filter(Post.board_type == board_type)\
-        .order_by(Post.created_at.desc())\
-        .offset(offset).limit(limit).all()
+    tag_filter = bool(tags)
+    cursor_mode = cursor is not None or tag_filter
+    if include_total is None:
+        include_total = not cursor_mode
+    
+    tag_ids = []
+    if tag_filter:
+        found = await db.run_sync(tag_resolver.lookup, tags)
+        tag_ids = list(found.values())
+        # 없는 태그가 하나라도 있으면 all 조건을 만족하는 게시글은 없음
+        if tag_match == "all" and len(found) < len(set(tags)):
+            tag_ids = []
+    
+    # Total count (메모리 캐시, 최초 1회만 COUNT / 태그 필터는 요청 시에만 COUNT)
+    total = None
+    if include_total:
+        if not tag_filter:
+            total = await db.run_sync(board_counter.get, board_type)
+        elif tag_ids:
+            total = (await db.execute(
+                select(func.count()).select_from(Post)
+                .where(Post.board_type == board_type, _tag_filter(tag_ids, tag_match))
+            )).scalar()
+        else:
+            total = 0
     
-    posts_data = []
-    for post in posts:
-        # User is loaded via relationship or we can join. 
-        # Accessing post.user triggers lazy load if not joined.
-        # For list, better to use joinedload, but for now lazy is fine for small limit.
+    if tag_filter:
+        posts, next_cursor = ([], None) if not tag_ids else \
+            await _get_tagged_posts(db, board_type, tag_ids, tag_match, cursor, limit)
+    else:
+        # 작성자는 JOIN, 태그는 IN 쿼리 한 번으로 함께 로딩
+        # (board_type, created_at, id) 복합 인덱스를 그대로 타도록 정렬
+        query = select(Post)\
+            .options(joinedload(Post.user), selectinload(Post.tags))\
+            .where(Post.board_type == board_type)
         
-        comment_count = db.query(func.count(Comment.id)).filter(Comment.post_id == post.id).scalar()
+        if cursor_mode and cursor:
+            query = _keyset_before(query, cursor)
         
-        liked = False
-        if user_id:
-            like_exists = db.query(PostLike).filter(
-                PostLike.post_id == post.id, 
-                PostLike.user_id == user_id
-            ).first()
-            if like_exists:
-                liked = True
+        query = query.order_by(Post.created_at.desc(), Post.id.desc())
+        if not cursor_mode:
+            query = query.offset((page - 1) * limit)
         
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        rows = (await db.execute(query.limit(limit + 1))).scalars().all()
+        posts = rows[:limit]
+        next_cursor = _encode_cursor(posts[-1]) if len(rows) > limit else None
+    
+    post_ids = [post.id for post in posts]
+    
+    # 좋아요 여부: 현재 페이지 게시글 중 사용자가 누른 것만 한 번에 조회
+    liked_post_ids = set()
+    if user_id and post_ids:
+        liked_post_ids = set((await db.execute(
+            select(PostLike.post_id).where(
+                PostLike.user_id == user_id,
+                PostLike.post_id.in_(post_ids)
+            )
+        )).scalars())
+    
+    posts_data = []
+    for post in posts:
         posts_data.append({
             "post_id": post.id,
             "user_id": post.user_id,
@@ -117,52 +282,25 @@ def get_posts_controller(page: int, limit: int, user_id: int | None, board_type:
             "summary": post.summary,
             "sentiment_label": post.sentiment_label,
             "like_count": post.like_count,
-            "view_count": post.view_count,
-            "comment_count": comment_count,
-            "liked": liked
+            "view_count": post.view_count + view_buffer.pending(post.id),
+            "comment_count": post.comment_count,
+            "liked": post.id in liked_post_ids
         })
     
-    return {
+    result = {
         "posts": posts_data,
-        "total": total,
-        "page": page,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor
     }
+    if not cursor_mode:
+        result["page"] = page
+    if include_total:
+        result["total"] = total
+    return result
 
 
-async def get_post_controller(post_id: int, user_id: int | None, db: Session):
-    """게시글 상세 조회 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found")
-    
-    # 이미지가 있는데 image_class가 없으면 분류 수행
-    if post.image_url and not post.image_class:
-        try:
-            # 로컬 파일에서 이미지 읽기
-            if "localhost:8000/uploads/" in post.image_url:
-                filename = post.image_url.split("/uploads/")[-1]
-                file_path = os.path.join(UPLOAD_DIR, filename)
-                if os.path.exists(file_path):
-                    with open(file_path, "rb") as f:
-                        file_data = f.read()
-                    prediction = await predict_image(file_data, filename)
-                    if prediction:
-                        post.image_class = prediction.get("class_name")
-                        db.commit()
-                        print(f"✅ 기존 이미지 분류 완료: {post.image_class}")
-        except Exception as e:
-            print(f"⚠️ 기존 이미지 분류 실패: {e}")
-    
-    liked = False
-    if user_id:
-        like_exists = db.query(PostLike).filter(
-            PostLike.post_id == post_id, 
-            PostLike.user_id == user_id
-        ).first()
-        if like_exists:
-            liked = True
-    
+def _build_post_detail(post: Post) -> dict:
+    """상세 응답 본문 (사용자별 필드 제외, 캐시 대상)"""
     comments_data = []
     for comment in post.comments:
         comments_data.append({
@@ -184,22 +322,69 @@ async def get_post_controller(post_id: int, user_id: int | None, db: Session):
         "tags": [t.name for t in post.tags],
         "summary": post.summary,
         "sentiment_label": post.sentiment_label,
+        "enrichment_status": post.enrichment_status,
         "like_count": post.like_count,
         "view_count": post.view_count,
-        "liked": liked,
+        "comment_count": post.comment_count,
         "comments": comments_data,
         "created_at": post.created_at.isoformat() if post.created_at else None
     }
 
 
-def update_post_controller(post_id: int, req: PostUpdateReq, user_id: int, db: Session):
+async def get_post_controller(post_id: int, user_id: int | None, db: AsyncSession):
+    """게시글 상세 조회 컨트롤러 (읽기 전용, 본문은 post_cache에서 read-through)
+
+    image_class가 비어 있는 이미지 게시글은 image_backfill 워커가 백그라운드에서 분류합니다.
+    """
+    body = post_cache.get(post_id)
+    if body is None:
+        load_started = time.monotonic()
+        post = (await db.execute(
+            select(Post)
+            .options(
+                joinedload(Post.user),
+                selectinload(Post.tags),
+                selectinload(Post.comments).joinedload(Comment.user)
+            )
+            .where(Post.id == post_id)
+        )).scalar_one_or_none()
+        if not post:
+            raise not_found("post_not_found")
+        
+        body = _build_post_detail(post)
+        # 읽는 동안 수정/삭제로 무효화됐으면 읽은 본문이 이미 낡았을 수 있으므로 캐시하지 않음
+        # (복제본 읽기는 복제 지연만큼 더 오래 전의 무효화까지 확인)
+        stale_window = time.monotonic() - load_started
+        if is_replica(db):
+            stale_window += read_router.sticky_seconds
+        if not post_cache.invalidated_within(post_id, stale_window):
+            # 아래에서 요청마다 다른 필드(조회수 보정, liked)를 채우므로 복사본을 캐시
+            post_cache.set(post_id, dict(body))
+    
+    liked = False
+    if user_id:
+        like_exists = (await db.execute(
+            select(PostLike.id).where(
+                PostLike.post_id == post_id,
+                PostLike.user_id == user_id
+            )
+        )).first()
+        if like_exists:
+            liked = True
+    
+    body["view_count"] += view_buffer.pending(post_id)
+    body["liked"] = liked
+    return body
+
+
+async def update_post_controller(post_id: int, req: PostUpdateReq, user_id: int, db: AsyncSession):
     """게시글 수정 컨트롤러"""
     if not req or all(
         field is None for field in (req.title, req.content, req.image_url)
     ):
         raise bad_request("invalid_request")
 
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise not_found("post_not_found")
     
@@ -210,76 +395,136 @@ def update_post_controller(post_id: int, req: PostUpdateReq, user_id: int, db: S
         validate_title(req.title)
         post.title = req.title
     
+    requeue = False
     if req.content is not None:
         post.content = req.content
+        new_hash = content_hash(req.content)
+        if post_enrichment.ENRICHMENT_MODE == "async" and new_hash != post.enrichment_hash:
+            # 본문이 바뀌면 새 해시로 부가 정보를 다시 채움 (이전 작업은 해시 불일치로 무시됨)
+            post.enrichment_hash = new_hash
+            post.enrichment_status = STATUS_PENDING
+            requeue = True
     
     if req.image_url is not None:
         post.image_url = str(req.image_url)
+        # 이미지가 바뀌면 기존 분류 결과는 무효 (비어 있으면 백필 워커가 다시 분류)
+        post.image_class = req.image_class
     
-    db.commit()
+    await db.commit()
+    post_cache.invalidate(post_id)
+    if requeue:
+        enrichment_pool.enqueue(post_id, post.enrichment_hash)
     return {"post_id": post_id}
 
 
-def delete_post_controller(post_id: int, user_id: int, db: Session):
+async def get_post_enrichment_controller(post_id: int, db: AsyncSession):
+    """게시글 AI 부가 정보 상태 조회 컨트롤러 (프론트엔드 폴링용)"""
+    post = (await db.execute(
+        select(Post).options(selectinload(Post.tags)).where(Post.id == post_id)
+    )).scalar_one_or_none()
+    if not post:
+        raise not_found("post_not_found")
+
+    return {
+        "post_id": post.id,
+        "status": post.enrichment_status,
+        "summary": post.summary,
+        "sentiment_label": post.sentiment_label,
+        "sentiment_score": post.sentiment_score,
+        "tags": [t.name for t in post.tags]
+    }
+
+
+async def delete_post_controller(post_id: int, user_id: int, db: AsyncSession):
     """게시글 삭제 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise not_found("post_not_found")
     
     if post.user_id != user_id:
         raise forbidden()
     
-    db.delete(post)
-    db.commit()
+    await db.delete(post)
+    board_counter.track(db.sync_session, post.board_type, -1)
+    await db.commit()
+    view_buffer.forget(post_id)
+    post_cache.invalidate(post_id)
+    tag_postings.discard([post_id])
     return {"post_id": post_id}
 
 
-def toggle_like_controller(post_id: int, user_id: int, db: Session):
-    """좋아요 토글 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise not_found("post_not_found")
-    
-    existing_like = db.query(PostLike).filter(
-        PostLike.post_id == post_id,
-        PostLike.user_id == user_id
-    ).first()
-    
-    liked = False
-    if existing_like:
-        db.delete(existing_like)
-        liked = False
-    else:
-        new_like = PostLike(post_id=post_id, user_id=user_id)
-        db.add(new_like)
-        liked = True
-    
-    db.commit()
-    
-    # Update like count
-    count = db.query(func.count(PostLike.id)).filter(PostLike.post_id == post_id).scalar()
-    post.like_count = count
-    db.commit()
+def _is_lock_conflict(error: OperationalError) -> bool:
+    """교착 상태 / 잠금 대기 초과 / 직렬화 실패 (트랜잭션을 다시 실행하면 성공할 수 있는 오류)"""
+    orig = getattr(error, "orig", None)
+    code = orig.args[0] if orig is not None and getattr(orig, "args", None) else None
+    return code in _LOCK_CONFLICT_CODES or getattr(orig, "sqlstate", None) in _LOCK_CONFLICT_SQLSTATES
+
+
+async def toggle_like_controller(post_id: int, user_id: int, db: AsyncSession):
+    """좋아요 토글 컨트롤러
+
+    post_likes의 unique_like (post_id, user_id) 제약에 기대어 재집계 없이 한 트랜잭션에서 토글합니다.
+    - 게시글 행을 먼저 잠금 (SELECT ... FOR UPDATE, 존재 여부 + 현재 like_count)
+      -> 같은 게시글의 토글은 여기서 줄을 서므로, 없는 좋아요 행 DELETE의 gap lock끼리 INSERT를 막는 교착이 없음
+    - 좋아요 행 DELETE 성공 → 취소, 지울 행이 없으면 INSERT → 추가
+    - like_count는 같은 트랜잭션에서 상대 증감, 응답 값은 잠근 값에서 계산 (다시 읽지 않음)
+    - unique 제약 위반이나 교착 / 직렬화 실패(OperationalError)면 롤백 후 한 번 더 토글
+    """
+    for attempt in range(2):
+        try:
+            current = (await db.execute(
+                select(Post.like_count).where(Post.id == post_id).with_for_update()
+            )).first()
+            if current is None:
+                await db.rollback()
+                raise not_found("post_not_found")
+            
+            deleted = (await db.execute(
+                delete(PostLike).where(
+                    PostLike.post_id == post_id,
+                    PostLike.user_id == user_id
+                ).execution_options(synchronize_session=False)
+            )).rowcount
+            liked = deleted == 0
+            delta = 1 if liked else -1
+            
+            await db.execute(
+                update(Post).where(Post.id == post_id)
+                .values(like_count=Post.like_count + delta)
+                .execution_options(synchronize_session=False)
+            )
+            if liked:
+                await db.execute(insert(PostLike).values(post_id=post_id, user_id=user_id))
+            
+            await db.commit()
+            like_count = (current[0] or 0) + delta
+            post_cache.invalidate(post_id)
+            break
+        except IntegrityError:
+            await db.rollback()
+            if attempt:
+                raise
+        except OperationalError as e:
+            await db.rollback()
+            if attempt or not _is_lock_conflict(e):
+                raise
     
     return {
         "post_id": post_id,
-        "like_count": count,
+        "like_count": like_count,
         "liked": liked
     }
 
 
-def increment_view_controller(post_id: int, db: Session):
-    """조회수 증가 컨트롤러"""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
+async def increment_view_controller(post_id: int, db: AsyncSession):
+    """조회수 증가 컨트롤러 (메모리 버퍼에 누적 후 주기적으로 일괄 반영)"""
+    view_count = await db.run_sync(view_buffer.increment, post_id)
+    if view_count is None:
         raise not_found("post_not_found")
     
-    post.view_count += 1
-    db.commit()
-    
     return {
         "post_id": post_id,
-        "view_count": post.view_count
+        "view_count": view_count
     }
 
 
@@ -1,9 +1,14 @@
 import os
 import uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, union, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.validators import validate_nickname
 from app.core.exceptions import bad_request, conflict, unauthorized
 from app.models.user import User
+from app.models.post import Post
+from app.models.comment import Comment
+from app.services.board_counter import board_counter
+from app.services.post_cache import post_cache
 from app.schemas import NicknamePatchReq, PasswordUpdateReq
 
 UPLOAD_DIR = os.path.abspath("./uploads")
@@ -34,49 +39,82 @@ def upload_profile_image_controller(file_content_type: str, file_data: bytes, fi
     return {"profile_image_url": url}
 
 
-def update_profile_controller(req: NicknamePatchReq, user_id: int, db: Session):
+async def _authored_or_commented_post_ids(user_id: int, db: AsyncSession) -> list[int]:
+    """사용자의 닉네임이 상세 응답에 포함되는 게시글 ID 목록 (캐시 무효화용)"""
+    query = union(
+        select(Post.id).where(Post.user_id == user_id),
+        select(Comment.post_id).where(Comment.user_id == user_id),
+    )
+    return [row[0] for row in (await db.execute(query)).all()]
+
+
+async def update_profile_controller(req: NicknamePatchReq, user_id: int, db: AsyncSession):
     """프로필(닉네임) 수정 컨트롤러"""
     
     # validation_failed 형식으로 검증
     validate_nickname(req.nickname, raise_validation_failed=True)
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise unauthorized()
     
     # 중복 검사 (본인 닉네임은 허용)
-    existing = db.query(User).filter(User.nickname == req.nickname).first()
+    existing = (await db.execute(select(User.id).where(User.nickname == req.nickname))).first()
     if existing and existing.id != user_id:
         raise conflict("duplicate_nickname")
     
     user.nickname = req.nickname
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    post_cache.invalidate_many(await _authored_or_commented_post_ids(user_id, db))
     
     return {"nickname": user.nickname}
 
 
-def delete_user_controller(user_id: int, db: Session):
+async def delete_user_controller(user_id: int, db: AsyncSession):
     """회원 탈퇴 컨트롤러"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise unauthorized()
     
+    # 함께 삭제되는 게시글 수를 게시판별 카운터에 반영
+    board_rows = (await db.execute(
+        select(Post.board_type, func.count(Post.id))
+        .where(Post.user_id == user_id)
+        .group_by(Post.board_type)
+    )).all()
+    for board_type, count in board_rows:
+        board_counter.track(db.sync_session, board_type, -count)
+    
+    # 다른 게시글에 남긴 댓글도 함께 삭제되므로 해당 게시글들의 댓글 수 차감
+    user_comment_count = select(func.count(Comment.id))\
+        .where(Comment.post_id == Post.id, Comment.user_id == user_id)\
+        .scalar_subquery()
+    await db.execute(
+        update(Post)
+        .where(Post.id.in_(select(Comment.post_id).where(Comment.user_id == user_id)))
+        .values(comment_count=Post.comment_count - user_comment_count)
+        .execution_options(synchronize_session=False)
+    )
+    
+    affected_post_ids = await _authored_or_commented_post_ids(user_id, db)
+    
     # Cascade delete handles related data
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
+    post_cache.invalidate_many(affected_post_ids)
     
     return None
 
 
-def update_password_controller(req: PasswordUpdateReq, user_id: int, db: Session):
+async def update_password_controller(req: PasswordUpdateReq, user_id: int, db: AsyncSession):
     """비밀번호 변경 컨트롤러"""
     from app.core.validators import validate_password_pair
     
     # password_validation_failed 형식으로 검증
     validate_password_pair(req.password, req.password_check, raise_validation_failed=True)
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise unauthorized()
     
@@ -84,5 +122,5 @@ def update_password_controller(req: PasswordUpdateReq, user_id: int, db: Session
         raise bad_request("invalid_credentials")
     
     user.password = req.password
-    db.commit()
+    await db.commit()
     return None
@@ -0,0 +1,155 @@
+"""
+DB 커넥션 풀 설정 + 계측.
+
+기본 풀(5 + overflow 10)은 워커당 동시 쿼리를 조용히 제한하고, 연결을 기다리는 요청이 얼마나 밀리는지 보이지 않습니다.
+- 풀 크기 / overflow / 대기 타임아웃 / recycle / pre-ping / LIFO 를 환경 변수로 설정
+- 엔진마다 PoolMonitor를 붙여 연결 대기 시간(checkout latency), 사용 중 / overflow 연결 수,
+  대기 타임아웃 횟수를 기록 -> 진단 API(/api/diagnostics/db-pool)에서 조회해 워커 수에 맞게 풀 크기 조정
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Type
+
+from sqlalchemy import exc, event
+from sqlalchemy.pool import QueuePool
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# 최근에 쓴 연결부터 재사용 -> 남는 연결은 서버 wait_timeout으로 자연스럽게 정리됨
+DB_POOL_USE_LIFO = os.getenv("DB_POOL_USE_LIFO", "false").lower() == "true"
+DB_POOL_LATENCY_WINDOW = int(os.getenv("DB_POOL_LATENCY_WINDOW", "1024"))
+
+
+def pool_options() -> Dict[str, Any]:
+    """create_engine / create_async_engine에 넘길 풀 설정"""
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_use_lifo": DB_POOL_USE_LIFO,
+    }
+
+
+def _percentile(ordered: list, pct: float) -> Optional[float]:
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class PoolMonitor:
+    """엔진 하나의 커넥션 풀 지표 (스레드 안전)"""
+
+    def __init__(self, name: str, window: int = DB_POOL_LATENCY_WINDOW):
+        self.name = name
+        self.pool: Optional[QueuePool] = None
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidated = 0
+        self.peak_in_use = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._waits: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def pool_class(self, base: Type[QueuePool] = QueuePool) -> Type[QueuePool]:
+        """
+        연결 대기 시간을 재는 base 하위 클래스 (poolclass로 전달)
+
+        engine.dispose()가 같은 클래스로 풀을 다시 만들어도 계측이 유지되도록 인스턴스가 아닌 클래스에 모니터를 묶음
+        """
+        monitor = self
+
+        class InstrumentedPool(base):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                monitor.pool = self
+
+            def _do_get(self):
+                started = time.perf_counter()
+                try:
+                    connection = super()._do_get()
+                except exc.TimeoutError:
+                    monitor.record_timeout(time.perf_counter() - started)
+                    raise
+                monitor.record_checkout(time.perf_counter() - started)
+                return connection
+
+        InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+        return InstrumentedPool
+
+    def attach(self, engine) -> None:
+        """새 연결 / 무효화 횟수를 세는 풀 이벤트 등록 (AsyncEngine이면 내부 sync_engine)"""
+        target = getattr(engine, "sync_engine", engine)
+
+        @event.listens_for(target, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(target, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidated += 1
+
+    def record_checkout(self, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            self._waits.append(waited)
+            if self.pool is not None:
+                self.peak_in_use = max(self.peak_in_use, self.pool.checkedout())
+
+    def record_timeout(self, waited: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_max = max(self.wait_max, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """진단용 지표 (대기 시간은 ms, 최근 표본 기준 백분위수)"""
+        with self._lock:
+            ordered = sorted(self._waits)
+            pool = self.pool
+            gauges = {
+                "size": pool.size() if pool is not None else None,
+                "max_overflow": pool._max_overflow if pool is not None else None,
+                "timeout": pool.timeout() if pool is not None else None,
+                "in_use": pool.checkedout() if pool is not None else 0,
+                "idle": pool.checkedin() if pool is not None else 0,
+                "overflow": max(0, pool.overflow()) if pool is not None else 0,
+            }
+            return {
+                **gauges,
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidated": self.invalidated,
+                "wait_ms": {
+                    "p50": _ms(_percentile(ordered, 50)),
+                    "p99": _ms(_percentile(ordered, 99)),
+                    "max": _ms(self.wait_max),
+                    "avg": _ms(self.wait_total / self.checkouts) if self.checkouts else None,
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = self.timeouts = self.connects = self.invalidated = self.peak_in_use = 0
+            self.wait_total = self.wait_max = 0.0
+            self._waits.clear()
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 3) if seconds is not None else None
@@ -0,0 +1,92 @@
+"""
+읽기 전용 요청의 primary / 레플리카 라우팅.
+
+게시글 목록 / 상세 / 댓글 조회와 로그인 같은 읽기 요청은 레플리카로 보내 primary 부하를 줄입니다.
+- 레플리카가 여러 대면 라운드 로빈
+- read-your-writes: 사용자의 쓰기 요청이 행을 커밋하면 DB_READ_YOUR_WRITES_SECONDS 동안 그 사용자(X-User-Id)의 읽기는 primary
+  (복제 지연 때문에 방금 쓴 글 / 댓글 / 좋아요가 안 보이는 것을 막음)
+- 고정 기록은 프로세스 내 메모리이므로 워커가 여럿이면 같은 워커로 다시 온 요청에만 적용됨
+  -> 로드 밸런서의 sticky session과 함께 쓰거나 창을 복제 지연보다 넉넉하게 설정
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DB_READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
+# 고정 기록이 이 수를 넘으면 만료된 항목 정리
+_PRUNE_THRESHOLD = 10000
+
+
+class ReadRouter:
+    """읽기 요청을 보낼 레플리카 선택 (None = primary), 스레드 안전"""
+
+    def __init__(self, replicas: int, sticky_seconds: float = DB_READ_YOUR_WRITES_SECONDS):
+        self.replicas = replicas
+        self.sticky_seconds = sticky_seconds
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.sticky_reads = 0
+        self._next = 0
+        self._sticky_until: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def mark_write(self, user_id: Optional[int]) -> None:
+        """사용자의 쓰기 -> 이후 sticky_seconds 동안 그 사용자의 읽기는 primary"""
+        if not user_id or not self.replicas:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._sticky_until[user_id] = now + self.sticky_seconds
+            if len(self._sticky_until) > _PRUNE_THRESHOLD:
+                self._sticky_until = {uid: until for uid, until in self._sticky_until.items() if until > now}
+
+    def is_sticky(self, user_id: Optional[int]) -> bool:
+        if not user_id:
+            return False
+        with self._lock:
+            until = self._sticky_until.get(user_id)
+            if until is None:
+                return False
+            if until <= time.monotonic():
+                del self._sticky_until[user_id]
+                return False
+            return True
+
+    def pick(self, user_id: Optional[int] = None) -> Optional[int]:
+        """읽기 요청에 쓸 레플리카 번호 (레플리카가 없거나 최근에 쓴 사용자면 None = primary)"""
+        if not self.replicas:
+            with self._lock:
+                self.primary_reads += 1
+            return None
+        if self.is_sticky(user_id):
+            with self._lock:
+                self.primary_reads += 1
+                self.sticky_reads += 1
+            return None
+        with self._lock:
+            index = self._next % self.replicas
+            self._next += 1
+            self.replica_reads += 1
+            return index
+
+    def stats(self) -> Dict[str, Any]:
+        """진단용 카운터"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "replicas": self.replicas,
+                "sticky_seconds": self.sticky_seconds,
+                "sticky_users": sum(1 for until in self._sticky_until.values() if until > now),
+                "replica_reads": self.replica_reads,
+                "primary_reads": self.primary_reads,
+                "sticky_reads": self.sticky_reads,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sticky_until.clear()
+            self._next = 0
+            self.replica_reads = self.primary_reads = self.sticky_reads = 0
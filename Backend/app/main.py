@@ -3,16 +3,61 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from app.routers import auth_routes, user_routes, post_routes, comment_routes
+from contextlib import asynccontextmanager, suppress
+from app.routers import auth_routes, user_routes, post_routes, comment_routes, diagnostics_routes
+from app.core import database
 from app.core.exceptions import APIError
 from app.core.formatter import create_json_response
+from app.services.board_counter import run_reconcile_loop
+from app.services.view_counter import run_flush_loop, view_buffer
+from app.services.image_backfill import run_backfill_loop
+from app.services import model_client, post_enrichment
+from app.services.model_discovery import run_probe_loop
+from app.services.enrichment_worker import enrichment_pool
+import asyncio
 import os
 
 # uploads 폴더 생성
 UPLOAD_DIR = os.path.abspath("./uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-app = FastAPI(title="Community API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Model API 공유 클라이언트 (커넥션 풀 / keep-alive)
+    shared_client = await model_client.start_client()
+
+    # 백그라운드 작업 시작 (세션 팩토리는 테스트에서 교체할 수 있도록 모듈 속성으로 참조)
+    tasks = [
+        asyncio.create_task(run_probe_loop(shared_client)),
+        asyncio.create_task(run_reconcile_loop(database.SessionLocal)),
+        asyncio.create_task(run_flush_loop(database.SessionLocal)),
+        asyncio.create_task(run_backfill_loop(database.SessionLocal)),
+    ]
+    if post_enrichment.ENRICHMENT_MODE == "async":
+        await enrichment_pool.start(database.SessionLocal)
+    
+    yield
+    
+    await enrichment_pool.stop()
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+    await model_client.close_client()
+    
+    # 종료 전 남은 조회수 반영
+    try:
+        await asyncio.to_thread(view_buffer.flush_with, database.SessionLocal)
+    except Exception as e:
+        print(f"⚠️ 종료 시 조회수 반영 실패: {e}")
+    await database.async_engine.dispose()
+    for replica_engine in database.replica_engines:
+        await replica_engine.dispose()
+
+
+app = FastAPI(title="Community API", lifespan=lifespan)
 
 # 업로드 폴더를 static으로 서빙
 app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
@@ -48,6 +93,7 @@ app.include_router(auth_routes.router, prefix="/api")
 app.include_router(user_routes.router, prefix="/api")
 app.include_router(post_routes.router, prefix="/api")
 app.include_router(comment_routes.router, prefix="/api")
+app.include_router(diagnostics_routes.router, prefix="/api")
 
 # 전역 예외 처리
 @app.exception_handler(APIError)
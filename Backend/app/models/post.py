@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, BigInteger, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, BigInteger, Table, Index, UniqueConstraint
+from sqlalchemy.orm import relationship, backref
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -9,6 +9,8 @@ post_tags = Table(
     Base.metadata,
     Column("post_id", BigInteger, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True),
     Column("tag_id", BigInteger, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    # 태그별 게시글 조회 (GET /api/posts?tag=...)
+    Index("idx_post_tags_tag_post", "tag_id", "post_id"),
 )
 
 class Post(Base):
@@ -26,15 +28,25 @@ class Post(Base):
     sentiment_label = Column(String(50), nullable=True)
     like_count = Column(Integer, default=0)
     view_count = Column(Integer, default=0)
+    comment_count = Column(Integer, default=0, nullable=False)  # 댓글 컨트롤러가 증감 관리
+    # AI 부가 정보(요약/감성/태그) 상태: pending / done / failed, 기준이 된 본문 해시
+    enrichment_status = Column(String(20), default="done", nullable=False)
+    enrichment_hash = Column(String(64), nullable=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationships
-    user = relationship("User", backref="posts")
+    # 회원 탈퇴 시 게시글은 DB의 ON DELETE CASCADE로 삭제 (ORM이 user_id를 NULL로 만들지 않도록)
+    user = relationship("User", backref=backref("posts", passive_deletes=True))
     comments = relationship("Comment", backref="post", cascade="all, delete-orphan")
     likes = relationship("PostLike", backref="post", cascade="all, delete-orphan")
     tags = relationship("Tag", secondary=post_tags, backref="posts")
 
+    __table_args__ = (
+        # 게시판별 최신순 목록 / 키셋 페이지네이션용
+        Index("idx_posts_board_created", "board_type", "created_at", "id"),
+    )
+
 class PostLike(Base):
     __tablename__ = "post_likes"
 
@@ -43,6 +55,11 @@ class PostLike(Base):
     user_id = Column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime, default=func.now())
 
+    __table_args__ = (
+        # 좋아요 토글의 원자성 보장 (schema.sql의 unique_like와 동일)
+        UniqueConstraint("post_id", "user_id", name="unique_like"),
+    )
+
 class Tag(Base):
     __tablename__ = "tags"
 
@@ -1,21 +1,29 @@
 from fastapi import APIRouter, status, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import LoginReq, SignupReq
 from app.controllers import auth_controller
-from app.core.database import get_db
+from app.core import database
+from app.core.database import get_db, get_read_db, is_replica
+from app.core.exceptions import APIError
 
 router = APIRouter(tags=["auth"])
 
 
 @router.post("/auth/login")
-async def login(req: LoginReq, db: Session = Depends(get_db)):
-    """로그인 API"""
-    data = auth_controller.login_controller(req, db)
+async def login(req: LoginReq, db: AsyncSession = Depends(get_read_db)):
+    """로그인 API (레플리카에서 조회, 가입 직후라 레플리카에 아직 없으면 primary에서 한 번 더 확인)"""
+    try:
+        data = await auth_controller.login_controller(req, db)
+    except APIError as e:
+        if e.message != "invalid_credentials" or not is_replica(db):
+            raise
+        async with database.AsyncSessionLocal() as primary:
+            data = await auth_controller.login_controller(req, primary)
     return {"message": "login_success", "data": data}
 
 
 @router.post("/auth/signup", status_code=status.HTTP_201_CREATED)
-async def signup(req: SignupReq, db: Session = Depends(get_db)):
+async def signup(req: SignupReq, db: AsyncSession = Depends(get_db)):
     """회원가입 API"""
-    data = auth_controller.signup_controller(req, db)
+    data = await auth_controller.signup_controller(req, db)
     return {"message": "register_success", "data": data}
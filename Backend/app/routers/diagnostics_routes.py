@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+from app.controllers import diagnostics_controller
+
+router = APIRouter(tags=["diagnostics"])
+
+
+@router.get("/diagnostics/model-api")
+async def get_model_api_diagnostics():
+    """Model API 연동 진단 API (서킷 브레이커 상태 / 적응형 타임아웃 / 레플리카 통계)"""
+    data = diagnostics_controller.get_model_api_diagnostics_controller()
+    return {"message": "get_model_api_diagnostics_success", "data": data}
+
+
+@router.get("/diagnostics/db-pool")
+async def get_db_pool_diagnostics():
+    """DB 커넥션 풀 진단 API (풀 크기 / 사용 중 / overflow 연결 수, 연결 대기 시간, 대기 타임아웃 횟수)"""
+    data = diagnostics_controller.get_db_pool_diagnostics_controller()
+    return {"message": "get_db_pool_diagnostics_success", "data": data}
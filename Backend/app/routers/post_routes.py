@@ -1,10 +1,10 @@
 from fastapi import APIRouter, UploadFile, File, Depends, Path, Query, Header, status
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.security import get_current_user_id
 from app.controllers import post_controller
 from app.schemas import PostCreateReq, PostUpdateReq
-from app.core.database import get_db
+from app.core.database import get_db, get_primary_db, get_read_db
 
 router = APIRouter(tags=["posts"])
 
@@ -14,11 +14,19 @@ async def get_posts(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
     board_type: str = Query("couple"),
+    cursor: Optional[str] = Query(None),
+    include_total: Optional[bool] = Query(None),
+    tag: Optional[List[str]] = Query(None),
+    tag_match: str = Query("all", pattern="^(all|any)$"),
     x_user_id: Optional[int] = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """게시글 목록 조회 API (로그인 선택)"""
-    data = post_controller.get_posts_controller(page, limit, x_user_id, board_type, db)
+    """게시글 목록 조회 API (로그인 선택, cursor 지정 시 키셋 페이지네이션, tag 지정 시 태그 필터)"""
+    data = await post_controller.get_posts_controller(
+        page, limit, x_user_id, board_type, db,
+        cursor=cursor, include_total=include_total,
+        tags=tag, tag_match=tag_match
+    )
     return {"message": "get_posts_success", "data": data}
 
 
@@ -26,18 +34,25 @@ async def get_posts(
 async def get_post(
     post_id: int,
     x_user_id: Optional[int] = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """게시글 상세 조회 API (로그인 선택)"""
     data = await post_controller.get_post_controller(post_id, x_user_id, db)
     return {"message": "get_post_success", "data": data}
 
 
+@router.get("/posts/{post_id}/enrichment")
+async def get_post_enrichment(post_id: int, db: AsyncSession = Depends(get_read_db)):
+    """게시글 AI 부가 정보 상태 조회 API (status: pending / done / failed)"""
+    data = await post_controller.get_post_enrichment_controller(post_id, db)
+    return {"message": "get_post_enrichment_success", "data": data}
+
+
 @router.post("/posts", status_code=status.HTTP_201_CREATED)
 async def create_post(
     req: PostCreateReq,
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """게시글 작성 API"""
     data = await post_controller.create_post_controller(req, user_id, db)
@@ -49,10 +64,10 @@ async def update_post(
     post_id: int = Path(...),
     req: PostUpdateReq = None,
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """게시글 수정 API"""
-    data = post_controller.update_post_controller(post_id, req, user_id, db)
+    data = await post_controller.update_post_controller(post_id, req, user_id, db)
     return {"message": "update_post_success", "data": data}
 
 
@@ -60,10 +75,10 @@ async def update_post(
 async def delete_post(
     post_id: int,
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """게시글 삭제 API"""
-    data = post_controller.delete_post_controller(post_id, user_id, db)
+    data = await post_controller.delete_post_controller(post_id, user_id, db)
     return {"message": "delete_post_success", "data": data}
 
 
@@ -71,17 +86,17 @@ async def delete_post(
 async def toggle_like(
     post_id: int,
     user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """좋아요 토글 API"""
-    data = post_controller.toggle_like_controller(post_id, user_id, db)
+    data = await post_controller.toggle_like_controller(post_id, user_id, db)
     return {"message": "like_toggled", "data": data}
 
 
 @router.patch("/posts/{post_id}/view")
-async def inc_view(post_id: int, db: Session = Depends(get_db)):
-    """조회수 증가 API"""
-    data = post_controller.increment_view_controller(post_id, db)
+async def inc_view(post_id: int, db: AsyncSession = Depends(get_primary_db)):
+    """조회수 증가 API (메모리 버퍼에만 누적하므로 read-your-writes 고정 없음)"""
+    data = await post_controller.increment_view_controller(post_id, db)
     return {"message": "view_incremented", "data": data}
 
 
@@ -0,0 +1,109 @@
+"""
+게시판별 게시글 수 캐시.
+
+GET /api/posts 마다 COUNT(*)를 실행하지 않도록 board_type별 게시글 수를 메모리에 보관합니다.
+- 처음 조회되는 게시판만 COUNT 한 번으로 적재
+- 게시글 작성/삭제 시 세션에 증감분을 기록해 두었다가 커밋이 성공한 경우에만 반영
+- 다른 워커/외부 변경으로 생기는 오차는 주기적 재집계(reconcile)로 보정
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import Callable, Dict
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from app.models.post import Post
+
+RECONCILE_INTERVAL = float(os.getenv("BOARD_COUNT_RECONCILE_INTERVAL", "300"))
+
+_PENDING_KEY = "board_count_deltas"
+
+
+class BoardPostCounter:
+    """board_type -> 게시글 수 캐시"""
+
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, board_type: str) -> int:
+        """캐시된 게시글 수 반환 (없으면 DB에서 한 번 적재)"""
+        with self._lock:
+            if board_type in self._counts:
+                return self._counts[board_type]
+
+        count = db.query(func.count(Post.id)).filter(Post.board_type == board_type).scalar() or 0
+        with self._lock:
+            return self._counts.setdefault(board_type, count)
+
+    def track(self, db: Session, board_type: str, delta: int) -> None:
+        """현재 트랜잭션의 증감분 기록 (커밋 성공 시 반영, 롤백 시 폐기)"""
+        deltas = db.info.setdefault(_PENDING_KEY, {})
+        deltas[board_type] = deltas.get(board_type, 0) + delta
+
+    def apply(self, deltas: Dict[str, int]) -> None:
+        with self._lock:
+            for board_type, delta in deltas.items():
+                # 아직 적재되지 않은 게시판은 다음 get()에서 정확한 값을 읽어옴
+                if board_type in self._counts:
+                    self._counts[board_type] = max(0, self._counts[board_type] + delta)
+
+    def reconcile(self, db: Session) -> Dict[str, int]:
+        """DB 기준으로 전체 재집계 후 보정된 오차(board_type -> 차이) 반환"""
+        rows = db.query(Post.board_type, func.count(Post.id)).group_by(Post.board_type).all()
+        actual = {board_type: count for board_type, count in rows}
+
+        with self._lock:
+            drift = {
+                board_type: actual.get(board_type, 0) - cached
+                for board_type, cached in self._counts.items()
+                if actual.get(board_type, 0) != cached
+            }
+            self._counts = {
+                board_type: actual.get(board_type, 0)
+                for board_type in set(self._counts) | set(actual)
+            }
+        return drift
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+board_counter = BoardPostCounter()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_deltas(session: Session) -> None:
+    deltas = session.info.pop(_PENDING_KEY, None)
+    if deltas:
+        board_counter.apply(deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_deltas(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def run_reconcile_loop(session_factory: Callable[[], Session], interval: float = RECONCILE_INTERVAL):
+    """주기적으로 게시판별 게시글 수를 재집계하는 백그라운드 작업"""
+
+    def _reconcile_once() -> Dict[str, int]:
+        db = session_factory()
+        try:
+            return board_counter.reconcile(db)
+        finally:
+            db.close()
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            drift = await asyncio.to_thread(_reconcile_once)
+            if drift:
+                print(f"ℹ️ 게시판 게시글 수 보정: {drift}")
+        except Exception as e:
+            print(f"⚠️ 게시판 게시글 수 재집계 실패: {e}")
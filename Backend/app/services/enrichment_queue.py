@@ -0,0 +1,193 @@
+"""
+게시글 AI 부가 정보 작업 큐.
+
+작업은 (post_id, 본문 해시) 단위로 한 번만 대기열에 들어갑니다 (같은 작업을 다시 넣으면 무시).
+- InMemoryJobQueue: 프로세스 내 큐 (재시작 시 유실, 기동 시 pending 게시글을 다시 넣어 복구)
+- SqliteJobQueue : 로컬 SQLite 파일에 보관하는 내구성 큐 (ENRICHMENT_QUEUE=sqlite)
+  여러 워커 프로세스가 같은 파일을 공유해도 됨 (작업마다 임대 기한, 기한이 지난 실행 중 작업만 회수)
+
+모든 메서드는 동기 + 스레드 안전이며, 워커는 asyncio.to_thread로 호출합니다.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional, Protocol, Set, Tuple
+
+ENRICHMENT_QUEUE = os.getenv("ENRICHMENT_QUEUE", "memory")
+ENRICHMENT_QUEUE_PATH = os.getenv("ENRICHMENT_QUEUE_PATH", "./enrichment_queue.db")
+# 실행 중 작업의 임대 기한(초): 이 시간이 지나도록 끝나지 않은 작업은 죽은 프로세스의 것으로 보고 다시 대기
+# (작업 하나의 최대 처리 시간보다 길어야 함)
+ENRICHMENT_JOB_LEASE_SECONDS = float(os.getenv("ENRICHMENT_JOB_LEASE_SECONDS", "300"))
+
+
+@dataclass
+class EnrichmentJob:
+    post_id: int
+    content_hash: str
+    attempts: int = 0
+    id: Optional[int] = None
+    lease: Optional[str] = None
+
+
+class JobQueue(Protocol):
+    """부가 정보 작업 큐 인터페이스"""
+
+    def put(self, post_id: int, content_hash: str) -> bool:
+        """작업 추가 (같은 post_id + 해시 작업이 이미 대기/실행 중이면 False)"""
+        ...
+
+    def claim(self) -> Optional[EnrichmentJob]:
+        """지금 실행 가능한 작업 하나를 실행 중으로 표시하고 반환"""
+        ...
+
+    def complete(self, job: EnrichmentJob) -> None: ...
+
+    def retry(self, job: EnrichmentJob, delay: float) -> None:
+        """시도 횟수를 늘리고 delay초 뒤에 다시 실행 가능하도록 반환"""
+        ...
+
+    def size(self) -> int:
+        """대기 + 실행 중 작업 수"""
+        ...
+
+
+class InMemoryJobQueue:
+    """프로세스 내 작업 큐 (실행 가능 시각 기준 힙)"""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, EnrichmentJob]] = []
+        self._keys: Set[Tuple[int, str]] = set()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def put(self, post_id: int, content_hash: str) -> bool:
+        key = (post_id, content_hash)
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            heapq.heappush(self._heap, (time.monotonic(), next(self._seq), EnrichmentJob(post_id, content_hash)))
+            return True
+
+    def claim(self) -> Optional[EnrichmentJob]:
+        with self._lock:
+            if not self._heap or self._heap[0][0] > time.monotonic():
+                return None
+            return heapq.heappop(self._heap)[2]
+
+    def complete(self, job: EnrichmentJob) -> None:
+        with self._lock:
+            self._keys.discard((job.post_id, job.content_hash))
+
+    def retry(self, job: EnrichmentJob, delay: float) -> None:
+        job.attempts += 1
+        with self._lock:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), job))
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+
+class SqliteJobQueue:
+    """
+    SQLite 파일 기반 내구성 작업 큐
+
+    - UNIQUE(post_id, content_hash)로 중복 작업 방지
+    - claim 시 임대 토큰(lease)과 시각(claimed_at)을 기록, lease_seconds가 지난 실행 중(running) 작업만
+      다른 워커가 다시 가져감 (기동 시 일괄 회수하지 않으므로 살아 있는 프로세스의 작업을 중복 실행하지 않음)
+    - complete / retry는 임대를 가진 워커만 반영 (기한이 지나 회수된 작업은 새 워커가 처리)
+    """
+
+    def __init__(self, path: str = ENRICHMENT_QUEUE_PATH, lease_seconds: float = ENRICHMENT_JOB_LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS enrichment_jobs ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " post_id INTEGER NOT NULL,"
+                " content_hash TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " available_at REAL NOT NULL,"
+                " status TEXT NOT NULL DEFAULT 'queued',"
+                " claimed_at REAL,"
+                " lease TEXT,"
+                " UNIQUE (post_id, content_hash))"
+            )
+            # 임대 컬럼이 없던 큐 파일 (기존 running 작업은 claimed_at이 NULL -> 바로 회수 대상)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(enrichment_jobs)")}
+            for column, column_type in (("claimed_at", "REAL"), ("lease", "TEXT")):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE enrichment_jobs ADD COLUMN {column} {column_type}")
+
+    def put(self, post_id: int, content_hash: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO enrichment_jobs (post_id, content_hash, available_at) VALUES (?, ?, ?)",
+                (post_id, content_hash, time.time()),
+            )
+            return cursor.rowcount == 1
+
+    def claim(self) -> Optional[EnrichmentJob]:
+        now = time.time()
+        lease = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id, post_id, content_hash, attempts FROM enrichment_jobs"
+                    " WHERE (status = 'queued' AND available_at <= ?)"
+                    " OR (status = 'running' AND (claimed_at IS NULL OR claimed_at <= ?))"
+                    " ORDER BY available_at, id LIMIT 1",
+                    (now, now - self.lease_seconds),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE enrichment_jobs SET status = 'running', claimed_at = ?, lease = ? WHERE id = ?",
+                        (now, lease, row[0]),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return EnrichmentJob(post_id=row[1], content_hash=row[2], attempts=row[3], id=row[0], lease=lease)
+
+    def complete(self, job: EnrichmentJob) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM enrichment_jobs WHERE id = ? AND lease IS ?", (job.id, job.lease))
+
+    def retry(self, job: EnrichmentJob, delay: float) -> None:
+        job.attempts += 1
+        with self._lock:
+            self._conn.execute(
+                "UPDATE enrichment_jobs SET status = 'queued', attempts = ?, available_at = ?, claimed_at = NULL"
+                " WHERE id = ? AND lease IS ?",
+                (job.attempts, time.time() + delay, job.id, job.lease),
+            )
+
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM enrichment_jobs").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def build_job_queue() -> JobQueue:
+    if ENRICHMENT_QUEUE == "sqlite":
+        return SqliteJobQueue()
+    return InMemoryJobQueue()
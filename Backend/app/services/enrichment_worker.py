@@ -0,0 +1,227 @@
+"""
+게시글 AI 부가 정보 비동기 워커 풀 (POST_ENRICHMENT_MODE=async).
+
+게시글은 enrichment_status=pending 으로 먼저 커밋하고, 워커가 요약/감성/태그를 나중에 채웁니다.
+- 작업 멱등 키: (post_id, 본문 해시). 본문이 바뀌었거나 이미 채워진 작업은 실행하지 않고 종료
+- 요약/감성 중 하나라도 빠지면 지수 백오프(+지터)로 재시도, 마지막 시도에서는 받은 결과만 저장
+- 기동 시 pending 상태로 남은 게시글을 다시 큐에 넣어 (메모리 큐 재시작 등) 유실을 복구
+- 프론트엔드는 GET /api/posts/{id}/enrichment 의 status를 폴링
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+from contextlib import suppress
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.post import Post
+from app.services.enrichment_queue import EnrichmentJob, JobQueue, build_job_queue
+from app.services.post_cache import post_cache
+from app.services.post_enrichment import content_hash, enrich_post_content
+from app.services.tag_postings import tag_postings
+from app.services.tag_resolver import tag_resolver
+
+ENRICHMENT_WORKERS = int(os.getenv("ENRICHMENT_WORKERS", "4"))
+ENRICHMENT_MAX_ATTEMPTS = int(os.getenv("ENRICHMENT_MAX_ATTEMPTS", "5"))
+ENRICHMENT_RETRY_BASE_DELAY = float(os.getenv("ENRICHMENT_RETRY_BASE_DELAY", "2"))
+ENRICHMENT_RETRY_MAX_DELAY = float(os.getenv("ENRICHMENT_RETRY_MAX_DELAY", "300"))
+ENRICHMENT_POLL_INTERVAL = float(os.getenv("ENRICHMENT_POLL_INTERVAL", "1"))
+
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class EnrichmentWorkerPool:
+    """부가 정보 작업을 처리하는 asyncio 워커 풀"""
+
+    def __init__(self, queue: Optional[JobQueue] = None, concurrency: int = ENRICHMENT_WORKERS,
+                 max_attempts: int = ENRICHMENT_MAX_ATTEMPTS, base_delay: float = ENRICHMENT_RETRY_BASE_DELAY,
+                 max_delay: float = ENRICHMENT_RETRY_MAX_DELAY):
+        self._queue = queue
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def queue(self) -> JobQueue:
+        # 큐 파일은 실제로 쓰일 때 생성
+        if self._queue is None:
+            self._queue = build_job_queue()
+        return self._queue
+
+    def enqueue(self, post_id: int, content_hash: str) -> bool:
+        """작업 추가 후 대기 중인 워커를 깨움 (중복 작업이면 False)"""
+        added = self.queue.put(post_id, content_hash)
+        if added and self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        return added
+
+    def backoff(self, attempts: int) -> float:
+        """attempts번째 재시도 대기 시간 (지수 증가 + 최대 25% 지터)"""
+        delay = min(self.max_delay, self.base_delay * (2 ** max(0, attempts - 1)))
+        return delay * random.uniform(1.0, 1.25)
+
+    async def start(self, session_factory: Callable[[], Session]) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        recovered = await asyncio.to_thread(self.recover_pending, session_factory)
+        if recovered:
+            print(f"ℹ️ 대기 중이던 부가 정보 작업 복구: {recovered}건")
+        self._tasks = [
+            asyncio.create_task(self._run_worker(session_factory))
+            for _ in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        self._loop = None
+        self._wakeup = None
+
+    def reset(self) -> None:
+        """큐 초기화 (다음 사용 시 설정에 맞는 큐를 새로 생성)"""
+        if self._queue is not None and hasattr(self._queue, "close"):
+            self._queue.close()
+        self._queue = None
+
+    def recover_pending(self, session_factory: Callable[[], Session]) -> int:
+        """pending 상태 게시글의 작업을 다시 큐에 넣고 새로 넣은 건수 반환"""
+        db = session_factory()
+        try:
+            rows = db.query(Post.id, Post.enrichment_hash).filter(
+                Post.enrichment_status == STATUS_PENDING,
+                Post.enrichment_hash.isnot(None),
+            ).all()
+        finally:
+            db.close()
+        return sum(1 for post_id, job_hash in rows if self.queue.put(post_id, job_hash))
+
+    async def drain(self, session_factory: Callable[[], Session]) -> int:
+        """지금 실행 가능한 작업을 모두 처리하고 처리한 작업 수 반환 (테스트 / 종료 시 사용)"""
+        processed = 0
+        while True:
+            job = await asyncio.to_thread(self.queue.claim)
+            if job is None:
+                return processed
+            await self.process(job, session_factory)
+            processed += 1
+
+    async def _run_worker(self, session_factory: Callable[[], Session]) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self.queue.claim)
+            except Exception as e:
+                print(f"⚠️ 부가 정보 작업 조회 실패: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), ENRICHMENT_POLL_INTERVAL)
+                continue
+            await self.process(job, session_factory)
+
+    async def process(self, job: EnrichmentJob, session_factory: Callable[[], Session]) -> None:
+        try:
+            content = await asyncio.to_thread(_load_pending_content, session_factory, job)
+            if content is None:
+                # 삭제됐거나, 본문이 바뀌어 새 작업이 있거나, 이미 채워진 게시글
+                await asyncio.to_thread(self.queue.complete, job)
+                return
+
+            enrichment = await enrich_post_content(content)
+            complete = enrichment["summary"] is not None and enrichment["sentiment_label"] is not None
+            last_attempt = job.attempts + 1 >= self.max_attempts
+
+            if not complete and not last_attempt:
+                delay = self.backoff(job.attempts + 1)
+                print(f"⚠️ 부가 정보 일부 누락 (post_id={job.post_id}), {delay:.1f}초 후 재시도")
+                await asyncio.to_thread(self.queue.retry, job, delay)
+                return
+
+            has_result = bool(enrichment["tags"]) or enrichment["summary"] is not None \
+                or enrichment["sentiment_label"] is not None
+            status = STATUS_DONE if has_result else STATUS_FAILED
+            saved = await asyncio.to_thread(_save_enrichment, session_factory, job, enrichment, status)
+            await asyncio.to_thread(self.queue.complete, job)
+            if saved:
+                post_cache.invalidate(job.post_id)
+        except Exception as e:
+            print(f"⚠️ 부가 정보 작업 실패 (post_id={job.post_id}): {e}")
+            if job.attempts + 1 >= self.max_attempts:
+                await asyncio.to_thread(self.queue.complete, job)
+                await asyncio.to_thread(_mark_failed, session_factory, job)
+            else:
+                await asyncio.to_thread(self.queue.retry, job, self.backoff(job.attempts + 1))
+
+
+def _pending_post(db: Session, job: EnrichmentJob) -> Optional[Post]:
+    post = db.query(Post).filter(Post.id == job.post_id).first()
+    if post is None or post.enrichment_status != STATUS_PENDING or post.enrichment_hash != job.content_hash:
+        return None
+    return post
+
+
+def _load_pending_content(session_factory: Callable[[], Session], job: EnrichmentJob) -> Optional[str]:
+    db = session_factory()
+    try:
+        post = _pending_post(db, job)
+        if post is None or content_hash(post.content) != job.content_hash:
+            return None
+        return post.content
+    finally:
+        db.close()
+
+
+def _save_enrichment(session_factory: Callable[[], Session], job: EnrichmentJob,
+                     enrichment: Dict[str, Any], status: str) -> bool:
+    db = session_factory()
+    try:
+        # 부가 정보를 기다리는 동안 본문이 수정됐으면 저장하지 않음 (새 작업이 처리)
+        post = _pending_post(db, job)
+        if post is None:
+            return False
+        tag_ids = tag_resolver.attach(db, post.id, enrichment["tags"], replace=True)
+        post.summary = enrichment["summary"]
+        post.sentiment_score = enrichment["sentiment_score"]
+        post.sentiment_label = enrichment["sentiment_label"]
+        post.enrichment_status = status
+        board_type, created_at = post.board_type, post.created_at
+        db.commit()
+        # 태그가 바뀌었을 수 있으므로 태그별 게시글 목록에서 빼고 새 태그로 다시 추가
+        tag_postings.discard([job.post_id])
+        if tag_ids:
+            tag_postings.add(board_type, tag_ids, created_at, job.post_id)
+        return True
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _mark_failed(session_factory: Callable[[], Session], job: EnrichmentJob) -> None:
+    db = session_factory()
+    try:
+        post = _pending_post(db, job)
+        if post is not None:
+            post.enrichment_status = STATUS_FAILED
+            db.commit()
+            post_cache.invalidate(job.post_id)
+    finally:
+        db.close()
+
+
+enrichment_pool = EnrichmentWorkerPool()
@@ -0,0 +1,142 @@
+"""
+이미지 분류 결과(image_class) 백필 워커.
+
+게시글 상세 조회 중에 Model API를 호출하던 분류를 백그라운드로 옮겼습니다.
+- image_url은 있는데 image_class가 비어 있는 게시글을 배치로 찾아 동시에 분류
+- 분류 결과는 image_class가 여전히 비어 있는 경우에만 기록 (다른 경로의 결과를 덮어쓰지 않음)
+- 분류 실패 / 로컬 파일 없음은 일정 시간 건너뛰어 같은 게시글을 매 주기 재시도하지 않음
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.models.post import Post
+from app.services import model_client
+from app.services.post_cache import post_cache
+
+UPLOAD_DIR = os.path.abspath("./uploads")
+
+BACKFILL_INTERVAL = float(os.getenv("IMAGE_BACKFILL_INTERVAL", "60"))
+BACKFILL_BATCH_SIZE = int(os.getenv("IMAGE_BACKFILL_BATCH_SIZE", "20"))
+BACKFILL_CONCURRENCY = int(os.getenv("IMAGE_BACKFILL_CONCURRENCY", "4"))
+BACKFILL_RETRY_AFTER = float(os.getenv("IMAGE_BACKFILL_RETRY_AFTER", "600"))
+
+
+def resolve_upload_path(image_url: str, upload_dir: str = UPLOAD_DIR) -> Optional[str]:
+    """업로드 API로 저장한 이미지 URL -> 로컬 파일 경로 (외부 URL이면 None)"""
+    if "localhost:8000/uploads/" not in image_url:
+        return None
+    filename = image_url.split("/uploads/")[-1]
+    return os.path.join(upload_dir, filename)
+
+
+class ImageClassBackfill:
+    """image_class가 비어 있는 게시글을 배치로 분류"""
+
+    def __init__(self, batch_size: int = BACKFILL_BATCH_SIZE, concurrency: int = BACKFILL_CONCURRENCY,
+                 retry_after: float = BACKFILL_RETRY_AFTER, upload_dir: str = UPLOAD_DIR):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.retry_after = retry_after
+        self.upload_dir = upload_dir
+        self._skip_until: Dict[int, float] = {}
+
+    def _skipped_ids(self) -> List[int]:
+        now = time.monotonic()
+        self._skip_until = {post_id: until for post_id, until in self._skip_until.items() if until > now}
+        return list(self._skip_until)
+
+    def _load_candidates(self, session_factory: Callable[[], Session]) -> List[Tuple[int, str]]:
+        db = session_factory()
+        try:
+            query = db.query(Post.id, Post.image_url).filter(
+                Post.image_url.isnot(None),
+                Post.image_class.is_(None),
+            )
+            skipped = self._skipped_ids()
+            if skipped:
+                query = query.filter(Post.id.notin_(skipped))
+            return [(row.id, row.image_url) for row in query.order_by(Post.id.desc()).limit(self.batch_size)]
+        finally:
+            db.close()
+
+    def _save_results(self, session_factory: Callable[[], Session], results: Dict[int, str]) -> None:
+        db = session_factory()
+        try:
+            db.execute(
+                update(Post.__table__)
+                .where(Post.__table__.c.id == bindparam("post_id"), Post.__table__.c.image_class.is_(None))
+                .values(image_class=bindparam("image_class")),
+                [{"post_id": post_id, "image_class": image_class} for post_id, image_class in results.items()],
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    async def _classify(self, post_id: int, image_url: str, semaphore: asyncio.Semaphore) -> Optional[str]:
+        file_path = resolve_upload_path(image_url, self.upload_dir)
+        if not file_path or not os.path.exists(file_path):
+            return None
+
+        async with semaphore:
+            try:
+                file_data = await asyncio.to_thread(_read_file, file_path)
+                prediction = await model_client.predict_image(file_data, os.path.basename(file_path))
+            except Exception as e:
+                print(f"⚠️ 이미지 분류 백필 실패 (post_id={post_id}): {e}")
+                return None
+        return prediction.get("class_name") if prediction else None
+
+    async def run_once(self, session_factory: Callable[[], Session]) -> int:
+        """한 배치를 분류하고 기록한 게시글 수 반환"""
+        candidates = await asyncio.to_thread(self._load_candidates, session_factory)
+        if not candidates:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        class_names = await asyncio.gather(
+            *(self._classify(post_id, image_url, semaphore) for post_id, image_url in candidates)
+        )
+
+        results = {}
+        retry_at = time.monotonic() + self.retry_after
+        for (post_id, _), class_name in zip(candidates, class_names):
+            if class_name:
+                results[post_id] = class_name
+            else:
+                self._skip_until[post_id] = retry_at
+
+        if results:
+            await asyncio.to_thread(self._save_results, session_factory, results)
+            post_cache.invalidate_many(results.keys())
+            print(f"✅ 이미지 분류 백필 완료: {len(results)}건")
+        return len(results)
+
+    def reset(self) -> None:
+        self._skip_until.clear()
+
+
+def _read_file(file_path: str) -> bytes:
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+image_backfill = ImageClassBackfill()
+
+
+async def run_backfill_loop(session_factory: Callable[[], Session], interval: float = BACKFILL_INTERVAL):
+    """주기적으로 image_class 백필을 수행하는 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            # 밀린 게시글이 많으면 배치가 빌 때까지 연속 처리
+            while await image_backfill.run_once(session_factory) >= image_backfill.batch_size:
+                pass
+        except Exception as e:
+            print(f"⚠️ 이미지 분류 백필 작업 실패: {e}")
@@ -0,0 +1,179 @@
+"""
+Model API 레플리카 간 클라이언트 측 로드 밸런싱.
+
+Model 서비스는 CPU 바운드(Keras, NaiveBayes)라 여러 레플리카로 띄우고, 호출을 레플리카에 분산합니다.
+- 후보: model_discovery 프로버가 건강하다고 본 엔드포인트 (MODEL_API_URL=a,b,c)
+- 선택: power-of-two-choices(기본, 무작위 2개 중 진행 중 요청이 적은 쪽) 또는 least-outstanding
+- 수동 제외(passive ejection): 연속 실패가 임계치를 넘으면 일정 시간 후보에서 제외 (제외될수록 시간 증가)
+  단, 마지막 남은 레플리카는 제외하지 않음
+- 레플리카별 진행 중 요청 / 요청·실패 수 / 지연 p50·p99 통계 (진단용)
+"""
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional
+
+import httpx
+
+from app.services.model_discovery import prober
+
+LB_STRATEGY = os.getenv("MODEL_API_LB_STRATEGY", "p2c")
+EJECT_AFTER_FAILURES = int(os.getenv("MODEL_API_EJECT_AFTER_FAILURES", "3"))
+EJECT_BASE_SECONDS = float(os.getenv("MODEL_API_EJECT_BASE_SECONDS", "10"))
+EJECT_MAX_SECONDS = float(os.getenv("MODEL_API_EJECT_MAX_SECONDS", "300"))
+LATENCY_WINDOW = int(os.getenv("MODEL_API_LATENCY_WINDOW", "256"))
+
+# 지연 EWMA 가중치 (새 관측값 비중)
+_LATENCY_ALPHA = 0.2
+
+
+def is_replica_failure(exc: BaseException) -> bool:
+    """레플리카 자체의 문제로 볼 실패인지 (연결 실패 / 타임아웃 / 5xx). 4xx는 요청 문제로 간주"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def latency_percentile(ordered: List[float], pct: float) -> Optional[float]:
+    """정렬된 표본의 pct 백분위수 (표본이 없으면 None)"""
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class ReplicaStats:
+    """레플리카 하나의 부하 / 실패 / 지연 기록"""
+
+    def __init__(self, base_url: str, window: int = LATENCY_WINDOW):
+        self.base_url = base_url
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.ewma_ms: Optional[float] = None
+        self.latencies: Deque[float] = deque(maxlen=window)
+
+    def ejected(self, now: float) -> bool:
+        return self.ejected_until > now
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        ordered = sorted(self.latencies)
+        return {
+            "base_url": self.base_url,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "ejected": self.ejected(now),
+            "ejected_for": round(max(0.0, self.ejected_until - now), 3),
+            "ejections": self.ejections,
+            "latency_ewma_ms": round(self.ewma_ms, 2) if self.ewma_ms is not None else None,
+            "latency_p50_ms": latency_percentile(ordered, 50),
+            "latency_p99_ms": latency_percentile(ordered, 99),
+        }
+
+
+class ReplicaBalancer:
+    """Model API 호출마다 레플리카를 고르고 결과를 기록"""
+
+    def __init__(self, strategy: str = LB_STRATEGY, eject_after: int = EJECT_AFTER_FAILURES,
+                 eject_base: float = EJECT_BASE_SECONDS, eject_max: float = EJECT_MAX_SECONDS):
+        self.strategy = strategy
+        self.eject_after = eject_after
+        self.eject_base = eject_base
+        self.eject_max = eject_max
+        self._replicas: Dict[str, ReplicaStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, base_url: str) -> ReplicaStats:
+        stats = self._replicas.get(base_url)
+        if stats is None:
+            stats = self._replicas[base_url] = ReplicaStats(base_url)
+        return stats
+
+    def pick(self, exclude: Iterable[str] = ()) -> str:
+        """이번 호출에 사용할 레플리카 base_url"""
+        excluded = set(exclude)
+        routable = prober.routable_endpoints()
+        now = time.monotonic()
+        with self._lock:
+            candidates = [url for url in routable if url not in excluded]
+            available = [url for url in candidates if not self._stats(url).ejected(now)]
+            # 모두 제외됐으면 실패하는 것보다 시도하는 편이 나음
+            pool = available or candidates or routable
+            if len(pool) == 1:
+                return pool[0]
+            if self.strategy == "least_outstanding":
+                return min(pool, key=lambda url: self._load_key(url, random.random()))
+            first, second = random.sample(pool, 2)
+            return min((first, second), key=lambda url: self._load_key(url))
+
+    def _load_key(self, base_url: str, tiebreak: float = 0.0):
+        stats = self._stats(base_url)
+        # 진행 중 요청 수 우선, 같으면 최근 지연이 짧은 쪽
+        return stats.outstanding, stats.ewma_ms if stats.ewma_ms is not None else 0.0, tiebreak
+
+    @asynccontextmanager
+    async def track(self, base_url: str) -> AsyncIterator[None]:
+        """레플리카 호출 구간 (진행 중 요청 수 / 지연 / 실패 기록)"""
+        with self._lock:
+            stats = self._stats(base_url)
+            stats.outstanding += 1
+            stats.requests += 1
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException as exc:
+            with self._lock:
+                stats.outstanding -= 1
+                if is_replica_failure(exc):
+                    self._record_failure(stats)
+            raise
+        else:
+            latency_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                stats.outstanding -= 1
+                stats.consecutive_failures = 0
+                stats.ejections = 0
+                stats.latencies.append(latency_ms)
+                stats.ewma_ms = latency_ms if stats.ewma_ms is None \
+                    else (1 - _LATENCY_ALPHA) * stats.ewma_ms + _LATENCY_ALPHA * latency_ms
+
+    def _record_failure(self, stats: ReplicaStats) -> None:
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        if stats.consecutive_failures < self.eject_after:
+            return
+
+        now = time.monotonic()
+        others = [url for url in prober.routable_endpoints()
+                  if url != stats.base_url and not self._stats(url).ejected(now)]
+        if not others:
+            # 마지막 남은 레플리카는 제외하지 않음
+            return
+        stats.ejections += 1
+        duration = min(self.eject_max, self.eject_base * (2 ** (stats.ejections - 1)))
+        stats.ejected_until = now + duration
+        stats.consecutive_failures = 0
+        print(f"⚠️ Model API 레플리카 일시 제외 ({duration:g}초): {stats.base_url}")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """레플리카별 통계 (진단용)"""
+        now = time.monotonic()
+        with self._lock:
+            return [stats.to_dict(now) for stats in self._replicas.values()]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._replicas.clear()
+
+
+balancer = ReplicaBalancer()
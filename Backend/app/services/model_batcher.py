@@ -0,0 +1,169 @@
+"""
+Model API 텍스트 분석 자동 배치 (micro-batching, MODEL_API_BATCHING=true).
+
+댓글이 몰릴 때 sentiment / summarize / auto-tag 호출마다 HTTP 요청과 JSON 처리를 반복하지 않도록
+짧은 시간(MODEL_API_BATCH_WINDOW_MS) 동안 들어온 같은 종류의 호출을 모아 배치 API 한 번으로 보냅니다.
+- 묶음 기준: (엔드포인트, 파라미터, 클라이언트), 최대 MODEL_API_BATCH_MAX_SIZE개가 차면 바로 전송
+- 한 건만 모였으면 단건 API로 전송 (배치 오버헤드 없음)
+- 배치 API가 없는 Model 서버(404/405)면 이후로는 단건 호출로 대체
+- MODEL_API_BATCH_MAX_SIZE는 Model 서버의 MAX_BATCH_SIZE(기본 64) 이하로 설정
+  -> 더 큰 배치를 서버가 422로 거절하면 나눠서 다시 보내고 이후 최대 개수를 줄임
+- 항목별 실패는 해당 호출에만 BatchItemError로 전달
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+MODEL_API_BATCHING = os.getenv("MODEL_API_BATCHING", "false").lower() == "true"
+MODEL_API_BATCH_WINDOW_MS = float(os.getenv("MODEL_API_BATCH_WINDOW_MS", "5"))
+MODEL_API_BATCH_MAX_SIZE = int(os.getenv("MODEL_API_BATCH_MAX_SIZE", "32"))
+
+BatchKey = Tuple[str, str, Optional[httpx.AsyncClient]]
+SendOne = Callable[[str, str, Dict[str, Any], Optional[httpx.AsyncClient]], Awaitable[Any]]
+SendBatch = Callable[[str, List[str], Dict[str, Any], Optional[httpx.AsyncClient]], Awaitable[Dict[str, Any]]]
+
+
+class BatchItemError(Exception):
+    """배치 응답에서 해당 항목만 실패"""
+
+
+class AutoBatcher:
+    """동시에 들어온 텍스트 분석 호출을 모아 배치 API로 전송"""
+
+    def __init__(self, send_one: SendOne, send_batch: SendBatch, window_ms: float = MODEL_API_BATCH_WINDOW_MS,
+                 max_size: int = MODEL_API_BATCH_MAX_SIZE, enabled: bool = MODEL_API_BATCHING):
+        self.send_one = send_one
+        self.send_batch = send_batch
+        self.window = window_ms / 1000
+        self.max_size = max_size
+        self._configured_max_size = max_size
+        self.enabled = enabled
+        self._pending: Dict[BatchKey, List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[BatchKey, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._unsupported: Set[str] = set()
+        self.batches = 0
+        self.batched_items = 0
+        self.singles = 0
+
+    async def submit(self, endpoint: str, text: str, params: Optional[Dict[str, Any]] = None,
+                     client: Optional[httpx.AsyncClient] = None) -> Any:
+        """호출 하나를 대기열에 넣고 결과(응답 JSON의 해당 항목)를 기다림"""
+        params = params or {}
+        if not self.enabled or endpoint in self._unsupported:
+            self.singles += 1
+            return await self.send_one(endpoint, text, params, client)
+
+        loop = asyncio.get_running_loop()
+        key = (endpoint, json.dumps(params, sort_keys=True), client)
+        future = loop.create_future()
+        items = self._pending.setdefault(key, [])
+        items.append((text, future))
+        if len(items) >= self.max_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+        return await future
+
+    def _flush(self, key: BatchKey) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._pending.pop(key, [])
+        if not items:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(key, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, key: BatchKey, items: List[Tuple[str, asyncio.Future]]) -> None:
+        endpoint, params_json, client = key
+        params = json.loads(params_json)
+        texts = [text for text, _ in items]
+        try:
+            if len(items) == 1 or endpoint in self._unsupported:
+                results = await self._send_each(endpoint, texts, params, client)
+            else:
+                results = await self._send_batch(endpoint, texts, params, client)
+        except Exception as e:
+            results = [e] * len(items)
+
+        for (_, future), result in zip(items, results):
+            # 기다리던 쪽이 취소된 항목은 건너뜀
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _send_each(self, endpoint: str, texts: List[str], params: Dict[str, Any],
+                         client: Optional[httpx.AsyncClient]) -> List[Any]:
+        self.singles += len(texts)
+        return await asyncio.gather(*(self.send_one(endpoint, text, params, client) for text in texts),
+                                    return_exceptions=True)
+
+    async def _send_batch(self, endpoint: str, texts: List[str], params: Dict[str, Any],
+                          client: Optional[httpx.AsyncClient]) -> List[Any]:
+        try:
+            body = await self.send_batch(endpoint, texts, params, client)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 422 and len(texts) > 1:
+                return await self._send_split(endpoint, texts, params, client)
+            if e.response.status_code not in (404, 405):
+                raise
+            print(f"ℹ️ Model API에 {endpoint}/batch 가 없어 단건 호출로 대체합니다")
+            self._unsupported.add(endpoint)
+            return await self._send_each(endpoint, texts, params, client)
+
+        self.batches += 1
+        self.batched_items += len(texts)
+        results: List[Any] = list(body.get("results") or [])
+        if len(results) != len(texts):
+            raise BatchItemError(f"배치 응답 개수 불일치: {len(results)} != {len(texts)}")
+        messages = {error.get("index"): error.get("message") for error in body.get("errors") or []}
+        return [
+            BatchItemError(messages.get(index) or "batch_item_failed") if result is None else result
+            for index, result in enumerate(results)
+        ]
+
+    async def _send_split(self, endpoint: str, texts: List[str], params: Dict[str, Any],
+                          client: Optional[httpx.AsyncClient]) -> List[Any]:
+        """서버 최대 배치 크기를 넘은 배치 -> 반씩 나눠 다시 전송하고 이후 최대 개수를 줄임"""
+        half = (len(texts) + 1) // 2
+        if half < self.max_size:
+            print(f"⚠️ Model API가 {endpoint}/batch {len(texts)}개를 거절해 최대 배치 크기를 {half}로 줄입니다 "
+                  f"(MODEL_API_BATCH_MAX_SIZE를 Model 서버 MAX_BATCH_SIZE 이하로 설정하세요)")
+            self.max_size = half
+        first, second = await asyncio.gather(
+            self._send_batch(endpoint, texts[:half], params, client),
+            self._send_batch(endpoint, texts[half:], params, client),
+        )
+        return first + second
+
+    def stats(self) -> Dict[str, Any]:
+        """진단용 카운터"""
+        return {
+            "enabled": self.enabled,
+            "window_ms": self.window * 1000,
+            "max_size": self.max_size,
+            "batches": self.batches,
+            "batched_items": self.batched_items,
+            "avg_batch_size": round(self.batched_items / self.batches, 2) if self.batches else None,
+            "singles": self.singles,
+            "unsupported": sorted(self._unsupported),
+        }
+
+    def reset(self) -> None:
+        for timer in self._timers.values():
+            timer.cancel()
+        self._pending.clear()
+        self._timers.clear()
+        self._unsupported.clear()
+        self.max_size = self._configured_max_size
+        self.batches = self.batched_items = self.singles = 0
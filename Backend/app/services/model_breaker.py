@@ -0,0 +1,224 @@
+"""
+Model API 엔드포인트별 서킷 브레이커 + 적응형 타임아웃.
+
+Model 서비스가 느려지면 게시글/댓글 작성이 5~30초 타임아웃을 모두 기다리며 백엔드 워커를 붙잡습니다.
+엔드포인트(predict, sentiment, summarize, auto-tag, chat)마다 다음을 적용합니다.
+- 서킷 브레이커: 연속 실패가 임계치를 넘으면 open -> 일정 시간 동안 호출 없이 즉시 실패(CircuitOpenError)
+  -> 시간이 지나면 half-open 으로 시험 호출을 허용하고, 성공하면 closed / 실패하면 다시 open
+- 적응형 타임아웃: 최근 성공 지연의 백분위수 x 배수 (하한 ~ 엔드포인트별 최대 타임아웃 사이)
+  타임아웃으로 끝난 호출은 사용한 타임아웃을 지연 표본으로 기록해, 서비스가 느려지면 타임아웃도 늘어남
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+import httpx
+
+from app.services.model_balancer import LATENCY_WINDOW, is_replica_failure, latency_percentile
+
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("MODEL_API_BREAKER_FAILURES", "5"))
+BREAKER_OPEN_SECONDS = float(os.getenv("MODEL_API_BREAKER_OPEN_SECONDS", "30"))
+BREAKER_HALF_OPEN_CALLS = int(os.getenv("MODEL_API_BREAKER_HALF_OPEN_CALLS", "1"))
+
+ADAPTIVE_TIMEOUT = os.getenv("MODEL_API_ADAPTIVE_TIMEOUT", "true").lower() == "true"
+TIMEOUT_PERCENTILE = float(os.getenv("MODEL_API_TIMEOUT_PERCENTILE", "99"))
+TIMEOUT_MULTIPLIER = float(os.getenv("MODEL_API_TIMEOUT_MULTIPLIER", "3"))
+TIMEOUT_FLOOR = float(os.getenv("MODEL_API_TIMEOUT_FLOOR", "0.5"))
+# 표본이 이만큼 모이기 전에는 엔드포인트별 최대 타임아웃 사용
+TIMEOUT_MIN_SAMPLES = int(os.getenv("MODEL_API_TIMEOUT_MIN_SAMPLES", "20"))
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """브레이커가 열려 있어 Model API를 호출하지 않고 즉시 실패"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"circuit open: {endpoint} ({retry_after:.1f}초 후 재시도)")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """closed / open / half-open 상태 기계 (스레드 안전)"""
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 open_seconds: float = BREAKER_OPEN_SECONDS, half_open_calls: int = BREAKER_HALF_OPEN_CALLS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+        self.rejected = 0
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """호출 허용 여부 확인 (허용하지 않으면 CircuitOpenError)"""
+        with self._lock:
+            if self.state == STATE_OPEN:
+                remaining = self.opened_at + self.open_seconds - time.monotonic()
+                if remaining > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, remaining)
+                self.state = STATE_HALF_OPEN
+                self._trials = 0
+                print(f"ℹ️ Model API 서킷 half-open: {self.name}")
+            if self.state == STATE_HALF_OPEN:
+                if self._trials >= self.half_open_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, 0.0)
+                self._trials += 1
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.state == STATE_HALF_OPEN:
+                print(f"✅ Model API 서킷 closed: {self.name}")
+            self.state = STATE_CLOSED
+            self.consecutive_failures = 0
+            self._trials = 0
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == STATE_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def on_abort(self) -> None:
+        """결과와 무관하게 끝난 호출 (취소, 4xx 등) -> half-open 시험 슬롯만 반환"""
+        with self._lock:
+            if self.state == STATE_HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def _open(self) -> None:
+        if self.state != STATE_OPEN:
+            self.opens += 1
+            print(f"⚠️ Model API 서킷 open ({self.open_seconds:g}초): {self.name}")
+        self.state = STATE_OPEN
+        self.opened_at = time.monotonic()
+        self._trials = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_after = self.opened_at + self.open_seconds - time.monotonic() if self.state == STATE_OPEN else 0.0
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "opens": self.opens,
+                "rejected": self.rejected,
+                "retry_after": round(max(0.0, retry_after), 3),
+            }
+
+
+class AdaptiveTimeout:
+    """최근 지연 백분위수로 응답 대기 시간 결정"""
+
+    def __init__(self, ceiling: float, percentile: float = TIMEOUT_PERCENTILE,
+                 multiplier: float = TIMEOUT_MULTIPLIER, floor: float = TIMEOUT_FLOOR,
+                 min_samples: int = TIMEOUT_MIN_SAMPLES, window: int = LATENCY_WINDOW,
+                 enabled: bool = ADAPTIVE_TIMEOUT):
+        self.ceiling = ceiling
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.floor = min(floor, ceiling)
+        self.min_samples = min_samples
+        self.enabled = enabled
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def current(self) -> float:
+        """이번 호출의 응답 대기 시간 (초)"""
+        with self._lock:
+            if not self.enabled or len(self._samples) < self.min_samples:
+                return self.ceiling
+            observed = latency_percentile(sorted(self._samples), self.percentile)
+        return min(self.ceiling, max(self.floor, observed * self.multiplier))
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            ordered = sorted(self._samples)
+        p99 = latency_percentile(ordered, 99)
+        return {
+            "timeout": round(self.current(), 3),
+            "max_timeout": self.ceiling,
+            "samples": len(ordered),
+            "latency_p99_ms": round(p99 * 1000, 2) if p99 is not None else None,
+        }
+
+
+class EndpointGuard:
+    """엔드포인트 하나의 브레이커 + 적응형 타임아웃"""
+
+    def __init__(self, name: str, max_timeout: float, **breaker_options: Any):
+        self.name = name
+        self.breaker = CircuitBreaker(name, **breaker_options)
+        self.timeout = AdaptiveTimeout(max_timeout)
+
+    @asynccontextmanager
+    async def call(self) -> AsyncIterator[float]:
+        """
+        보호 구간: 브레이커가 열려 있으면 즉시 CircuitOpenError, 아니면 이번 호출의 타임아웃(초)을 넘겨줌
+
+        연결 실패 / 타임아웃 / 5xx는 브레이커 실패로, 성공 지연은 타임아웃 표본으로 기록
+        """
+        self.breaker.acquire()
+        timeout = self.timeout.current()
+        started = time.perf_counter()
+        try:
+            yield timeout
+        except BaseException as exc:
+            if is_replica_failure(exc):
+                if isinstance(exc, httpx.TimeoutException):
+                    self.timeout.record(timeout)
+                self.breaker.on_failure()
+            else:
+                self.breaker.on_abort()
+            raise
+        else:
+            self.timeout.record(time.perf_counter() - started)
+            self.breaker.on_success()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"endpoint": self.name, **self.breaker.to_dict(), **self.timeout.to_dict()}
+
+
+class GuardRegistry:
+    """엔드포인트 이름 -> EndpointGuard (처음 호출될 때 생성)"""
+
+    def __init__(self):
+        self._guards: Dict[str, EndpointGuard] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str, max_timeout: float) -> EndpointGuard:
+        with self._lock:
+            guard = self._guards.get(endpoint)
+            if guard is None:
+                guard = self._guards[endpoint] = EndpointGuard(endpoint, max_timeout)
+            return guard
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """진단용 엔드포인트별 브레이커 / 타임아웃 상태"""
+        with self._lock:
+            guards = list(self._guards.values())
+        return {guard.name: guard.to_dict() for guard in guards}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._guards.clear()
+
+
+guards = GuardRegistry()
@@ -0,0 +1,115 @@
+"""
+Model API 텍스트 분석 결과 캐시 (내용 주소 기반) + 동시 요청 합치기(singleflight).
+
+재게시, 내용이 그대로인 수정, 댓글 감성 분석 등 같은 텍스트를 반복해서 분석하는 경우가 많아
+sentiment / summarize / auto-tag 응답을 (엔드포인트, sha256(텍스트), 파라미터) 키로 캐시합니다.
+- LRU + TTL (MODEL_CACHE_MAXSIZE / MODEL_CACHE_TTL)
+- 같은 키의 요청이 진행 중이면 새로 보내지 않고 그 결과를 함께 기다림
+  (먼저 요청한 쪽이 취소돼도 호출은 끝까지 진행되어 나머지가 결과를 받음)
+- 실패(예외)는 캐시하지 않음, 함께 기다리던 호출에는 같은 예외 전달
+- hit / miss / coalesced 카운터는 진단 API에서 조회
+"""
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+MODEL_CACHE_ENABLED = os.getenv("MODEL_CACHE_ENABLED", "true").lower() == "true"
+MODEL_CACHE_TTL = float(os.getenv("MODEL_CACHE_TTL", "600"))
+MODEL_CACHE_MAXSIZE = int(os.getenv("MODEL_CACHE_MAXSIZE", "4096"))
+
+CacheKey = Tuple[str, str, str]
+
+
+def cache_key(endpoint: str, text: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+    """(엔드포인트, 텍스트 sha256, 정렬된 파라미터 JSON)"""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return endpoint, digest, json.dumps(params or {}, sort_keys=True)
+
+
+class ModelResultCache:
+    """분석 결과 LRU + TTL 캐시와 진행 중 요청 표"""
+
+    def __init__(self, maxsize: int = MODEL_CACHE_MAXSIZE, ttl: float = MODEL_CACHE_TTL,
+                 enabled: bool = MODEL_CACHE_ENABLED):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: "OrderedDict[CacheKey, tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_load(self, key: CacheKey, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시된 결과, 진행 중 요청의 결과, 또는 loader()로 새로 받은 결과 (복사본)"""
+        if not self.enabled:
+            return await loader()
+
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(item[1])
+            if item is not None:
+                del self._entries[key]
+
+            task = self._inflight.get(key)
+            if task is not None:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+                task = asyncio.ensure_future(self._load(key, loader))
+                self._inflight[key] = task
+                task.add_done_callback(lambda done, key=key: self._forget(key, done))
+
+        # 기다리던 쪽이 취소돼도 요청은 계속 (다른 호출자와 캐시를 위해)
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _load(self, key: CacheKey, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def _forget(self, key: CacheKey, task: asyncio.Task) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if not task.cancelled():
+            # 기다리는 쪽이 모두 취소된 경우에도 예외를 회수 (미회수 경고 방지)
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """진단용 카운터"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "inflight": len(self._inflight),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "hit_ratio": round((self.hits + self.coalesced) / lookups, 3) if lookups else None,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._inflight.clear()
+            self.hits = self.misses = self.coalesced = 0
+
+
+model_cache = ModelResultCache()
@@ -1,111 +1,198 @@
 """
 Model API 호출을 위한 클라이언트 서비스.
-Model API 서버 포트가 변경되더라도 자동으로 감지하여 연결합니다.
+Model API 서버 포트가 변경되더라도 백그라운드 프로버(model_discovery)가 감지하여 연결합니다.
+
+모든 호출은 앱 lifespan에서 만든 공유 httpx.AsyncClient(커넥션 풀 + keep-alive)를 사용합니다.
+lifespan 밖(스크립트 등)에서는 호출마다 임시 클라이언트를 만듭니다.
+여러 Model API 레플리카(MODEL_API_URL=a,b,c)가 있으면 model_balancer가 호출마다 레플리카를 고릅니다.
+엔드포인트별 서킷 브레이커 / 적응형 타임아웃은 model_breaker가 담당합니다 (열려 있으면 즉시 실패).
+텍스트 분석(sentiment / summarize / auto-tag) 결과는 model_cache가 내용 해시로 캐시하고,
+MODEL_API_BATCHING=true 이면 동시에 들어온 호출을 model_batcher가 배치 API 한 번으로 묶습니다.
 """
 from __future__ import annotations
 
 import os
-import socket
-from typing import Any, Dict, Optional, List
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, List
 
 import httpx
 
-_CANDIDATE_PORTS = [8001, 8002, 8003, 8082, 8502, 8000]
-_MODEL_API_BASE_URL: Optional[str] = None
+from app.services import model_discovery
+from app.services.model_balancer import balancer
+from app.services.model_batcher import AutoBatcher
+from app.services.model_breaker import guards
+from app.services.model_cache import cache_key, model_cache
 
+# 공유 클라이언트 커넥션 풀 설정
+MODEL_API_MAX_CONNECTIONS = int(os.getenv("MODEL_API_MAX_CONNECTIONS", "100"))
+MODEL_API_MAX_KEEPALIVE = int(os.getenv("MODEL_API_MAX_KEEPALIVE", "20"))
+MODEL_API_KEEPALIVE_EXPIRY = float(os.getenv("MODEL_API_KEEPALIVE_EXPIRY", "30"))
+MODEL_API_CONNECT_TIMEOUT = float(os.getenv("MODEL_API_CONNECT_TIMEOUT", "2"))
+MODEL_API_HTTP2 = os.getenv("MODEL_API_HTTP2", "false").lower() == "true"
+
+# 엔드포인트별 응답 대기 시간 (초)
+ENDPOINT_TIMEOUTS = {
+    "predict": float(os.getenv("MODEL_API_TIMEOUT_PREDICT", "30")),
+    "sentiment": float(os.getenv("MODEL_API_TIMEOUT_SENTIMENT", "10")),
+    "summarize": float(os.getenv("MODEL_API_TIMEOUT_SUMMARIZE", "10")),
+    "auto-tag": float(os.getenv("MODEL_API_TIMEOUT_AUTO_TAG", "5")),
+    "chat": float(os.getenv("MODEL_API_TIMEOUT_CHAT", "60")),
+}
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def refresh_model_api_base_url() -> str:
+    """현재 엔드포인트 연결 실패 시 호출 -> 다음 후보로 전환 (탐색은 백그라운드 프로버가 수행)"""
+    return model_discovery.prober.report_failure(get_model_api_base_url())
+
+
+def get_model_api_base_url() -> str:
+    """캐시된 현재 Model API 엔드포인트 (요청 경로에서 I/O 없음)"""
+    return model_discovery.prober.current()
 
-def _probe_port(port: int) -> bool:
-    """포트에서 HTTP 응답이 오는지 확인"""
-    try:
-        with socket.create_connection(("127.0.0.1", port), timeout=0.3):
-            pass
-    except OSError:
-        return False
 
+def endpoint_timeout(endpoint: str, read: Optional[float] = None) -> httpx.Timeout:
+    """엔드포인트별 응답 대기 시간(read가 있으면 그 값) + 공통 연결 시간 제한"""
+    return httpx.Timeout(ENDPOINT_TIMEOUTS[endpoint] if read is None else read, connect=MODEL_API_CONNECT_TIMEOUT)
+
+
+def _http2_enabled() -> bool:
+    if not MODEL_API_HTTP2:
+        return False
     try:
-        resp = httpx.get(f"http://127.0.0.1:{port}/", timeout=0.5)
-        return resp.status_code < 500
-    except Exception:
+        import h2  # noqa: F401
+    except ImportError:
+        print("⚠️ MODEL_API_HTTP2=true 사용 시 h2 패키지가 필요합니다 (pip install 'httpx[http2]'). HTTP/1.1로 연결합니다.")
         return False
+    return True
 
 
-def _detect_model_api_port() -> int:
-    for port in _CANDIDATE_PORTS:
-        if _probe_port(port):
-            print(f"✅ Model API 서버 포트 자동 감지: {port}")
-            return port
+async def start_client(**overrides: Any) -> httpx.AsyncClient:
+    """앱 시작 시 공유 클라이언트 생성 (overrides는 httpx.AsyncClient 인자, 테스트용 transport 등)"""
+    global _shared_client
+    if _shared_client is not None:
+        return _shared_client
 
-    default_port = 8002
-    print(f"⚠️ Model API 서버를 찾지 못했습니다. 기본 포트 {default_port} 사용")
-    return default_port
+    options: Dict[str, Any] = {
+        "limits": httpx.Limits(
+            max_connections=MODEL_API_MAX_CONNECTIONS,
+            max_keepalive_connections=MODEL_API_MAX_KEEPALIVE,
+            keepalive_expiry=MODEL_API_KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(max(ENDPOINT_TIMEOUTS.values()), connect=MODEL_API_CONNECT_TIMEOUT),
+        "http2": _http2_enabled(),
+    }
+    options.update(overrides)
+    _shared_client = httpx.AsyncClient(**options)
+    return _shared_client
 
 
-def _build_model_api_base_url(force_refresh: bool = False) -> str:
-    global _MODEL_API_BASE_URL
+async def close_client() -> None:
+    """앱 종료 시 공유 클라이언트의 커넥션 풀 정리"""
+    global _shared_client
+    client, _shared_client = _shared_client, None
+    if client is not None:
+        await client.aclose()
 
-    if not force_refresh and _MODEL_API_BASE_URL:
-        return _MODEL_API_BASE_URL
 
-    env_url = os.getenv("MODEL_API_URL")
-    if env_url:
-        _MODEL_API_BASE_URL = env_url.rstrip("/")
-        print(f"ℹ️ MODEL_API_URL 환경 변수를 사용합니다: {_MODEL_API_BASE_URL}")
-        return _MODEL_API_BASE_URL
+def get_shared_client() -> Optional[httpx.AsyncClient]:
+    return _shared_client
 
-    env_port = os.getenv("MODEL_API_PORT")
-    if env_port:
-        _MODEL_API_BASE_URL = f"http://localhost:{env_port}/api"
-        print(f"ℹ️ MODEL_API_PORT 환경 변수를 사용합니다: {_MODEL_API_BASE_URL}")
-        return _MODEL_API_BASE_URL
 
-    port = _detect_model_api_port()
-    _MODEL_API_BASE_URL = f"http://localhost:{port}/api"
-    return _MODEL_API_BASE_URL
+@asynccontextmanager
+async def client_scope(client: Optional[httpx.AsyncClient] = None,
+                       timeout: Optional[float] = None) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    사용할 클라이언트 결정: 호출자가 넘긴 클라이언트 -> 공유 클라이언트 -> 이번 범위 전용 임시 클라이언트
+    """
+    if client is None:
+        client = _shared_client
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient(timeout=timeout or max(ENDPOINT_TIMEOUTS.values())) as own_client:
+        yield own_client
+
+
+async def _post(endpoint: str, client: Optional[httpx.AsyncClient] = None,
+                tried: Optional[List[str]] = None, timeout_key: Optional[str] = None,
+                **kwargs: Any) -> httpx.Response:
+    """
+    레플리카 하나를 골라 {base_url}/{endpoint} 로 POST (적응형 타임아웃, 4xx/5xx는 HTTPStatusError)
 
+    엔드포인트 서킷이 열려 있으면 요청 없이 CircuitOpenError.
+    응답 지연과 실패는 서킷 브레이커와 로드 밸런서 통계에 기록됩니다.
+    tried: 재시도 시 이미 시도한 레플리카 목록 (선택에서 제외하고, 이번 레플리카를 추가)
+    timeout_key: ENDPOINT_TIMEOUTS에서 최대 타임아웃을 읽을 이름 (기본은 endpoint, 배치 API는 단건 이름)
+    """
+    timeout_key = timeout_key or endpoint
+    guard = guards.get(endpoint, ENDPOINT_TIMEOUTS[timeout_key])
+    async with guard.call() as read_timeout:
+        base_url = balancer.pick(exclude=tried or ())
+        if tried is not None:
+            tried.append(base_url)
+        async with client_scope(client) as http:
+            async with balancer.track(base_url):
+                response = await http.post(f"{base_url}/{endpoint}",
+                                           timeout=endpoint_timeout(timeout_key, read_timeout), **kwargs)
+                response.raise_for_status()
+                return response
 
-def refresh_model_api_base_url() -> str:
-    """외부에서 강제로 재탐색할 때 호출"""
-    return _build_model_api_base_url(force_refresh=True)
 
+async def _post_text_one(endpoint: str, text: str, params: Dict[str, Any],
+                         client: Optional[httpx.AsyncClient] = None) -> Any:
+    response = await _post(endpoint, client, json={"text": text, **params})
+    return response.json()
 
-def get_model_api_base_url() -> str:
-    return _build_model_api_base_url()
 
+async def _post_text_batch(endpoint: str, texts: List[str], params: Dict[str, Any],
+                           client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+    response = await _post(f"{endpoint}/batch", client, timeout_key=endpoint, json={"texts": texts, **params})
+    return response.json()
 
-async def predict_image(file_data: bytes, filename: str = "image.jpg") -> Optional[Dict[str, Any]]:
+
+batcher = AutoBatcher(_post_text_one, _post_text_batch)
+
+
+async def _post_text(endpoint: str, text: str, client: Optional[httpx.AsyncClient] = None,
+                     params: Optional[Dict[str, Any]] = None) -> Any:
     """
-    이미지 분류 API 호출
+    텍스트 분석 호출 -> 응답 JSON (같은 엔드포인트 / 텍스트 / 파라미터는 캐시, 진행 중이면 합침, 배치 가능)
     """
-    base_url = get_model_api_base_url()
-    url = f"{base_url}/predict"
-    print(f"🔍 Model API 호출 시도: {url}")
+    params = params or {}
 
-    async def _do_request(target_url: str) -> Dict[str, Any]:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            content_type = "image/jpeg"
-            if filename.lower().endswith(".png"):
-                content_type = "image/png"
+    async def load() -> Any:
+        return await batcher.submit(endpoint, text, params, client)
+
+    return await model_cache.get_or_load(cache_key(endpoint, text, params), load)
 
-            files = {"file": (filename, file_data, content_type)}
-            print(f"📤 요청 전송 중... (파일 크기: {len(file_data)} bytes, URL: {target_url})")
-            response = await client.post(target_url, files=files)
-            print(f"📥 응답 받음: {response.status_code}")
-            response.raise_for_status()
-            result = response.json()
-            print(f"✅ Model API 응답 성공: {result}")
-            return result
+
+async def predict_image(file_data: bytes, filename: str = "image.jpg") -> Optional[Dict[str, Any]]:
+    """
+    이미지 분류 API 호출
+    """
+    content_type = "image/jpeg"
+    if filename.lower().endswith(".png"):
+        content_type = "image/png"
+    files = {"file": (filename, file_data, content_type)}
 
     attempts = 0
     last_error: Optional[Exception] = None
+    tried: List[str] = []
 
     while attempts < 2:
         try:
-            return await _do_request(url)
+            print(f"📤 이미지 분류 요청 전송 중... (파일 크기: {len(file_data)} bytes)")
+            response = await _post("predict", tried=tried, files=files)
+            print(f"📥 응답 받음: {response.status_code}")
+            result = response.json()
+            print(f"✅ Model API 응답 성공: {result}")
+            return result
         except (httpx.ConnectError, httpx.TimeoutException) as e:
             last_error = e
-            print(f"⚠️ Model API 연결 실패: {e}. 재탐색 중...")
-            refreshed = refresh_model_api_base_url()
-            url = f"{refreshed}/predict"
+            # 다른 레플리카로 한 번 재시도
+            print(f"⚠️ Model API 연결 실패: {e}. 다른 엔드포인트로 재시도...")
         except httpx.HTTPStatusError as e:
             print(f"⚠️ 이미지 분류 API HTTP 에러: {e.response.status_code} - {e.response.text}")
             return None
@@ -120,21 +207,15 @@ async def predict_image(file_data: bytes, filename: str = "image.jpg") -> Option
     return None
 
 
-async def analyze_sentiment(text: str, explain: bool = False) -> Optional[Dict[str, Any]]:
+async def analyze_sentiment(text: str, explain: bool = False,
+                            client: Optional[httpx.AsyncClient] = None) -> Optional[Dict[str, Any]]:
     """
     감성 분석 API 호출
     """
-    base_url = get_model_api_base_url()
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{base_url}/sentiment",
-                json={"text": text, "explain": explain}
-            )
-            response.raise_for_status()
-            return response.json()
+        return await _post_text("sentiment", text, client, params={"explain": explain})
     except httpx.TimeoutException:
-        print("⚠️ 감성 분석 API 호출 타임아웃 (10초 초과)")
+        print("⚠️ 감성 분석 API 호출 타임아웃")
         return None
     except httpx.HTTPStatusError as e:
         print(f"⚠️ 감성 분석 API HTTP 에러: {e.response.status_code} - {e.response.text}")
@@ -148,30 +229,27 @@ async def chat_with_model(message: str, model: str = "gemma3:4b") -> Optional[st
     """
     채팅 API 호출 (스트리밍 응답 처리)
     """
-    base_url = get_model_api_base_url()
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{base_url}/chat",
-                json={"message": message, "model": model},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-
-            content = ""
-            async for line in response.aiter_lines():
-                if line:
-                    import json
-
-                    try:
-                        data = json.loads(line)
-                        if data.get("type") == "content":
-                            content += data.get("content", "")
-                    except json.JSONDecodeError:
-                        pass
-            return content if content else None
+        response = await _post(
+            "chat",
+            json={"message": message, "model": model},
+            headers={"Content-Type": "application/json"}
+        )
+
+        content = ""
+        async for line in response.aiter_lines():
+            if line:
+                import json
+
+                try:
+                    data = json.loads(line)
+                    if data.get("type") == "content":
+                        content += data.get("content", "")
+                except json.JSONDecodeError:
+                    pass
+        return content if content else None
     except httpx.TimeoutException:
-        print("⚠️ 채팅 API 호출 타임아웃 (60초 초과)")
+        print("⚠️ 채팅 API 호출 타임아웃")
         return None
     except httpx.HTTPStatusError as e:
         print(f"⚠️ 채팅 API HTTP 에러: {e.response.status_code} - {e.response.text}")
@@ -181,38 +259,24 @@ async def chat_with_model(message: str, model: str = "gemma3:4b") -> Optional[st
         return None
 
 
-async def summarize_text(text: str) -> Optional[Dict[str, Any]]:
+async def summarize_text(text: str, client: Optional[httpx.AsyncClient] = None) -> Optional[Dict[str, Any]]:
     """
     요약 API 호출
     """
-    base_url = get_model_api_base_url()
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{base_url}/summarize",
-                json={"text": text}
-            )
-            response.raise_for_status()
-            return response.json()
+        return await _post_text("summarize", text, client)
     except Exception as e:
         print(f"⚠️ 요약 API 호출 실패: {e}")
         return None
 
 
-async def auto_tag_text(text: str) -> Optional[List[str]]:
+async def auto_tag_text(text: str, client: Optional[httpx.AsyncClient] = None) -> Optional[List[str]]:
     """
     자동 태깅 API 호출
     """
-    base_url = get_model_api_base_url()
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.post(
-                f"{base_url}/auto-tag",
-                json={"text": text}
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("tags", [])
+        data = await _post_text("auto-tag", text, client)
+        return data.get("tags", [])
     except Exception as e:
         print(f"⚠️ 자동 태깅 API 호출 실패: {e}")
         return []
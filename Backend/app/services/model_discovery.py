@@ -0,0 +1,208 @@
+"""
+Model API 엔드포인트 탐색 (백그라운드 헬스 프로버).
+
+요청 처리 중에 후보 포트를 동기 소켓 / httpx.get 으로 훑던 탐색을 백그라운드 작업으로 옮겼습니다.
+- 후보: MODEL_API_URL(쉼표로 여러 개 가능) -> MODEL_API_PORT -> 기본 후보 포트 목록
+- 주기적으로 모든 후보에 GET / 를 동시에 보내고 성공률(EWMA)로 점수를 매김 (지연도 함께 기록)
+- 요청 경로는 current()로 캐시된 현재 엔드포인트만 읽음 (I/O 없음)
+- 호출 실패는 report_failure()로 알려 다음 탐색 전까지 다른 후보로 전환
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+CANDIDATE_PORTS = [8001, 8002, 8003, 8082, 8502, 8000]
+DEFAULT_PORT = 8002
+
+PROBE_INTERVAL = float(os.getenv("MODEL_API_PROBE_INTERVAL", "10"))
+# 건강한 엔드포인트가 하나도 없을 때는 더 자주 탐색
+PROBE_RETRY_INTERVAL = float(os.getenv("MODEL_API_PROBE_RETRY_INTERVAL", "2"))
+PROBE_TIMEOUT = float(os.getenv("MODEL_API_PROBE_TIMEOUT", "0.5"))
+
+# 성공률 EWMA 가중치 (새 관측값 비중)
+_SCORE_ALPHA = 0.3
+
+
+@dataclass
+class EndpointHealth:
+    base_url: str
+    score: float = 0.0          # 0~1, 최근 탐색 성공률 (EWMA)
+    healthy: bool = False
+    latency_ms: Optional[float] = None
+    last_checked: Optional[float] = None
+    consecutive_failures: int = 0
+
+
+def _candidates_from_env() -> List[str]:
+    env_url = os.getenv("MODEL_API_URL")
+    if env_url:
+        return [url.strip().rstrip("/") for url in env_url.split(",") if url.strip()]
+
+    env_port = os.getenv("MODEL_API_PORT")
+    if env_port:
+        return [f"http://localhost:{env_port}/api"]
+
+    return [f"http://localhost:{port}/api" for port in CANDIDATE_PORTS]
+
+
+def _probe_url(base_url: str) -> str:
+    """.../api -> 서버 루트(/) 헬스 체크 URL"""
+    origin = base_url[:-len("/api")] if base_url.endswith("/api") else base_url
+    return f"{origin}/"
+
+
+class ModelEndpointProber:
+    """후보 엔드포인트의 건강 상태 점수표"""
+
+    def __init__(self, candidates: Optional[List[str]] = None, fallback: Optional[str] = None,
+                 probe_timeout: float = PROBE_TIMEOUT):
+        self.probe_timeout = probe_timeout
+        self._candidates = candidates
+        self._fallback = fallback
+        self._endpoints: Dict[str, EndpointHealth] = {}
+        self._explicit = False
+        self._current: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _ensure_candidates(self) -> None:
+        # 환경 변수는 처음 쓰일 때 읽음 (스크립트가 import 후에 설정하는 경우 포함)
+        if self._endpoints:
+            return
+        self._explicit = self._candidates is not None or bool(os.getenv("MODEL_API_URL") or os.getenv("MODEL_API_PORT"))
+        candidates = self._candidates if self._candidates is not None else _candidates_from_env()
+        self._endpoints = {url: EndpointHealth(url) for url in candidates}
+        if self._fallback is None:
+            # 직접 지정한 엔드포인트가 없으면 기존과 같이 기본 포트로 대기
+            self._fallback = candidates[0] if self._explicit else f"http://localhost:{DEFAULT_PORT}/api"
+        print(f"ℹ️ Model API 후보 엔드포인트: {candidates}")
+
+    def current(self) -> str:
+        """현재 사용할 엔드포인트 (캐시된 값만 읽음, 건강한 후보가 없으면 기본값)"""
+        with self._lock:
+            self._ensure_candidates()
+            return self._current or self._fallback
+
+    def healthy_endpoints(self) -> List[str]:
+        """점수 순으로 정렬된 건강한 엔드포인트 목록"""
+        with self._lock:
+            self._ensure_candidates()
+            return [health.base_url for health in self._ranked() if health.healthy]
+
+    def routable_endpoints(self) -> List[str]:
+        """
+        호출을 보낼 수 있는 엔드포인트 목록 (로드 밸런서 후보)
+
+        건강한 엔드포인트가 있으면 그 목록, 아직 탐색 전이거나 모두 실패면
+        직접 지정한 후보 전체 (자동 탐색 모드에서는 기본 엔드포인트 하나)
+        """
+        with self._lock:
+            self._ensure_candidates()
+            healthy = [health.base_url for health in self._ranked() if health.healthy]
+            if healthy:
+                return healthy
+            if self._explicit:
+                return list(self._endpoints)
+            return [self._fallback]
+
+    def report_failure(self, base_url: str) -> str:
+        """요청 경로에서 연결 실패를 알림 -> 다음 후보로 전환 후 새 엔드포인트 반환"""
+        with self._lock:
+            self._ensure_candidates()
+            health = self._endpoints.get(base_url)
+            if health is not None:
+                self._record(health, ok=False)
+                self._select()
+            return self._current or self._fallback
+
+    async def probe_once(self, client: Optional[httpx.AsyncClient] = None) -> Dict[str, bool]:
+        """모든 후보를 동시에 탐색하고 base_url -> 성공 여부 반환"""
+        with self._lock:
+            self._ensure_candidates()
+            urls = list(self._endpoints)
+
+        if client is None:
+            async with httpx.AsyncClient(timeout=self.probe_timeout) as own_client:
+                return await self.probe_once(own_client)
+
+        outcomes = await asyncio.gather(*(self._probe(client, url) for url in urls))
+        with self._lock:
+            for url, (ok, latency_ms) in zip(urls, outcomes):
+                self._record(self._endpoints[url], ok, latency_ms)
+            self._select()
+        return {url: ok for url, (ok, _) in zip(urls, outcomes)}
+
+    async def _probe(self, client: httpx.AsyncClient, base_url: str) -> tuple[bool, Optional[float]]:
+        started = time.perf_counter()
+        try:
+            response = await client.get(_probe_url(base_url), timeout=self.probe_timeout)
+        except Exception:
+            return False, None
+        return response.status_code < 500, (time.perf_counter() - started) * 1000
+
+    def _record(self, health: EndpointHealth, ok: bool, latency_ms: Optional[float] = None) -> None:
+        health.score = (1 - _SCORE_ALPHA) * health.score + _SCORE_ALPHA * (1.0 if ok else 0.0)
+        health.healthy = ok
+        health.last_checked = time.time()
+        if ok:
+            health.consecutive_failures = 0
+            if latency_ms is not None:
+                health.latency_ms = latency_ms if health.latency_ms is None \
+                    else (1 - _SCORE_ALPHA) * health.latency_ms + _SCORE_ALPHA * latency_ms
+        else:
+            health.consecutive_failures += 1
+
+    def _ranked(self) -> List[EndpointHealth]:
+        order = {url: index for index, url in enumerate(self._endpoints)}
+        # 건강 여부 -> 성공률 -> 설정 순서 (지연은 진단용으로만 기록)
+        return sorted(self._endpoints.values(), key=lambda h: (not h.healthy, -h.score, order[h.base_url]))
+
+    def _select(self) -> None:
+        healthy = [health for health in self._ranked() if health.healthy]
+        selected = healthy[0].base_url if healthy else None
+        if selected != self._current:
+            if selected:
+                print(f"✅ Model API 엔드포인트 선택: {selected}")
+            else:
+                print(f"⚠️ 응답하는 Model API 서버가 없습니다. 기본 엔드포인트 {self._fallback} 사용")
+            self._current = selected
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """진단용 엔드포인트 상태 목록 (점수 순)"""
+        with self._lock:
+            self._ensure_candidates()
+            return [dict(asdict(health), current=health.base_url == self._current) for health in self._ranked()]
+
+    def reset(self, candidates: Optional[List[str]] = None, fallback: Optional[str] = None) -> None:
+        """후보를 다시 읽음 (None이면 다음 사용 시 환경 변수에서)"""
+        with self._lock:
+            self._candidates = candidates
+            self._fallback = fallback
+            self._endpoints = {}
+            self._current = None
+
+
+prober = ModelEndpointProber()
+
+
+async def run_probe_loop(client: Optional[httpx.AsyncClient] = None, interval: float = PROBE_INTERVAL,
+                         retry_interval: float = PROBE_RETRY_INTERVAL):
+    """Model API 후보를 주기적으로 탐색하는 백그라운드 작업 (시작 즉시 1회 탐색)"""
+    if client is None:
+        async with httpx.AsyncClient(timeout=prober.probe_timeout) as own_client:
+            return await run_probe_loop(own_client, interval, retry_interval)
+
+    while True:
+        try:
+            results = await prober.probe_once(client)
+            healthy = any(results.values())
+        except Exception as e:
+            print(f"⚠️ Model API 탐색 실패: {e}")
+            healthy = False
+        await asyncio.sleep(interval if healthy else retry_interval)
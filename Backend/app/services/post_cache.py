@@ -0,0 +1,181 @@
+"""
+게시글 상세 응답 캐시 (read-through).
+
+GET /api/posts/{post_id} 가 매번 게시글/작성자/태그/댓글/댓글 작성자를 다시 읽지 않도록
+상세 응답 본문을 캐시합니다.
+- L1: 프로세스 내 LRU + TTL
+- L2: 워커 간 공유 백엔드 (선택, POST_CACHE_BACKEND=redis)
+- 사용자마다 다른 필드(liked)는 캐시 본문에 넣지 않음
+- 게시글/댓글/좋아요 변경 시 컨트롤러가 invalidate() 호출
+  (다른 워커의 L1은 TTL 동안 이전 값을 볼 수 있으므로 TTL은 짧게 유지)
+- 레플리카에서 읽은 본문은 최근에 무효화된 게시글이면 저장하지 않음 (복제 지연 중의 이전 값이 캐시에 남지 않도록)
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Protocol
+
+POST_CACHE_TTL = float(os.getenv("POST_CACHE_TTL", "30"))
+POST_CACHE_MAXSIZE = int(os.getenv("POST_CACHE_MAXSIZE", "1024"))
+POST_CACHE_BACKEND = os.getenv("POST_CACHE_BACKEND", "")
+POST_CACHE_REDIS_URL = os.getenv("POST_CACHE_REDIS_URL", "redis://localhost:6379/0")
+# 무효화 시각 보관 기간 (invalidated_within 으로 확인할 수 있는 최대 구간)
+INVALIDATION_MEMORY = 300.0
+
+
+class CacheBackend(Protocol):
+    """워커 간 공유 캐시 백엔드 인터페이스 (값은 JSON 문자열)"""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl: float) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """공유 백엔드의 로컬 구현 (테스트 / 단일 프로세스용)"""
+
+    def __init__(self):
+        self._data: Dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class RedisCacheBackend:
+    """Redis 공유 백엔드 (redis 패키지 필요)"""
+
+    def __init__(self, url: str = POST_CACHE_REDIS_URL):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("POST_CACHE_BACKEND=redis 사용 시 redis 패키지가 필요합니다: pip install redis") from e
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self._client.set(key, value, px=int(ttl * 1000))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+
+class PostDetailCache:
+    """post_id -> 상세 응답 본문 (liked 제외)"""
+
+    def __init__(self, maxsize: int = POST_CACHE_MAXSIZE, ttl: float = POST_CACHE_TTL,
+                 shared: Optional[CacheBackend] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.shared = shared
+        self._local: "OrderedDict[int, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # post_id -> 마지막 무효화 시각 (오래된 순)
+        self._invalidated: "OrderedDict[int, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(post_id: int) -> str:
+        return f"post_detail:{post_id}"
+
+    def get(self, post_id: int) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            item = self._local.get(post_id)
+            if item is not None:
+                expires_at, body = item
+                if expires_at > now:
+                    self._local.move_to_end(post_id)
+                    return dict(body)
+                del self._local[post_id]
+
+        if self.shared is None:
+            return None
+        try:
+            raw = self.shared.get(self._key(post_id))
+        except Exception as e:
+            print(f"⚠️ 공유 캐시 조회 실패: {e}")
+            return None
+        if raw is None:
+            return None
+        body = json.loads(raw)
+        self._set_local(post_id, body)
+        return dict(body)
+
+    def set(self, post_id: int, body: Dict[str, Any]) -> None:
+        self._set_local(post_id, body)
+        if self.shared is not None:
+            try:
+                self.shared.set(self._key(post_id), json.dumps(body, ensure_ascii=False), self.ttl)
+            except Exception as e:
+                print(f"⚠️ 공유 캐시 저장 실패: {e}")
+
+    def invalidate(self, post_id: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._local.pop(post_id, None)
+            self._invalidated[post_id] = now
+            self._invalidated.move_to_end(post_id)
+            while self._invalidated and next(iter(self._invalidated.values())) <= now - INVALIDATION_MEMORY:
+                self._invalidated.popitem(last=False)
+        if self.shared is not None:
+            try:
+                self.shared.delete(self._key(post_id))
+            except Exception as e:
+                print(f"⚠️ 공유 캐시 삭제 실패: {e}")
+
+    def invalidated_within(self, post_id: int, seconds: float) -> bool:
+        """이 프로세스에서 최근 seconds 안에 무효화된 게시글인지"""
+        with self._lock:
+            invalidated_at = self._invalidated.get(post_id)
+        return invalidated_at is not None and invalidated_at > time.monotonic() - seconds
+
+    def invalidate_many(self, post_ids: Iterable[int]) -> None:
+        for post_id in post_ids:
+            self.invalidate(post_id)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._local.clear()
+            self._invalidated.clear()
+
+    def _set_local(self, post_id: int, body: Dict[str, Any]) -> None:
+        with self._lock:
+            self._local[post_id] = (time.monotonic() + self.ttl, body)
+            self._local.move_to_end(post_id)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+
+def _build_shared_backend() -> Optional[CacheBackend]:
+    if POST_CACHE_BACKEND == "redis":
+        return RedisCacheBackend()
+    if POST_CACHE_BACKEND == "memory":
+        return InMemoryCacheBackend()
+    return None
+
+
+post_cache = PostDetailCache(shared=_build_shared_backend())
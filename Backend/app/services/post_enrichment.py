@@ -0,0 +1,79 @@
+"""
+게시글 작성 시 AI 부가 정보(태그 / 요약 / 감성) 수집.
+
+자동 태깅, 요약, 감성 분석을 순서대로 기다리던 것을 하나의 클라이언트로 동시에 호출합니다.
+- 세 호출이 같은 httpx.AsyncClient(앱 공유 커넥션 풀)를 사용해 연결 수립 비용을 반복하지 않음
+- 전체 지연 예산(POST_ENRICHMENT_BUDGET)을 넘기면 끝나지 않은 호출은 취소하고
+  그때까지 받은 결과만으로 게시글을 저장
+- POST_ENRICHMENT_MODE=async 이면 게시글을 먼저 저장하고 enrichment_worker가 나중에 채움
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from typing import Any, Dict, List, Optional
+
+from app.services import model_client
+
+ENRICHMENT_BUDGET = float(os.getenv("POST_ENRICHMENT_BUDGET", "8"))
+# sync: 작성 요청 안에서 부가 정보를 기다림 / async: 저장 후 백그라운드 워커가 채움
+ENRICHMENT_MODE = os.getenv("POST_ENRICHMENT_MODE", "sync")
+
+
+def content_hash(content: str) -> str:
+    """부가 정보 작업의 멱등 키로 쓰는 본문 해시"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def empty_enrichment() -> Dict[str, Any]:
+    return {"tags": [], "summary": None, "sentiment_score": None, "sentiment_label": None}
+
+
+async def enrich_post_content(text: str, budget: Optional[float] = None) -> Dict[str, Any]:
+    """
+    태그 / 요약 / 감성 분석을 동시에 호출하고 예산 안에 도착한 결과만 반환
+
+    반환: {"tags": [...], "summary": str|None, "sentiment_score": float|None, "sentiment_label": str|None}
+    """
+    budget = ENRICHMENT_BUDGET if budget is None else budget
+    result = empty_enrichment()
+
+    async with model_client.client_scope(timeout=budget) as client:
+        tasks = {
+            asyncio.create_task(model_client.auto_tag_text(text, client=client)): "tags",
+            asyncio.create_task(model_client.summarize_text(text, client=client)): "summary",
+            asyncio.create_task(model_client.analyze_sentiment(text, client=client)): "sentiment",
+        }
+        done, pending = await asyncio.wait(tasks, timeout=budget)
+
+        if pending:
+            print(f"⚠️ AI 부가 정보 예산({budget}초) 초과, 미완료 호출 취소: {sorted(tasks[t] for t in pending)}")
+            for task in pending:
+                task.cancel()
+            # 클라이언트를 닫기 전에 취소가 끝나도록 대기
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    for task in done:
+        if task.exception() is not None:
+            print(f"⚠️ AI 부가 정보 호출 실패 ({tasks[task]}): {task.exception()}")
+            continue
+        _apply(result, tasks[task], task.result())
+    return result
+
+
+def _apply(result: Dict[str, Any], kind: str, value: Optional[Any]) -> None:
+    if not value:
+        return
+    if kind == "tags":
+        result["tags"] = _unique(value)
+    elif kind == "summary":
+        result["summary"] = value.get("summary")
+    elif kind == "sentiment":
+        result["sentiment_score"] = value.get("confidence")
+        result["sentiment_label"] = value.get("label")
+
+
+def _unique(tags: List[str]) -> List[str]:
+    # 같은 태그가 중복으로 오면 post_tags 복합 키가 충돌하므로 순서를 유지한 채 제거
+    return list(dict.fromkeys(tags))
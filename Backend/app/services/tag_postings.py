@@ -0,0 +1,178 @@
+"""
+태그별 최신 게시글 목록 캐시 (inverted index의 posting list).
+
+GET /api/posts?tag=... 는 post_tags (tag_id, post_id) 인덱스로 태그가 달린 게시글을 찾지만,
+자주 조회되는 태그는 (게시판, 태그)마다 최신 게시글의 (created_at, post_id) 목록을 메모리에 두고
+AND / OR 조합과 커서 페이지네이션을 DB 없이 계산합니다.
+- (게시판, 태그) 단위 LRU + TTL, 태그마다 최신 TAG_POSTINGS_DEPTH 건까지 보관
+- 잘린 목록(더 오래된 글이 DB에 남아 있음)은 가장 오래된 항목보다 새 구간에서만 정확
+  -> 요청한 페이지가 그 구간을 벗어나면 None (호출한 쪽이 SQL로 조회)
+- 게시글 작성 / 태그 재생성 시 캐시된 목록에 바로 반영, 삭제 시 제거
+  (다른 워커의 목록은 TTL 동안 이전 값일 수 있음, 지워진 게시글은 호출한 쪽이 발견하면 discard)
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+TAG_POSTINGS_MAXSIZE = int(os.getenv("TAG_POSTINGS_MAXSIZE", "512"))
+TAG_POSTINGS_DEPTH = int(os.getenv("TAG_POSTINGS_DEPTH", "500"))
+TAG_POSTINGS_TTL = float(os.getenv("TAG_POSTINGS_TTL", "60"))
+
+# (created_at, post_id) -> 목록 정렬 키 (최신순 = 내림차순)
+PostKey = Tuple[datetime, int]
+PostingsKey = Tuple[str, int]
+
+
+class Postings:
+    """(게시판, 태그) 하나의 최신 게시글 키 목록 (내림차순)"""
+
+    __slots__ = ("keys", "complete", "expires_at")
+
+    def __init__(self, keys: List[PostKey], complete: bool, expires_at: float):
+        self.keys = keys
+        self.complete = complete
+        self.expires_at = expires_at
+
+    @property
+    def floor(self) -> Optional[PostKey]:
+        """이 키 이상 구간에서만 정확 (전체 목록이면 None)"""
+        if self.complete or not self.keys:
+            return None
+        return self.keys[-1]
+
+
+def merge_postings(postings: List[Postings], match: str, before: Optional[PostKey],
+                   count: int) -> Optional[List[PostKey]]:
+    """
+    태그별 목록을 AND(all) / OR(any)로 합쳐 before보다 오래된 최신 count건
+
+    캐시 구간 안에서 count건을 채우지 못했는데 잘린 목록이 있으면 None (DB 조회 필요)
+    """
+    floors = [p.floor for p in postings if p.floor is not None]
+    boundary = max(floors) if floors else None
+
+    if match == "any":
+        candidates = set().union(*(p.keys for p in postings))
+    else:
+        candidates = set(postings[0].keys).intersection(*(p.keys for p in postings[1:]))
+    if before is not None:
+        candidates = {key for key in candidates if key < before}
+    if boundary is not None:
+        candidates = {key for key in candidates if key >= boundary}
+
+    ordered = sorted(candidates, reverse=True)
+    if len(ordered) >= count:
+        return ordered[:count]
+    if boundary is None:
+        return ordered
+    return None
+
+
+class TagPostingsCache:
+    """(board_type, tag_id) -> Postings (스레드 안전)"""
+
+    def __init__(self, maxsize: int = TAG_POSTINGS_MAXSIZE, depth: int = TAG_POSTINGS_DEPTH,
+                 ttl: float = TAG_POSTINGS_TTL):
+        self.maxsize = maxsize
+        self.depth = depth
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+        self._lists: "OrderedDict[PostingsKey, Postings]" = OrderedDict()
+        # (게시판, 태그) -> 마지막 변경 시각 (레플리카에서 읽은 목록을 저장해도 되는지 판단)
+        self._touched: Dict[PostingsKey, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, board_type: str, tag_id: int) -> Optional[Postings]:
+        key = (board_type, tag_id)
+        with self._lock:
+            postings = self._lists.get(key)
+            if postings is not None and postings.expires_at > time.monotonic():
+                self._lists.move_to_end(key)
+                self.hits += 1
+                return postings
+            if postings is not None:
+                del self._lists[key]
+            self.misses += 1
+            return None
+
+    def set(self, board_type: str, tag_id: int, keys: List[PostKey], store: bool = True) -> Postings:
+        """
+        DB에서 읽은 최신 키 목록 저장 (depth + 1건까지 읽어 넘기면 잘린 목록으로 기록)
+
+        store=False면 저장하지 않고 이번 요청에만 쓸 목록만 반환
+        """
+        postings = Postings(keys[:self.depth], len(keys) <= self.depth, time.monotonic() + self.ttl)
+        if not store:
+            return postings
+        with self._lock:
+            self._lists[(board_type, tag_id)] = postings
+            self._lists.move_to_end((board_type, tag_id))
+            while len(self._lists) > self.maxsize:
+                self._lists.popitem(last=False)
+        return postings
+
+    def add(self, board_type: str, tag_ids: Iterable[int], created_at: datetime, post_id: int) -> None:
+        """새로 태그가 달린 게시글을 캐시된 목록에 반영"""
+        entry = (created_at, post_id)
+        now = time.monotonic()
+        with self._lock:
+            for tag_id in tag_ids:
+                self._touched[(board_type, tag_id)] = now
+                postings = self._lists.get((board_type, tag_id))
+                if postings is None or entry in postings.keys:
+                    continue
+                # 다른 스레드가 읽는 중일 수 있어 제자리 정렬 대신 새 목록으로 교체
+                keys = sorted(postings.keys + [entry], reverse=True)
+                if len(keys) > self.depth:
+                    postings.complete = False
+                postings.keys = keys[:self.depth]
+            self._prune_touched(now)
+
+    def discard(self, post_ids: Iterable[int]) -> None:
+        """삭제된 게시글을 모든 목록에서 제거"""
+        removed = set(post_ids)
+        if not removed:
+            return
+        with self._lock:
+            for postings in self._lists.values():
+                postings.keys = [key for key in postings.keys if key[1] not in removed]
+
+    def touched_within(self, board_type: str, tag_id: int, seconds: float) -> bool:
+        with self._lock:
+            touched_at = self._touched.get((board_type, tag_id))
+        return touched_at is not None and touched_at > time.monotonic() - seconds
+
+    def record_fallback(self) -> None:
+        with self._lock:
+            self.fallbacks += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """진단용 카운터"""
+        with self._lock:
+            return {
+                "lists": len(self._lists),
+                "depth": self.depth,
+                "hits": self.hits,
+                "misses": self.misses,
+                "fallbacks": self.fallbacks,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._lists.clear()
+            self._touched.clear()
+            self.hits = self.misses = self.fallbacks = 0
+
+    def _prune_touched(self, now: float) -> None:
+        if len(self._touched) > self.maxsize * 4:
+            self._touched = {key: at for key, at in self._touched.items() if at > now - self.ttl}
+
+
+tag_postings = TagPostingsCache()
@@ -0,0 +1,163 @@
+"""
+태그 이름 -> id 일괄 조회 / 생성 + 게시글 태그 연결.
+
+태그마다 SELECT 한 번, 새 태그마다 flush 한 번을 하던 것을 게시글당 고정된 왕복 수로 줄입니다.
+- 프로세스 내 name -> id LRU 캐시 (모두 캐시에 있으면 조회 쿼리 없음)
+- 캐시에 없는 이름은 IN 쿼리 한 번, 그래도 없는 이름은 여러 행 INSERT 한 번
+  (tags.name unique 충돌은 무시 -> 동시에 같은 새 태그로 글을 써도 IntegrityError 없음) 후 IN 쿼리로 id 확인
+- post_tags는 INSERT ... SELECT 한 번으로 연결 (관리자 페이지에서 지워진 태그는 건너뛰므로 FK 위반 없음)
+  -> 연결된 수가 모자라면 캐시가 오래된 것이므로 캐시 없이 다시 조회 / 생성해 연결
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.post import Tag, post_tags
+
+TAG_CACHE_MAXSIZE = int(os.getenv("TAG_CACHE_MAXSIZE", "10000"))
+
+
+def _unique_names(names: Iterable[str]) -> List[str]:
+    return [name for name in dict.fromkeys(names) if name]
+
+
+def _insert_ignoring_duplicates(dialect_name: str, names: List[str]):
+    """이미 있는 이름은 건너뛰는 여러 행 INSERT"""
+    rows = [{"name": name} for name in names]
+    if dialect_name in ("mysql", "mariadb"):
+        stmt = mysql.insert(Tag).values(rows)
+        return stmt.on_duplicate_key_update(name=stmt.inserted.name)
+    if dialect_name == "sqlite":
+        return sqlite.insert(Tag).values(rows).on_conflict_do_nothing(index_elements=["name"])
+    if dialect_name == "postgresql":
+        return postgresql.insert(Tag).values(rows).on_conflict_do_nothing(index_elements=["name"])
+    return insert(Tag).values(rows)
+
+
+class TagResolver:
+    """태그 name -> id 캐시와 일괄 조회 / 생성 (스레드 안전)"""
+
+    def __init__(self, maxsize: int = TAG_CACHE_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self.stale = 0
+        self._ids: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, db: Session, names: Iterable[str], use_cache: bool = True) -> Dict[str, int]:
+        """태그 이름 -> id (없는 태그는 생성, 호출한 세션의 트랜잭션 안에서 실행)"""
+        names = _unique_names(names)
+        ids = self._cached(names) if use_cache else {}
+        missing = [name for name in names if name not in ids]
+        if not missing:
+            return ids
+
+        ids.update(self._select(db, missing))
+        new = [name for name in missing if name not in ids]
+        if new:
+            db.execute(_insert_ignoring_duplicates(db.get_bind().dialect.name, new))
+            ids.update(self._select(db, new))
+            with self._lock:
+                self.created += len(new)
+        self._remember({name: ids[name] for name in missing if name in ids})
+        return ids
+
+    def lookup(self, db: Session, names: Iterable[str]) -> Dict[str, int]:
+        """이미 있는 태그만 이름 -> id (조회 전용, 없는 이름은 결과에서 빠짐)"""
+        names = _unique_names(names)
+        ids = self._cached(names)
+        missing = [name for name in names if name not in ids]
+        if missing:
+            found = self._select(db, missing)
+            self._remember(found)
+            ids.update(found)
+        return ids
+
+    def attach(self, db: Session, post_id: int, names: Iterable[str], replace: bool = False) -> List[int]:
+        """
+        게시글의 태그를 names로 설정 (post_tags 연결) -> 연결한 tag_id 목록
+
+        replace=True면 기존 연결을 먼저 지움 (부가 정보 재생성 등 이미 태그가 있을 수 있는 게시글)
+        """
+        names = _unique_names(names)
+        if replace:
+            db.execute(delete(post_tags).where(post_tags.c.post_id == post_id))
+        if not names:
+            return []
+
+        ids = self.resolve(db, names)
+        if self._link(db, post_id, ids) < len(names):
+            # 캐시에 있던 태그가 그 사이 삭제됨 -> 이번 연결을 지우고 캐시 없이 다시
+            with self._lock:
+                self.stale += 1
+            self.forget(names)
+            db.execute(delete(post_tags).where(post_tags.c.post_id == post_id))
+            ids = self.resolve(db, names, use_cache=False)
+            self._link(db, post_id, ids)
+        return list(ids.values())
+
+    def forget(self, names: Iterable[str]) -> None:
+        with self._lock:
+            for name in names:
+                self._ids.pop(name, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """진단용 카운터"""
+        with self._lock:
+            return {
+                "cached": len(self._ids),
+                "hits": self.hits,
+                "misses": self.misses,
+                "created": self.created,
+                "stale": self.stale,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self.hits = self.misses = self.created = self.stale = 0
+
+    @staticmethod
+    def _select(db: Session, names: List[str]) -> Dict[str, int]:
+        return {name: tag_id for tag_id, name in db.execute(select(Tag.id, Tag.name).where(Tag.name.in_(names)))}
+
+    @staticmethod
+    def _link(db: Session, post_id: int, ids: Dict[str, int]) -> int:
+        """존재하는 태그만 post_tags에 연결 -> 연결된 행 수"""
+        stmt = insert(post_tags).from_select(
+            ["post_id", "tag_id"],
+            select(literal(post_id), Tag.id).where(Tag.id.in_(list(ids.values()))).order_by(Tag.id),
+        )
+        return db.execute(stmt).rowcount
+
+    def _cached(self, names: List[str]) -> Dict[str, int]:
+        found = {}
+        with self._lock:
+            for name in names:
+                tag_id = self._ids.get(name)
+                if tag_id is not None:
+                    self._ids.move_to_end(name)
+                    found[name] = tag_id
+            self.hits += len(found)
+            self.misses += len(names) - len(found)
+        return found
+
+    def _remember(self, ids: Dict[str, int]) -> None:
+        with self._lock:
+            for name, tag_id in ids.items():
+                self._ids[name] = tag_id
+                self._ids.move_to_end(name)
+            while len(self._ids) > self.maxsize:
+                self._ids.popitem(last=False)
+
+
+tag_resolver = TagResolver()
@@ -0,0 +1,148 @@
+"""
+게시글 조회수 write-behind 버퍼.
+
+PATCH /api/posts/{id}/view 마다 SELECT + UPDATE + COMMIT 하던 것을
+메모리에서 누적한 뒤 주기적으로(또는 누적량이 임계치를 넘으면) 한 번의 UPDATE로 반영합니다.
+- DB 반영은 항상 `view_count = view_count + n` 상대 증가라 여러 워커가 각자 버퍼를 가져도 안전
+- 게시글별 기준값(DB 조회수)은 최초 조회 시 한 번 읽고, flush 이후 다시 읽어 다른 워커의 반영분을 따라감
+- 응답 조회수 = 기준값 + flush 중인 증가분 + 미반영 증가분
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import Callable, Dict
+
+from sqlalchemy import case, update
+from sqlalchemy.orm import Session
+
+from app.models.post import Post
+from app.services.post_cache import post_cache
+
+FLUSH_INTERVAL = float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "5"))
+FLUSH_THRESHOLD = int(os.getenv("VIEW_COUNT_FLUSH_THRESHOLD", "1000"))
+
+
+class ViewCountBuffer:
+    """post_id -> 미반영 조회수 증가분"""
+
+    def __init__(self, flush_threshold: int = FLUSH_THRESHOLD):
+        self.flush_threshold = flush_threshold
+        self._pending: Dict[int, int] = {}
+        self._pending_total = 0
+        self._inflight: Dict[int, int] = {}
+        self._base: Dict[int, int] = {}
+        # flush 커밋마다 증가: 기준값을 읽는 동안 커밋된 flush가 있으면 읽은 값을 캐시하지 않음
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def increment(self, db: Session, post_id: int) -> int | None:
+        """조회수 1 증가 후 현재 조회수 반환 (게시글이 없으면 None)"""
+        with self._lock:
+            base = self._base.get(post_id)
+            generation = self._generation
+
+        if base is None:
+            row = db.query(Post.view_count).filter(Post.id == post_id).first()
+            if row is None:
+                return None
+            with self._lock:
+                if generation == self._generation:
+                    base = self._base.setdefault(post_id, row[0] or 0)
+                else:
+                    # 커밋 전 값일 수 있으므로 이번 응답에만 쓰고 다음 조회에서 다시 읽음
+                    base = row[0] or 0
+
+        with self._lock:
+            self._pending[post_id] = self._pending.get(post_id, 0) + 1
+            self._pending_total += 1
+            view_count = base + self._inflight.get(post_id, 0) + self._pending[post_id]
+            should_flush = self._pending_total >= self.flush_threshold
+
+        if should_flush:
+            # 다른 flush가 진행 중이면 기다리지 않고 다음 주기에 맡김
+            self.flush(db, wait=False)
+        return view_count
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 증가분 (목록/상세 응답 보정용)"""
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def forget(self, post_id: int) -> None:
+        """삭제된 게시글의 버퍼 정리"""
+        with self._lock:
+            self._pending_total -= self._pending.pop(post_id, 0)
+            self._base.pop(post_id, None)
+
+    def flush(self, db: Session, wait: bool = True) -> int:
+        """누적된 증가분을 한 번의 UPDATE로 반영하고 반영한 조회수 합계 반환"""
+        if not self._flush_lock.acquire(blocking=wait):
+            return 0
+        try:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending, self._pending_total = self._pending, {}, 0
+                self._inflight = batch
+
+            try:
+                db.execute(
+                    update(Post)
+                    .where(Post.id.in_(batch.keys()))
+                    .values(view_count=Post.view_count + case(batch, value=Post.id, else_=0))
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+                with self._lock:
+                    self._inflight = {}
+                    self._generation += 1
+                    # 커밋 후 기준값을 버려 다음 조회 때 반영된 DB 값(다른 워커의 반영분 포함)을 다시 읽음
+                    # (flush 중에 읽어 둔 커밋 전 기준값도 함께 버림)
+                    for post_id in batch:
+                        self._base.pop(post_id, None)
+            except Exception:
+                db.rollback()
+                # 실패한 증가분은 다음 flush에서 재시도
+                with self._lock:
+                    for post_id, count in batch.items():
+                        self._pending[post_id] = self._pending.get(post_id, 0) + count
+                        self._pending_total += count
+                raise
+            finally:
+                with self._lock:
+                    self._inflight = {}
+            # 캐시된 상세 응답의 조회수 기준값도 갱신되도록 무효화
+            post_cache.invalidate_many(batch.keys())
+            return sum(batch.values())
+        finally:
+            self._flush_lock.release()
+
+    def flush_with(self, session_factory: Callable[[], Session]) -> int:
+        db = session_factory()
+        try:
+            return self.flush(db)
+        finally:
+            db.close()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._pending_total = 0
+            self._inflight = {}
+            self._base.clear()
+
+
+view_buffer = ViewCountBuffer()
+
+
+async def run_flush_loop(session_factory: Callable[[], Session], interval: float = FLUSH_INTERVAL):
+    """주기적으로 조회수 버퍼를 DB에 반영하는 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(view_buffer.flush_with, session_factory)
+        except Exception as e:
+            print(f"⚠️ 조회수 반영 실패 (다음 주기에 재시도): {e}")
@@ -0,0 +1,68 @@
+"""
+벤치마크용 임시 SQLite DB (운영 모델을 그대로 사용).
+
+운영 모델의 BigInteger PK는 SQLite에서 자동 증가하지 않으므로 INTEGER로 컴파일합니다.
+"""
+from __future__ import annotations
+
+import os
+import time
+
+from sqlalchemy import BigInteger, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.util import await_only
+
+
+@compiles(BigInteger, "sqlite")
+def _compile_big_integer_sqlite(type_, compiler, **kw):
+    return "INTEGER"
+
+
+def create_sqlite_session_factory(directory: str, name: str = "bench.db", **engine_kwargs):
+    """directory 아래에 테이블을 만든 SQLite DB와 세션 팩토리 반환 -> (engine, session_factory)"""
+    from app.core.database import Base
+    import app.models.user, app.models.post, app.models.comment  # noqa: F401  (테이블 등록)
+
+    engine = create_engine(f"sqlite:///{os.path.join(directory, name)}", connect_args={"check_same_thread": False},
+                           **engine_kwargs)
+    Base.metadata.create_all(engine)
+    return engine, sessionmaker(bind=engine, autoflush=False)
+
+
+def create_async_sqlite_session_factory(directory: str, name: str = "bench.db", **engine_kwargs):
+    """create_sqlite_session_factory로 만든 DB를 aiosqlite로 여는 async 세션 팩토리 -> (engine, session_factory)"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(directory, name)}",
+                                 connect_args={"timeout": 30}, **engine_kwargs)
+    return engine, async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+def add_query_latency(engine, seconds: float) -> None:
+    """
+    SQL 문마다 seconds 만큼 지연 (MySQL 왕복 시간 흉내)
+
+    SQLite trace 콜백은 문장을 실행하는 스레드에서 불리므로, 동기 드라이버면 호출한 스레드(이벤트 루프)가,
+    aiosqlite면 드라이버 스레드만 기다림 -> 네트워크 드라이버의 블로킹 / 비블로킹 대기와 같은 효과
+    """
+    def _sleep(_statement: str) -> None:
+        time.sleep(seconds)
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "connect")
+    def _install(dbapi_connection, connection_record):
+        if sync_engine is engine:
+            dbapi_connection.set_trace_callback(_sleep)
+        else:
+            await_only(dbapi_connection.driver_connection.set_trace_callback(_sleep))
+
+
+def create_bench_user(session_factory, email: str = "bench@example.com") -> int:
+    from app.models.user import User
+
+    with session_factory() as db:
+        user = User(email=email, password="x", nickname=email.split("@")[0])
+        db.add(user)
+        db.commit()
+        return user.id
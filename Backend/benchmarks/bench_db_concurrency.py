@@ -0,0 +1,160 @@
+"""
+DB 접근 동시성 벤치마크 (async 라우트 안의 동기 Session vs AsyncSession, 동시 클라이언트 100+).
+
+임시 SQLite DB에 게시글을 채우고, SQL 문마다 MySQL 왕복 시간(--rtt-ms)을 흉내 낸 뒤
+동시 클라이언트가 게시글 목록 / 댓글 목록을 반복 조회할 때의 초당 처리량(req/s)과 p50/p99를 비교합니다.
+- sync : 변경 전 구조. 동기 get_db + async 라우트 안에서 db.query(...) 실행 (쿼리를 기다리는 동안 이벤트 루프 정지)
+- async: 현재 앱 (AsyncSession + aiosqlite, 쿼리를 기다리는 동안 다른 요청 처리)
+
+    python -m benchmarks.bench_db_concurrency --clients 128 --requests 3000 --rtt-ms 2
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import List, Tuple
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from benchmarks._sqlite import (
+    add_query_latency, create_async_sqlite_session_factory, create_bench_user, create_sqlite_session_factory,
+)
+from benchmarks.bench_post_create import percentile
+
+
+def seed(session_factory, user_id: int, posts: int) -> List[int]:
+    from app.models.comment import Comment
+    from app.models.post import Post, Tag
+
+    with session_factory() as db:
+        tag = Tag(name="벤치마크")
+        post_ids = []
+        for i in range(posts):
+            post = Post(user_id=user_id, title=f"게시글 {i}", content=f"내용 {i}", board_type="couple",
+                        like_count=0, view_count=0, comment_count=2)
+            post.tags.append(tag)
+            post.comments.extend([Comment(user_id=user_id, content=f"댓글 {i}-{j}") for j in range(2)])
+            db.add(post)
+            db.flush()
+            post_ids.append(post.id)
+        db.commit()
+        return post_ids
+
+
+def legacy_app(session_factory) -> FastAPI:
+    """변경 전 라우터/컨트롤러 구조 (같은 쿼리를 동기 Session으로 실행)"""
+    from app.models.comment import Comment
+    from app.models.post import Post
+
+    app = FastAPI()
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/api/posts")
+    async def get_posts(board_type: str = "couple", limit: int = 10, db: Session = Depends(get_db)):
+        posts = db.query(Post)\
+            .options(joinedload(Post.user), selectinload(Post.tags))\
+            .filter(Post.board_type == board_type)\
+            .order_by(Post.created_at.desc(), Post.id.desc())\
+            .limit(limit + 1).all()[:limit]
+        data = [{"post_id": p.id, "nickname": p.user.nickname, "title": p.title,
+                 "tags": [t.name for t in p.tags]} for p in posts]
+        return {"message": "get_posts_success", "data": {"posts": data}}
+
+    @app.get("/api/posts/{post_id}/comments")
+    async def get_comments(post_id: int, db: Session = Depends(get_db)):
+        db.query(Post).filter(Post.id == post_id).first()
+        comments = db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.created_at.asc()).all()
+        data = [{"comment_id": c.id, "nickname": c.user.nickname, "content": c.content} for c in comments]
+        return {"message": "get_comments_success", "data": data}
+
+    return app
+
+
+def async_app(async_session_factory) -> FastAPI:
+    from app.core.database import get_db, get_primary_db, get_read_db
+    from app.main import app
+
+    async def override_get_db():
+        async with async_session_factory() as db:
+            yield db
+
+    # 읽기 라우트(get_read_db) / 조회수(get_primary_db)도 임시 DB로 (빠뜨리면 실제 DATABASE_URL에 연결)
+    for dependency in (get_db, get_read_db, get_primary_db):
+        app.dependency_overrides[dependency] = override_get_db
+    return app
+
+
+async def _run(app: FastAPI, post_ids: List[int], clients: int, requests: int) -> Tuple[float, List[float], int]:
+    latencies: List[float] = []
+    failed = 0
+    issued = 0
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as http:
+        async def client(client_no: int) -> None:
+            nonlocal issued, failed
+            while issued < requests:
+                n = issued
+                issued += 1
+                url = "/api/posts?limit=10&cursor=" if n % 2 else \
+                    f"/api/posts/{post_ids[(client_no + n) % len(post_ids)]}/comments"
+                started = time.perf_counter()
+                response = await http.get(url)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    failed += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client(i) for i in range(clients)))
+        elapsed = time.perf_counter() - started
+    return len(latencies) / elapsed, latencies, failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, nargs="+", default=[100, 200])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    # 기본 풀(5+10)이면 sync 모드는 연결을 기다리며 이벤트 루프를 멈추고, 연결을 돌려줄 세션 정리도
+    # 그 루프에서 돌기 때문에 풀 타임아웃까지 교착됨 -> 두 모드 모두 클라이언트 수만큼 풀을 잡고 쿼리 대기만 비교
+    pool = {"pool_size": max(args.clients), "max_overflow": 0}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, session_factory = create_sqlite_session_factory(tmp, **pool)
+        user_id = create_bench_user(session_factory)
+        post_ids = seed(session_factory, user_id, args.posts)
+        async_engine, async_session_factory = create_async_sqlite_session_factory(tmp, **pool)
+        add_query_latency(engine, args.rtt_ms / 1000)
+        add_query_latency(async_engine, args.rtt_ms / 1000)
+
+        apps = {"sync": legacy_app(session_factory), "async": async_app(async_session_factory)}
+        print(f"\n게시글/댓글 목록 조회 (요청 {args.requests}회, SQL 왕복 {args.rtt_ms:g}ms)")
+        print(f"{'mode':<8}{'clients':>8}{'req/s':>10}{'p50':>10}{'p99':>10}{'mean':>10}{'failed':>8}")
+        for clients in args.clients:
+            for mode, app in apps.items():
+                throughput, latencies, failed = asyncio.run(_run(app, post_ids, clients, args.requests))
+                print(f"{mode:<8}{clients:>8}{throughput:>10.1f}{percentile(latencies, 50):>10.1f}"
+                      f"{percentile(latencies, 99):>10.1f}{statistics.mean(latencies):>10.1f}{failed:>8}")
+                if mode == "async":
+                    # 이벤트 루프마다 새 aiosqlite 연결 사용
+                    asyncio.run(async_engine.dispose())
+
+        apps["async"].dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Model API 클라이언트 처리량 벤치마크 (호출별 클라이언트 vs 공유 커넥션 풀 vs 자동 배치).
+
+스텁 Model API에 analyze_sentiment를 동시에 호출해 초당 처리량(req/s)과 p50/p99를 비교합니다.
+호출마다 다른 텍스트를 보내고 매 실행 전에 결과 캐시를 비워 캐시 효과는 제외합니다.
+- per-call: 공유 클라이언트 없이 호출마다 httpx.AsyncClient 생성 (매번 TCP 연결)
+- shared  : model_client.start_client()로 만든 공유 클라이언트 (keep-alive 연결 재사용)
+- batched : 공유 클라이언트 + 자동 배치 (MODEL_API_BATCHING=true, /api/sentiment/batch)
+
+    python -m benchmarks.bench_model_client --requests 2000 --concurrency 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List, Tuple
+
+from benchmarks.bench_post_create import percentile
+from benchmarks.stub_model_api import run_stub_server
+
+
+async def _run(requests: int, concurrency: int, shared: bool,
+               batching: bool = False) -> Tuple[float, List[float], int]:
+    from app.services import model_client
+    from app.services.model_breaker import guards
+    from app.services.model_cache import model_cache
+
+    # 이전 실행의 캐시 / 서킷 / 타임아웃 표본이 다음 실행에 영향을 주지 않도록 초기화
+    model_cache.reset()
+    guards.reset()
+    model_client.batcher.enabled = batching
+    if shared:
+        await model_client.start_client()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    failures = 0
+
+    async def one_call(index: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            result = await model_client.analyze_sentiment(f"오늘 산책이 즐거웠다 {index}")
+            latencies.append((time.perf_counter() - started) * 1000)
+            if result is None:
+                failures += 1
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(one_call(index) for index in range(requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await model_client.close_client()
+    return requests / elapsed, latencies, failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.005, help="스텁 응답 지연 (초)")
+    parser.add_argument("--port", type=int, default=8102)
+    args = parser.parse_args()
+
+    os.environ["MODEL_API_URL"] = f"http://127.0.0.1:{args.port}/api"
+    from app.services.model_discovery import prober
+
+    # 바뀐 MODEL_API_URL을 후보로 다시 읽음
+    prober.reset()
+
+    results = {}
+    with run_stub_server(args.port, latency={"sentiment": args.latency}, jitter=0):
+        for mode, shared, batching in (("per-call", False, False), ("shared", True, False),
+                                       ("batched", True, True)):
+            # 연결 수립 비용을 공정하게 비교하도록 워밍업 후 측정
+            asyncio.run(_run(min(100, args.requests), args.concurrency, shared, batching))
+            results[mode] = asyncio.run(_run(args.requests, args.concurrency, shared, batching))
+
+    print(f"\nModel API 호출 처리량 (요청 {args.requests}회, 동시 {args.concurrency}, 스텁 지연 {args.latency * 1000:g}ms)")
+    print(f"{'mode':<12}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}{'failed':>8}")
+    for mode, (throughput, latencies, failures) in results.items():
+        print(f"{mode:<12}{throughput:>10.0f}{percentile(latencies, 50):>10.1f}"
+              f"{percentile(latencies, 99):>10.1f}{statistics.mean(latencies):>10.1f}{failures:>8}")
+
+
+if __name__ == "__main__":
+    main()
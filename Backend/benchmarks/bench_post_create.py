@@ -0,0 +1,106 @@
+"""
+게시글 작성 지연 벤치마크 (AI 부가 정보 순차 호출 vs 동시 호출).
+
+스텁 Model API를 띄우고 임시 SQLite DB에 create_post_controller를 반복 실행해 p50/p99를 비교합니다.
+- before: 호출마다 클라이언트를 새로 만들어 태그 -> 요약 -> 감성을 순서대로 기다리던 방식
+- after : post_enrichment.enrich_post_content (공유 클라이언트 + 동시 호출 + 예산)
+
+    python -m benchmarks.bench_post_create --requests 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from benchmarks._sqlite import create_async_sqlite_session_factory, create_bench_user, create_sqlite_session_factory
+from benchmarks.stub_model_api import run_stub_server
+
+
+async def sequential_enrichment(text: str) -> Dict[str, Any]:
+    """변경 전 create_post_controller의 AI 호출 순서를 그대로 재현"""
+    from app.services.model_client import analyze_sentiment, auto_tag_text, summarize_text
+
+    tags = await auto_tag_text(text)
+    summary_res = await summarize_text(text)
+    sentiment_res = await analyze_sentiment(text)
+    return {
+        "tags": tags or [],
+        "summary": summary_res.get("summary") if summary_res else None,
+        "sentiment_score": sentiment_res.get("confidence") if sentiment_res else None,
+        "sentiment_label": sentiment_res.get("label") if sentiment_res else None,
+    }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _measure(session_factory, user_id: int, requests: int) -> List[float]:
+    from app.controllers.post_controller import create_post_controller
+    from app.schemas import PostCreateReq
+
+    from app.services.model_cache import model_cache
+
+    # 결과 캐시 적중이 아니라 Model API 호출 지연을 재도록 요청마다 다른 본문 + 방식마다 캐시 초기화
+    model_cache.reset()
+    latencies = []
+    for i in range(requests):
+        req = PostCreateReq(title=f"벤치마크 {i}", content=f"오늘 강아지와 산책 공원 맛집 여행 {i}", board_type="couple")
+        async with session_factory() as db:
+            started = time.perf_counter()
+            await create_post_controller(req, user_id, db)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def _run_modes(directory: str, user_id: int, requests: int) -> Dict[str, List[float]]:
+    """같은 이벤트 루프에서 두 방식을 차례로 측정 (aiosqlite 연결은 만든 루프에 묶임)"""
+    engine, session_factory = create_async_sqlite_session_factory(directory)
+    results = {}
+    try:
+        with patch("app.controllers.post_controller.enrich_post_content", new=sequential_enrichment):
+            results["before (sequential)"] = await _measure(session_factory, user_id, requests)
+        results["after  (concurrent)"] = await _measure(session_factory, user_id, requests)
+    finally:
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--port", type=int, default=8101)
+    args = parser.parse_args()
+
+    os.environ["MODEL_API_URL"] = f"http://127.0.0.1:{args.port}/api"
+
+    from app.services.model_discovery import prober
+
+    # 바뀐 MODEL_API_URL을 후보로 다시 읽음
+    prober.reset()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, session_factory = create_sqlite_session_factory(tmp)
+        user_id = create_bench_user(session_factory)
+        engine.dispose()
+
+        with run_stub_server(args.port):
+            results = asyncio.run(_run_modes(tmp, user_id, args.requests))
+
+    print(f"\n게시글 작성 지연 (요청 {args.requests}회, ms)")
+    print(f"{'mode':<22}{'p50':>10}{'p99':>10}{'mean':>10}")
+    for mode, latencies in results.items():
+        print(f"{mode:<22}{percentile(latencies, 50):>10.1f}{percentile(latencies, 99):>10.1f}"
+              f"{statistics.mean(latencies):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
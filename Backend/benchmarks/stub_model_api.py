@@ -0,0 +1,135 @@
+"""
+벤치마크 / 테스트용 Model API 스텁 서버.
+
+실제 모델 없이 Model API와 같은 경로와 응답 형식을 흉내 내고, 엔드포인트별 지연을 설정할 수 있습니다.
+
+    python -m benchmarks.stub_model_api --port 8101 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from fastapi import FastAPI, Request
+
+# 엔드포인트별 기본 지연 (초)
+DEFAULT_LATENCY = {
+    "auto-tag": 0.03,
+    "summarize": 0.08,
+    "sentiment": 0.05,
+    "predict": 0.1,
+}
+
+
+def create_stub_app(latency: Optional[Dict[str, float]] = None, jitter: float = 0.2) -> FastAPI:
+    """
+    latency: 엔드포인트 이름 -> 평균 지연(초)
+    jitter: 지연에 곱해지는 무작위 편차 비율 (0.2 -> ±20%)
+    """
+    app = FastAPI(title="Stub Model API")
+    app.state.latency = {**DEFAULT_LATENCY, **(latency or {})}
+    app.state.jitter = jitter
+    app.state.calls = {name: 0 for name in app.state.latency}
+
+    async def _delay(name: str, latency_of: Optional[str] = None) -> None:
+        app.state.calls[name] = app.state.calls.get(name, 0) + 1
+        base = app.state.latency.get(latency_of or name, 0)
+        if base > 0:
+            await asyncio.sleep(base * random.uniform(1 - app.state.jitter, 1 + app.state.jitter))
+
+    @app.get("/")
+    async def root():
+        return {"message": "Stub Model API"}
+
+    @app.post("/api/auto-tag")
+    async def auto_tag(req: Request):
+        await _delay("auto-tag")
+        body = await req.json()
+        words = [w for w in body.get("text", "").split() if len(w) > 1]
+        return {"tags": words[:3]}
+
+    @app.post("/api/summarize")
+    async def summarize(req: Request):
+        await _delay("summarize")
+        body = await req.json()
+        return {"summary": body.get("text", "")[:50]}
+
+    @app.post("/api/sentiment")
+    async def sentiment(req: Request):
+        await _delay("sentiment")
+        return {"label": "positive", "confidence": 0.9}
+
+    # 배치 API: 요청 하나의 지연으로 여러 텍스트 처리 (호출 수는 "<이름>/batch"로 기록)
+    @app.post("/api/auto-tag/batch")
+    async def auto_tag_batch(req: Request):
+        await _delay("auto-tag/batch", "auto-tag")
+        body = await req.json()
+        return {"results": [{"tags": [w for w in text.split() if len(w) > 1][:3]} for text in body["texts"]],
+                "errors": []}
+
+    @app.post("/api/summarize/batch")
+    async def summarize_batch(req: Request):
+        await _delay("summarize/batch", "summarize")
+        body = await req.json()
+        return {"results": [{"summary": text[:50]} for text in body["texts"]], "errors": []}
+
+    @app.post("/api/sentiment/batch")
+    async def sentiment_batch(req: Request):
+        await _delay("sentiment/batch", "sentiment")
+        body = await req.json()
+        return {"results": [{"label": "positive", "confidence": 0.9} for _ in body["texts"]], "errors": []}
+
+    @app.post("/api/predict")
+    async def predict():
+        await _delay("predict")
+        return {"class_name": "Dog", "confidence_score": 0.9}
+
+    return app
+
+
+def free_port() -> int:
+    """사용 가능한 로컬 포트 하나"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def run_stub_server(port: int, latency: Optional[Dict[str, float]] = None,
+                    jitter: float = 0.2) -> Iterator[FastAPI]:
+    """스텁 서버를 백그라운드 스레드에서 실행 (uvicorn 필요)"""
+    import uvicorn
+
+    app = create_stub_app(latency, jitter)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline or not thread.is_alive():
+            raise RuntimeError(f"스텁 Model API 서버 시작 실패 (port={port})")
+        time.sleep(0.02)
+    try:
+        yield app
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Stub Model API")
+    parser.add_argument("--port", type=int, default=8101)
+    parser.add_argument("--latency", type=float, default=None, help="모든 엔드포인트 공통 지연 (초)")
+    args = parser.parse_args()
+
+    latency = {name: args.latency for name in DEFAULT_LATENCY} if args.latency is not None else None
+    uvicorn.run(create_stub_app(latency), host="127.0.0.1", port=args.port)
@@ -1,7 +1,10 @@
 from app.core.database import engine, Base
 from app.models import user, post, comment
+from migrate import stamp
 
 # Create all tables
 print("Creating tables...")
 Base.metadata.create_all(bind=engine)
+# 최신 모델로 생성했으므로 마이그레이션은 모두 적용된 것으로 기록
+stamp(engine)
 print("Tables created successfully!")
@@ -21,9 +21,13 @@ CREATE TABLE posts (
     sentiment_score FLOAT,
     sentiment_label VARCHAR(50),
     view_count INT DEFAULT 0,
+    comment_count INT NOT NULL DEFAULT 0,
+    enrichment_status VARCHAR(20) NOT NULL DEFAULT 'done',
+    enrichment_hash VARCHAR(64),
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX idx_posts_board_created (board_type, created_at, id)
 );
 
 -- Comments Table
@@ -61,5 +65,6 @@ CREATE TABLE post_tags (
     tag_id BIGINT NOT NULL,
     PRIMARY KEY (post_id, tag_id),
     FOREIGN KEY (post_id) REFERENCES posts(id) ON DELETE CASCADE,
-    FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
+    FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE,
+    INDEX idx_post_tags_tag_post (tag_id, post_id)
 );
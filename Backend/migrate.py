@@ -0,0 +1,89 @@
+"""
+스키마 마이그레이션 실행 스크립트 (Alembic 방식의 revision 체인)
+
+사용법:
+    python migrate.py              # 미적용 revision 모두 upgrade
+    python migrate.py downgrade    # 마지막 revision 1개 downgrade
+    python migrate.py stamp        # create_tables.py로 최신 스키마를 만든 경우 전체를 적용됨으로 기록
+
+migrations/ 폴더의 각 파일은 revision / down_revision / upgrade(conn) / downgrade(conn)을 정의합니다.
+적용 이력은 schema_migrations 테이블에 기록됩니다.
+"""
+import importlib.util
+import os
+import sys
+
+from sqlalchemy import text
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+
+def load_revisions():
+    """down_revision 체인 순서대로 정렬된 마이그레이션 모듈 목록"""
+    modules = {}
+    for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+        if not filename.endswith(".py") or filename.startswith("__"):
+            continue
+        spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(MIGRATIONS_DIR, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules[module.down_revision] = module
+
+    ordered = []
+    current = None
+    while current in modules:
+        module = modules[current]
+        ordered.append(module)
+        current = module.revision
+    return ordered
+
+
+def _applied_revisions(conn):
+    conn.execute(text("CREATE TABLE IF NOT EXISTS schema_migrations (revision VARCHAR(32) PRIMARY KEY)"))
+    return [row[0] for row in conn.execute(text("SELECT revision FROM schema_migrations"))]
+
+
+def upgrade(engine):
+    with engine.begin() as conn:
+        applied = set(_applied_revisions(conn))
+    for module in load_revisions():
+        if module.revision in applied:
+            continue
+        with engine.begin() as conn:
+            print(f"⬆️ upgrade {module.revision}: {module.__doc__.splitlines()[0]}")
+            module.upgrade(conn)
+            conn.execute(text("INSERT INTO schema_migrations (revision) VALUES (:rev)"), {"rev": module.revision})
+
+
+def downgrade(engine):
+    with engine.begin() as conn:
+        applied = set(_applied_revisions(conn))
+    for module in reversed(load_revisions()):
+        if module.revision not in applied:
+            continue
+        with engine.begin() as conn:
+            print(f"⬇️ downgrade {module.revision}: {module.__doc__.splitlines()[0]}")
+            module.downgrade(conn)
+            conn.execute(text("DELETE FROM schema_migrations WHERE revision = :rev"), {"rev": module.revision})
+        return
+
+
+def stamp(engine):
+    with engine.begin() as conn:
+        applied = set(_applied_revisions(conn))
+        for module in load_revisions():
+            if module.revision not in applied:
+                conn.execute(text("INSERT INTO schema_migrations (revision) VALUES (:rev)"), {"rev": module.revision})
+
+
+if __name__ == "__main__":
+    from app.core.database import engine
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    if command == "downgrade":
+        downgrade(engine)
+    elif command == "stamp":
+        stamp(engine)
+    else:
+        upgrade(engine)
+    print("Migrations finished!")
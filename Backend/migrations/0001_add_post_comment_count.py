@@ -0,0 +1,23 @@
+"""posts.comment_count 컬럼 추가 및 백필
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+from sqlalchemy import text
+
+revision = "0001"
+down_revision = None
+
+
+def upgrade(conn):
+    conn.execute(text("ALTER TABLE posts ADD COLUMN comment_count INT NOT NULL DEFAULT 0"))
+    # 기존 댓글 수 백필
+    conn.execute(text(
+        "UPDATE posts SET comment_count = "
+        "(SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id)"
+    ))
+
+
+def downgrade(conn):
+    conn.execute(text("ALTER TABLE posts DROP COLUMN comment_count"))
@@ -0,0 +1,21 @@
+"""posts.enrichment_status / enrichment_hash 컬럼 추가
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+from sqlalchemy import text
+
+revision = "0002"
+down_revision = "0001"
+
+
+def upgrade(conn):
+    # 기존 게시글은 작성 시 동기 방식으로 부가 정보를 채웠으므로 done
+    conn.execute(text("ALTER TABLE posts ADD COLUMN enrichment_status VARCHAR(20) NOT NULL DEFAULT 'done'"))
+    conn.execute(text("ALTER TABLE posts ADD COLUMN enrichment_hash VARCHAR(64)"))
+
+
+def downgrade(conn):
+    conn.execute(text("ALTER TABLE posts DROP COLUMN enrichment_hash"))
+    conn.execute(text("ALTER TABLE posts DROP COLUMN enrichment_status"))
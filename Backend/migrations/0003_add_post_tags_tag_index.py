@@ -0,0 +1,23 @@
+"""post_tags (tag_id, post_id) 인덱스 추가 (태그별 게시글 조회)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+"""
+from sqlalchemy import text
+
+revision = "0003"
+down_revision = "0002"
+
+
+def upgrade(conn):
+    conn.execute(text("CREATE INDEX idx_post_tags_tag_post ON post_tags (tag_id, post_id)"))
+
+
+def downgrade(conn):
+    if conn.dialect.name == "mysql":
+        # tag_id 외래 키가 쓸 인덱스를 먼저 만들어야 DROP 가능
+        conn.execute(text("CREATE INDEX tag_id ON post_tags (tag_id)"))
+        conn.execute(text("DROP INDEX idx_post_tags_tag_post ON post_tags"))
+    else:
+        conn.execute(text("DROP INDEX idx_post_tags_tag_post"))
@@ -0,0 +1,21 @@
+"""posts (board_type, created_at, id) 인덱스 추가 (게시판별 keyset 목록 조회)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+"""
+from sqlalchemy import text
+
+revision = "0004"
+down_revision = "0003"
+
+
+def upgrade(conn):
+    conn.execute(text("CREATE INDEX idx_posts_board_created ON posts (board_type, created_at, id)"))
+
+
+def downgrade(conn):
+    if conn.dialect.name == "mysql":
+        conn.execute(text("DROP INDEX idx_posts_board_created ON posts"))
+    else:
+        conn.execute(text("DROP INDEX idx_posts_board_created"))
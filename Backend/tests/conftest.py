@@ -2,18 +2,20 @@
 pytest configuration and fixtures for FASTAPI_Project_back
 
 테스트 설정 및 공통 Fixture 정의
-- 인메모리 SQLite 데이터베이스로 격리된 테스트 환경 제공
+- 임시 파일 SQLite 데이터베이스로 격리된 테스트 환경 제공
+  (API는 aiosqlite async 엔진, 테스트 데이터 준비 / 백그라운드 작업은 같은 파일의 동기 엔진)
 - 각 테스트마다 깨끗한 DB 상태 보장
 """
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, ForeignKey, Float, Table
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, DateTime, ForeignKey, Float, Index, Table, UniqueConstraint
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, relationship
-from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from unittest.mock import patch, MagicMock
 import hashlib
+import tempfile
 
 # 상대 임포트를 위한 sys.path 설정
 import sys
@@ -21,20 +23,49 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.main import app
-from app.core.database import get_db
+from app.core import database
+from app.core.database import get_db, get_primary_db, get_read_db
+from app.services.board_counter import board_counter
+from app.services.view_counter import view_buffer
+from app.services.post_cache import post_cache
+from app.services.image_backfill import image_backfill
+from app.services.enrichment_worker import enrichment_pool
+from app.services.model_discovery import prober
+from app.services.model_balancer import balancer
+from app.services.model_breaker import guards
+from app.services.model_cache import model_cache
+from app.services.model_client import batcher
+from app.services.tag_resolver import tag_resolver
+from app.services.tag_postings import tag_postings
 
 # ============================================================================
 # 테스트 데이터베이스 설정
 # ============================================================================
 
 TestBase = declarative_base()
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# 동기 엔진과 async 엔진이 같은 DB를 보도록 인메모리 대신 임시 파일 사용
+TEST_DB_PATH = os.path.join(tempfile.mkdtemp(prefix="backend-tests-"), "test.db")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{TEST_DB_PATH}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_DB_PATH}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    connect_args={"check_same_thread": False, "timeout": 30},
 )
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, connect_args={"timeout": 30})
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """MySQL과 동일하게 ON DELETE CASCADE가 동작하도록 SQLite FK 제약 활성화 (테스트 속도를 위해 fsync 생략)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.close()
+
+
+event.listen(engine, "connect", _enable_sqlite_foreign_keys)
+event.listen(async_engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+
 
 # Many-to-Many association table for Post and Tag
 test_post_tags = Table(
@@ -42,6 +73,7 @@ test_post_tags = Table(
     TestBase.metadata,
     Column("post_id", Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True),
     Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Index("idx_post_tags_tag_post", "tag_id", "post_id"),
 )
 
 
@@ -76,6 +108,9 @@ class TestPost(TestBase):
     sentiment_label = Column(String(50), nullable=True)
     like_count = Column(Integer, default=0)
     view_count = Column(Integer, default=0)
+    comment_count = Column(Integer, default=0, nullable=False)
+    enrichment_status = Column(String(20), default="done", nullable=False)
+    enrichment_hash = Column(String(64), nullable=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
@@ -93,6 +128,8 @@ class TestPostLike(TestBase):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime, default=func.now())
 
+    __table_args__ = (UniqueConstraint("post_id", "user_id", name="unique_like"),)
+
 
 class TestComment(TestBase):
     """테스트용 Comment 모델"""
@@ -115,19 +152,18 @@ class TestTag(TestBase):
 
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False,
+                                              expire_on_commit=False)
 
 
 # ============================================================================
 # 헬퍼 함수
 # ============================================================================
 
-def override_get_db():
-    """테스트용 데이터베이스 세션 의존성"""
-    try:
-        db = TestingSessionLocal()
+async def override_get_db():
+    """테스트용 데이터베이스 세션 의존성 (async)"""
+    async with TestingAsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 def simple_hash(password: str) -> str:
@@ -150,6 +186,19 @@ def test_db():
     TestBase.metadata.create_all(bind=engine)
     yield
     TestBase.metadata.drop_all(bind=engine)
+    # 프로세스 단위 캐시 초기화
+    board_counter.reset()
+    view_buffer.reset()
+    post_cache.reset()
+    image_backfill.reset()
+    enrichment_pool.reset()
+    prober.reset()
+    balancer.reset()
+    guards.reset()
+    model_cache.reset()
+    batcher.reset()
+    tag_resolver.reset()
+    tag_postings.reset()
 
 
 @pytest.fixture(scope="function")
@@ -161,11 +210,52 @@ def client(test_db):
     테스트 종료 후 자동으로 정리됨
     """
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
+    app.dependency_overrides[get_primary_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    # 백그라운드 작업도 테스트 DB를 사용하도록 교체
+    with patch("app.core.database.SessionLocal", TestingSessionLocal):
+        with TestClient(app) as test_client:
+            yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def replica(test_db, tmp_path):
+    """
+    읽기 레플리카 대역 (테스트 DB와 별개인 두 번째 SQLite 파일)
+
+    복제하지 않으므로 레플리카에 직접 넣은 데이터만 보임 -> 복제 지연 상황 재현
+    Yield: 레플리카용 동기 세션 팩토리 (데이터 준비용)
+    """
+    import asyncio
+
+    path = tmp_path / "replica.db"
+    replica_engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    TestBase.metadata.create_all(bind=replica_engine)
+    replica_async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    replica_session_factory = async_sessionmaker(replica_async_engine, class_=AsyncSession, autoflush=False,
+                                                 expire_on_commit=False, info={"replica": True})
+    with patch.object(database, "ReplicaSessionLocals", [replica_session_factory]), \
+            patch.object(database.read_router, "replicas", 1):
+        yield sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    database.read_router.reset()
+    asyncio.run(replica_async_engine.dispose())
+    replica_engine.dispose()
+
+
+@pytest.fixture
+def replica_client(replica):
+    """
+    primary(테스트 DB) + 레플리카 1대로 라우팅하는 테스트 클라이언트
+
+    get_db / get_read_db를 오버라이드하지 않고 세션 팩토리만 교체해 실제 라우팅 경로를 사용
+    """
+    with patch.object(database, "AsyncSessionLocal", TestingAsyncSessionLocal), \
+            patch("app.core.database.SessionLocal", TestingSessionLocal):
+        with TestClient(app) as test_client:
+            yield test_client
+
+
 @pytest.fixture
 def db_session(test_db):
     """직접 DB 조작이 필요할 때 사용하는 세션 Fixture"""
@@ -176,6 +266,35 @@ def db_session(test_db):
         session.close()
 
 
+@pytest.fixture
+def file_session_factory(tmp_path):
+    """
+    여러 스레드에서 동시에 접근하는 테스트용 세션 팩토리
+
+    인메모리 DB는 단일 커넥션을 공유하므로 동시성 테스트에는 파일 기반 SQLite 사용
+    """
+    file_engine = create_engine(
+        f"sqlite:///{tmp_path / 'concurrency.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    TestBase.metadata.create_all(bind=file_engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=file_engine)
+    file_engine.dispose()
+
+
+@pytest.fixture
+def file_async_session_factory(file_session_factory):
+    """file_session_factory와 같은 파일을 쓰는 async 세션 팩토리 (동시 요청 테스트용)"""
+    import asyncio
+
+    file_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{file_session_factory.kw['bind'].url.database}",
+        connect_args={"timeout": 30},
+    )
+    yield async_sessionmaker(file_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    asyncio.run(file_engine.dispose())
+
+
 # ============================================================================
 # 테스트 데이터 Fixture
 # ============================================================================
@@ -348,6 +467,8 @@ def created_comment(db_session, created_post, logged_in_user, test_comment_data)
         user_id=logged_in_user["user_id"]
     )
     db_session.add(comment)
+    post = db_session.get(TestPost, created_post["post_id"])
+    post.comment_count += 1
     db_session.commit()
     db_session.refresh(comment)
 
@@ -359,6 +480,41 @@ def created_comment(db_session, created_post, logged_in_user, test_comment_data)
     }
 
 
+@pytest.fixture
+def post_factory(db_session, logged_in_user):
+    """
+    게시글 대량 생성 Fixture
+
+    댓글/좋아요/태그가 달린 게시글을 원하는 개수만큼 생성
+    created_at을 지정하면 모든 게시글이 같은 작성 시각을 가짐
+    """
+    def _create(count: int, board_type: str = "couple", with_relations: bool = True, created_at=None):
+        user_id = logged_in_user["user_id"]
+        tag_name = f"태그-{board_type}"
+        tag = db_session.query(TestTag).filter(TestTag.name == tag_name).first() or TestTag(name=tag_name)
+        post_ids = []
+        for i in range(count):
+            post = TestPost(
+                user_id=user_id,
+                title=f"게시글 {i}",
+                content=f"게시글 내용 {i}",
+                board_type=board_type,
+                created_at=created_at,
+                comment_count=1 if with_relations else 0
+            )
+            if with_relations:
+                post.tags.append(tag)
+                post.comments.append(TestComment(content=f"댓글 {i}", user_id=user_id))
+                post.likes.append(TestPostLike(user_id=user_id))
+            db_session.add(post)
+            db_session.flush()
+            post_ids.append(post.id)
+        db_session.commit()
+        return post_ids
+
+    return _create
+
+
 # ============================================================================
 # Mock Fixture (외부 서비스 의존성 제거)
 # ============================================================================
@@ -392,6 +548,36 @@ def mock_model_client():
 # 유틸리티 Fixture
 # ============================================================================
 
+@pytest.fixture
+def query_counter():
+    """
+    실행된 SQL 문 개수를 세는 Fixture
+
+    사용법: with query_counter() as counter: ... ; counter["count"]
+    """
+    from contextlib import contextmanager
+
+    @contextmanager
+    def _count():
+        counter = {"count": 0, "statements": []}
+
+        def _before_execute(conn, cursor, statement, parameters, context, executemany):
+            counter["count"] += 1
+            counter["statements"].append(statement)
+
+        # API(async 엔진)와 테스트 데이터 준비(동기 엔진)의 쿼리를 모두 셈
+        engines = (engine, async_engine.sync_engine)
+        for target in engines:
+            event.listen(target, "before_cursor_execute", _before_execute)
+        try:
+            yield counter
+        finally:
+            for target in engines:
+                event.remove(target, "before_cursor_execute", _before_execute)
+
+    return _count
+
+
 @pytest.fixture
 def valid_png_image():
     """유효한 PNG 이미지 바이너리 (1x1 픽셀)"""
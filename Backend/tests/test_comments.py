@@ -209,3 +209,39 @@ class TestCommentIntegration:
         
         assert delete_response.status_code == 200
         assert delete_response.json()["message"] == "delete_comment_success"
+
+
+class TestCommentCount:
+    """게시글 comment_count 컬럼 유지 테스트"""
+
+    def _comment_count(self, client, post_id):
+        return client.get(f"/api/posts/{post_id}").json()["data"]["comment_count"]
+
+    def test_comment_count_follows_create_and_delete(self, client, auth_header, created_post, test_comment_data):
+        """댓글 작성/삭제 시 comment_count가 함께 증감"""
+        post_id = created_post["post_id"]
+
+        first = client.post(f"/api/posts/{post_id}/comments", json=test_comment_data, headers=auth_header)
+        client.post(f"/api/posts/{post_id}/comments", json=test_comment_data, headers=auth_header)
+        assert self._comment_count(client, post_id) == 2
+
+        comment_id = first.json()["data"]["comment_id"]
+        client.delete(f"/api/posts/{post_id}/comments/{comment_id}", headers=auth_header)
+        assert self._comment_count(client, post_id) == 1
+
+        listed = client.get("/api/posts").json()["data"]["posts"]
+        assert listed[0]["comment_count"] == 1
+
+    def test_comment_count_after_user_withdrawal(self, client, auth_header, auth_header_2, created_post, test_comment_data):
+        """회원 탈퇴 시 다른 게시글에 남긴 댓글 수만큼 차감"""
+        post_id = created_post["post_id"]
+        client.post(f"/api/posts/{post_id}/comments", json=test_comment_data, headers=auth_header)
+        client.post(f"/api/posts/{post_id}/comments", json=test_comment_data, headers=auth_header_2)
+        client.post(f"/api/posts/{post_id}/comments", json=test_comment_data, headers=auth_header_2)
+        assert self._comment_count(client, post_id) == 3
+
+        response = client.delete("/api/users/profile", headers=auth_header_2)
+
+        assert response.status_code == 200
+        assert self._comment_count(client, post_id) == 1
+        assert len(client.get(f"/api/posts/{post_id}/comments").json()["data"]) == 1
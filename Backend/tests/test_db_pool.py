@@ -0,0 +1,87 @@
+"""
+DB 커넥션 풀 계측 테스트 케이스
+- 연결 대기 시간 / 사용 중 / overflow 연결 수 / 대기 타임아웃 횟수
+- dispose 후 다시 만든 풀에서도 계측 유지
+- 진단 API
+"""
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.core.db_pool import PoolMonitor
+
+
+@pytest.fixture
+def monitored_engine(tmp_path):
+    """풀 1개 + overflow 1개, 대기 타임아웃 0.05초인 SQLite 엔진과 모니터"""
+    monitor = PoolMonitor("test")
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=monitor.pool_class(),
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    monitor.attach(engine)
+    yield engine, monitor
+    engine.dispose()
+
+
+class TestPoolMonitor:
+    """커넥션 풀 지표 테스트"""
+
+    def test_records_checkouts_and_gauges(self, monitored_engine):
+        """풀 + overflow 연결을 모두 쓰는 동안 in_use / overflow 게이지, 반환 후 idle"""
+        engine, monitor = monitored_engine
+
+        first = engine.connect()
+        second = engine.connect()
+        busy = monitor.stats()
+        first.close()
+        second.close()
+        idle = monitor.stats()
+
+        assert (busy["in_use"], busy["overflow"]) == (2, 1)
+        assert (idle["in_use"], idle["overflow"], idle["idle"]) == (0, 0, 1)
+        assert idle["checkouts"] == 2
+        assert idle["peak_in_use"] == 2
+        assert idle["connects"] == 2
+        assert idle["wait_ms"]["p99"] is not None
+
+    def test_counts_checkout_timeouts(self, monitored_engine):
+        """풀이 가득 차면 pool_timeout 뒤 TimeoutError, 타임아웃 횟수와 최대 대기 시간 기록"""
+        engine, monitor = monitored_engine
+
+        held = [engine.connect(), engine.connect()]
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+        for connection in held:
+            connection.close()
+
+        stats = monitor.stats()
+        assert stats["timeouts"] == 1
+        assert stats["checkouts"] == 2
+        assert stats["wait_ms"]["max"] >= 50
+
+    def test_instrumentation_survives_dispose(self, monitored_engine):
+        """engine.dispose()로 풀을 다시 만들어도 같은 모니터에 기록"""
+        engine, monitor = monitored_engine
+
+        engine.dispose()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        stats = monitor.stats()
+        assert monitor.pool is engine.pool
+        assert stats["checkouts"] == 1
+        assert stats["size"] == 1
+
+    def test_diagnostics_endpoint(self, client):
+        """[성공] 진단 API에서 API / 백그라운드 엔진의 풀 설정과 지표 조회"""
+        response = client.get("/api/diagnostics/db-pool")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["message"] == "get_db_pool_diagnostics_success"
+        assert set(body["data"]) == {"api", "background", "replicas", "read_routing"}
+        for stats in (body["data"]["api"], body["data"]["background"]):
+            assert {"size", "max_overflow", "in_use", "overflow", "timeouts", "wait_ms"} <= set(stats)
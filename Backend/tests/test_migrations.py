@@ -0,0 +1,82 @@
+"""
+스키마 마이그레이션 테스트 케이스
+- migrations/ revision 체인 upgrade / downgrade
+"""
+import pytest
+from sqlalchemy import create_engine, text
+
+import migrate
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    """comment_count 컬럼이 없던 시점의 스키마를 가진 SQLite DB"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE posts (id INTEGER PRIMARY KEY, title VARCHAR(255), board_type VARCHAR(20), created_at DATETIME)"
+        ))
+        conn.execute(text("CREATE TABLE comments (id INTEGER PRIMARY KEY, post_id INTEGER, content TEXT)"))
+        conn.execute(text("CREATE TABLE post_tags (post_id INTEGER, tag_id INTEGER, PRIMARY KEY (post_id, tag_id))"))
+        conn.execute(text("INSERT INTO posts (id, title) VALUES (1, 'a'), (2, 'b')"))
+        conn.execute(text("INSERT INTO comments (post_id, content) VALUES (1, 'x'), (1, 'y'), (1, 'z')"))
+    yield engine
+    engine.dispose()
+
+
+class TestMigrations:
+    """마이그레이션 upgrade / downgrade 테스트"""
+
+    def test_upgrade_backfills_comment_count(self, legacy_engine):
+        """0001: comment_count 컬럼 추가 후 기존 댓글 수로 백필"""
+        migrate.upgrade(legacy_engine)
+
+        with legacy_engine.connect() as conn:
+            counts = dict(conn.execute(text("SELECT id, comment_count FROM posts")).all())
+            applied = [row[0] for row in conn.execute(text("SELECT revision FROM schema_migrations"))]
+
+        assert counts == {1: 3, 2: 0}
+        assert "0001" in applied
+
+    def test_upgrade_adds_enrichment_status(self, legacy_engine):
+        """0002: 기존 게시글의 enrichment_status는 done"""
+        migrate.upgrade(legacy_engine)
+
+        with legacy_engine.connect() as conn:
+            rows = conn.execute(text("SELECT enrichment_status, enrichment_hash FROM posts")).all()
+
+        assert rows == [("done", None), ("done", None)]
+
+    def test_upgrade_adds_post_tags_tag_index(self, legacy_engine):
+        """0003: 태그별 게시글 조회용 post_tags (tag_id, post_id) 인덱스"""
+        migrate.upgrade(legacy_engine)
+
+        with legacy_engine.connect() as conn:
+            columns = [row[2] for row in conn.execute(text("PRAGMA index_info('idx_post_tags_tag_post')"))]
+
+        assert columns == ["tag_id", "post_id"]
+
+    def test_upgrade_adds_posts_board_created_index(self, legacy_engine):
+        """0004: 게시판별 keyset 목록용 posts (board_type, created_at, id) 인덱스"""
+        migrate.upgrade(legacy_engine)
+
+        with legacy_engine.connect() as conn:
+            columns = [row[2] for row in conn.execute(text("PRAGMA index_info('idx_posts_board_created')"))]
+
+        assert columns == ["board_type", "created_at", "id"]
+
+    def test_upgrade_is_idempotent(self, legacy_engine):
+        """이미 적용된 revision은 다시 실행하지 않음"""
+        migrate.upgrade(legacy_engine)
+        migrate.upgrade(legacy_engine)
+
+    def test_downgrade_removes_last_revision(self, legacy_engine):
+        """downgrade 후 upgrade 하면 다시 적용됨"""
+        migrate.upgrade(legacy_engine)
+        revisions = [module.revision for module in migrate.load_revisions()]
+
+        migrate.downgrade(legacy_engine)
+
+        with legacy_engine.connect() as conn:
+            applied = {row[0] for row in conn.execute(text("SELECT revision FROM schema_migrations"))}
+        assert applied == set(revisions[:-1])
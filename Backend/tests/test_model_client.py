@@ -0,0 +1,685 @@
+"""
+Model API 클라이언트 테스트 케이스
+
+테스트 대상:
+- 앱 lifespan에서 만든 공유 httpx.AsyncClient 재사용
+- 엔드포인트별 타임아웃
+- 공유 클라이언트가 없을 때 호출별 임시 클라이언트로 동작
+- 백그라운드 프로버의 엔드포인트 선택 (요청 경로에서 탐색하지 않음)
+- 여러 Model API 레플리카 간 로드 밸런싱 / 실패 레플리카 제외 (로컬 스텁 서버 여러 대)
+- 엔드포인트별 서킷 브레이커 (즉시 실패 / half-open 복구) 와 지연 백분위수 기반 적응형 타임아웃
+- 텍스트 분석 결과 캐시 (내용 해시 키, LRU + TTL) 와 동시 요청 합치기
+- 동시에 들어온 텍스트 분석 호출의 자동 배치 (/batch API, 미지원 서버는 단건 대체)
+"""
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from contextlib import ExitStack
+
+from app.services import model_client
+from app.services.model_balancer import ReplicaBalancer, balancer
+from app.services.model_cache import ModelResultCache, cache_key, model_cache
+from app.services.model_breaker import (
+    AdaptiveTimeout, CircuitBreaker, CircuitOpenError, STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, guards,
+)
+from app.services.model_discovery import ModelEndpointProber, prober
+from benchmarks.stub_model_api import free_port, run_stub_server
+
+
+@pytest.fixture
+def no_result_cache():
+    """호출마다 요청이 나가는지 보는 테스트용 (결과 캐시 끄기)"""
+    with patch.object(model_cache, "enabled", False):
+        yield
+
+
+@pytest.fixture
+def model_api(no_result_cache):
+    """요청을 기록하는 가짜 Model API (httpx.MockTransport)"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        path = request.url.path
+        if path.endswith("/sentiment"):
+            return httpx.Response(200, json={"label": "positive", "confidence": 0.9})
+        if path.endswith("/summarize"):
+            return httpx.Response(200, json={"summary": "요약"})
+        if path.endswith("/auto-tag"):
+            return httpx.Response(200, json={"tags": ["산책"]})
+        return httpx.Response(404)
+
+    prober.reset(["http://model.test/api"])
+    guards.reset()
+    yield requests, httpx.MockTransport(handler)
+    prober.reset()
+    guards.reset()
+
+
+class TestSharedClient:
+    """공유 클라이언트 lifecycle 테스트"""
+
+    def test_calls_reuse_shared_client(self, model_api):
+        """
+        [성공] start_client 이후 모든 호출이 같은 클라이언트를 사용하고 엔드포인트별 타임아웃 적용
+        """
+        requests, transport = model_api
+
+        async def scenario():
+            shared = await model_client.start_client(transport=transport)
+            try:
+                assert await model_client.start_client() is shared
+                sentiment = await model_client.analyze_sentiment("좋아요")
+                summary = await model_client.summarize_text("본문")
+                tags = await model_client.auto_tag_text("본문")
+                return shared, sentiment, summary, tags
+            finally:
+                await model_client.close_client()
+
+        shared, sentiment, summary, tags = asyncio.run(scenario())
+
+        assert sentiment["label"] == "positive"
+        assert summary["summary"] == "요약"
+        assert tags == ["산책"]
+        assert shared.is_closed
+        assert model_client.get_shared_client() is None
+
+        timeouts = {request.url.path.rsplit("/", 1)[-1]: request.extensions["timeout"] for request in requests}
+        assert timeouts["sentiment"]["read"] == model_client.ENDPOINT_TIMEOUTS["sentiment"]
+        assert timeouts["auto-tag"]["read"] == model_client.ENDPOINT_TIMEOUTS["auto-tag"]
+        assert timeouts["auto-tag"]["connect"] == model_client.MODEL_API_CONNECT_TIMEOUT
+
+    def test_client_scope_falls_back_without_shared_client(self):
+        """
+        [성공] lifespan 밖에서는 범위 전용 임시 클라이언트를 만들고 닫음
+        """
+
+        async def scenario():
+            async with model_client.client_scope() as client:
+                assert model_client.get_shared_client() is None
+                return client
+
+        client = asyncio.run(scenario())
+        assert client.is_closed
+
+    def test_app_lifespan_manages_shared_client(self, client):
+        """
+        [성공] 앱 실행 중에는 공유 클라이언트가 열려 있음
+        """
+        shared = model_client.get_shared_client()
+        assert shared is not None and not shared.is_closed
+
+    def test_http2_falls_back_without_h2(self):
+        """
+        [성공] h2 패키지가 없으면 HTTP/1.1로 연결
+        """
+        with patch.object(model_client, "MODEL_API_HTTP2", True), \
+                patch.dict("sys.modules", {"h2": None}):
+            assert model_client._http2_enabled() is False
+
+
+class TestEndpointDiscovery:
+    """Model API 엔드포인트 백그라운드 탐색 테스트"""
+
+    def _transport(self, up):
+        """up에 포함된 host만 응답하는 가짜 서버들"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host not in up:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200, json={"message": "ok"})
+
+        return httpx.MockTransport(handler)
+
+    def _probe(self, discovery, up):
+        async def scenario():
+            async with httpx.AsyncClient(transport=self._transport(up)) as client:
+                return await discovery.probe_once(client)
+
+        return asyncio.run(scenario())
+
+    def test_request_path_never_probes(self):
+        """
+        [성공] 탐색 전에도 current()는 I/O 없이 기본 엔드포인트를 즉시 반환
+        """
+        discovery = ModelEndpointProber()
+        with patch.dict("os.environ", {}, clear=False) as env, \
+                patch("socket.create_connection", side_effect=AssertionError("blocking probe")), \
+                patch("httpx.get", side_effect=AssertionError("blocking probe")):
+            env.pop("MODEL_API_URL", None)
+            env.pop("MODEL_API_PORT", None)
+            assert discovery.current() == "http://localhost:8002/api"
+
+    def test_probe_selects_healthy_endpoint(self):
+        """
+        [성공] 응답하는 후보를 현재 엔드포인트로 선택하고 점수를 기록
+        """
+        discovery = ModelEndpointProber(["http://a.test/api", "http://b.test/api"])
+
+        results = self._probe(discovery, up={"b.test"})
+
+        assert results == {"http://a.test/api": False, "http://b.test/api": True}
+        assert discovery.current() == "http://b.test/api"
+        snapshot = {item["base_url"]: item for item in discovery.snapshot()}
+        assert snapshot["http://b.test/api"]["healthy"] is True
+        assert snapshot["http://b.test/api"]["current"] is True
+        assert snapshot["http://a.test/api"]["consecutive_failures"] == 1
+
+    def test_report_failure_switches_to_next_candidate(self):
+        """
+        [성공] 요청 경로의 연결 실패 보고 시 다음 건강한 후보로 전환, 다음 탐색에서 복구
+        """
+        discovery = ModelEndpointProber(["http://a.test/api", "http://b.test/api"])
+        self._probe(discovery, up={"a.test", "b.test"})
+        assert discovery.current() == "http://a.test/api"
+
+        assert discovery.report_failure("http://a.test/api") == "http://b.test/api"
+
+        self._probe(discovery, up={"a.test", "b.test"})
+        assert discovery.healthy_endpoints() == ["http://b.test/api", "http://a.test/api"]
+
+    def test_no_healthy_endpoint_uses_fallback(self):
+        """
+        [실패] 모든 후보가 응답하지 않으면 직접 지정한 첫 후보를 사용
+        """
+        discovery = ModelEndpointProber(["http://a.test/api", "http://b.test/api"])
+
+        self._probe(discovery, up=set())
+
+        assert discovery.current() == "http://a.test/api"
+        assert discovery.healthy_endpoints() == []
+
+
+@pytest.fixture(scope="module")
+def stub_replicas():
+    """
+    로컬 스텁 Model API 서버 3대 (마지막 1대는 느린 레플리카)
+
+    Yield: [(base_url, app), ...]
+    """
+    latencies = [0.005, 0.005, 0.15]
+    with ExitStack() as stack:
+        replicas = []
+        for latency in latencies:
+            port = free_port()
+            app = stack.enter_context(run_stub_server(port, latency={"sentiment": latency}, jitter=0))
+            replicas.append((f"http://127.0.0.1:{port}/api", app))
+        yield replicas
+
+
+class TestReplicaBalancing:
+    """여러 Model API 레플리카 간 클라이언트 측 로드 밸런싱 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, no_result_cache):
+        balancer.reset()
+        guards.reset()
+        yield
+        balancer.reset()
+        guards.reset()
+        prober.reset()
+
+    def _call_many(self, count, concurrency):
+        async def scenario():
+            await model_client.start_client()
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one():
+                async with semaphore:
+                    return await model_client.analyze_sentiment("좋아요")
+
+            try:
+                return await asyncio.gather(*(one() for _ in range(count)))
+            finally:
+                await model_client.close_client()
+
+        return asyncio.run(scenario())
+
+    def test_spreads_calls_and_avoids_slow_replica(self, stub_replicas):
+        """
+        [성공] 모든 레플리카에 분산되고, 진행 중 요청이 쌓이는 느린 레플리카는 덜 선택됨
+        """
+        urls = [url for url, _ in stub_replicas]
+        before = [app.state.calls["sentiment"] for _, app in stub_replicas]
+        prober.reset(urls)
+
+        results = self._call_many(90, concurrency=15)
+
+        assert all(result and result["label"] == "positive" for result in results)
+        calls = [app.state.calls["sentiment"] - b for (_, app), b in zip(stub_replicas, before)]
+        assert sum(calls) == 90
+        assert all(count > 0 for count in calls[:2])
+        assert calls[2] < min(calls[:2])
+
+        stats = {item["base_url"]: item for item in balancer.stats()}
+        assert stats[urls[2]]["latency_p50_ms"] > stats[urls[0]]["latency_p50_ms"]
+        assert all(item["outstanding"] == 0 and item["latency_p99_ms"] is not None for item in stats.values())
+
+    def test_ejects_dead_replica(self, stub_replicas):
+        """
+        [성공] 연결이 안 되는 레플리카는 연속 실패 후 제외되고 이후 호출은 모두 성공
+        """
+        dead = f"http://127.0.0.1:{free_port()}/api"
+        prober.reset([stub_replicas[0][0], stub_replicas[1][0], dead])
+
+        self._call_many(30, concurrency=1)
+        results = self._call_many(20, concurrency=5)
+
+        assert all(result is not None for result in results)
+        stats = {item["base_url"]: item for item in balancer.stats()}
+        assert stats[dead]["ejected"] is True
+        assert stats[dead]["failures"] == balancer.eject_after
+
+    def test_last_replica_is_never_ejected(self):
+        """
+        [실패] 남은 레플리카가 하나뿐이면 실패가 계속돼도 제외하지 않음
+        """
+        local = ReplicaBalancer(eject_after=2)
+        prober.reset(["http://only.test/api"])
+
+        async def scenario():
+            for _ in range(5):
+                with pytest.raises(httpx.ConnectError):
+                    async with local.track(local.pick()):
+                        raise httpx.ConnectError("refused")
+
+        asyncio.run(scenario())
+        (stats,) = local.stats()
+        assert stats["failures"] == 5
+        assert stats["ejected"] is False
+
+
+class TestCircuitBreaker:
+    """엔드포인트별 서킷 브레이커 / 적응형 타임아웃 테스트"""
+
+    @pytest.fixture
+    def flaky_api(self, no_result_cache):
+        """sentiment만 503을 반환하는 가짜 Model API"""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.endswith("/sentiment"):
+                return httpx.Response(503, json={"message": "model_unavailable"})
+            return httpx.Response(200, json={"summary": "요약"})
+
+        prober.reset(["http://model.test/api"])
+        guards.reset()
+        yield requests, httpx.MockTransport(handler)
+        prober.reset()
+        guards.reset()
+
+    def _run(self, transport, coroutine_factory):
+        async def scenario():
+            await model_client.start_client(transport=transport)
+            try:
+                return await coroutine_factory()
+            finally:
+                await model_client.close_client()
+
+        return asyncio.run(scenario())
+
+    def test_open_circuit_fails_fast_without_request(self, flaky_api):
+        """
+        [실패] 연속 실패가 임계치를 넘으면 서킷이 열리고, 이후 호출은 요청 없이 즉시 None
+        """
+        requests, transport = flaky_api
+        threshold = guards.get("sentiment", model_client.ENDPOINT_TIMEOUTS["sentiment"]).breaker.failure_threshold
+
+        async def calls():
+            for _ in range(threshold):
+                assert await model_client.analyze_sentiment("좋아요") is None
+            started = time.perf_counter()
+            fast = [await model_client.analyze_sentiment("좋아요") for _ in range(20)]
+            elapsed = time.perf_counter() - started
+            summary = await model_client.summarize_text("본문")
+            return fast, elapsed, summary
+
+        fast, elapsed, summary = self._run(transport, calls)
+
+        assert fast == [None] * 20
+        assert elapsed < 0.5
+        sentiment_requests = [r for r in requests if r.url.path.endswith("/sentiment")]
+        assert len(sentiment_requests) == threshold
+        # 다른 엔드포인트는 영향 없음
+        assert summary == {"summary": "요약"}
+
+        snapshot = guards.snapshot()
+        assert snapshot["sentiment"]["state"] == STATE_OPEN
+        assert snapshot["sentiment"]["rejected"] == 20
+        assert snapshot["summarize"]["state"] == STATE_CLOSED
+
+    def test_half_open_trial_closes_or_reopens(self):
+        """
+        [성공] open 시간이 지나면 시험 호출 1건만 허용, 성공하면 closed / 실패하면 다시 open
+        """
+        breaker = CircuitBreaker("sentiment", failure_threshold=2, open_seconds=0.05, half_open_calls=1)
+        breaker.on_failure()
+        breaker.on_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+
+        time.sleep(0.06)
+        breaker.acquire()
+        assert breaker.state == STATE_HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+        breaker.on_failure()
+        assert breaker.state == STATE_OPEN
+
+        time.sleep(0.06)
+        breaker.acquire()
+        breaker.on_success()
+        assert breaker.state == STATE_CLOSED
+        breaker.acquire()
+        assert breaker.to_dict()["opens"] == 2
+
+    def test_adaptive_timeout_follows_latency_percentile(self):
+        """
+        [성공] 표본이 모이면 p99 x 배수 (하한~최대 사이), 타임아웃 표본이 쌓이면 다시 늘어남
+        """
+        timeout = AdaptiveTimeout(10.0, percentile=99, multiplier=3, floor=0.05, min_samples=5, window=10)
+        assert timeout.current() == 10.0
+
+        for _ in range(10):
+            timeout.record(0.02)
+        assert timeout.current() == pytest.approx(0.06)
+
+        # 서비스가 느려져 타임아웃(0.06초)으로 끝난 호출이 쌓이면 대기 시간도 늘어남
+        timed_out = timeout.current()
+        for _ in range(10):
+            timeout.record(timed_out)
+        assert timeout.current() == pytest.approx(0.18)
+
+        for _ in range(10):
+            timeout.record(30.0)
+        assert timeout.current() == 10.0
+
+    def test_calls_use_adaptive_timeout(self, model_api):
+        """
+        [성공] 빠른 응답이 쌓이면 요청 타임아웃이 엔드포인트 최대값에서 하한으로 줄어듦
+        """
+        requests, transport = model_api
+        guard = guards.get("sentiment", model_client.ENDPOINT_TIMEOUTS["sentiment"])
+
+        async def calls():
+            for _ in range(guard.timeout.min_samples + 1):
+                await model_client.analyze_sentiment("좋아요")
+
+        self._run(transport, calls)
+
+        reads = [request.extensions["timeout"]["read"] for request in requests]
+        assert reads[0] == model_client.ENDPOINT_TIMEOUTS["sentiment"]
+        assert reads[-1] == pytest.approx(guard.timeout.floor)
+        assert reads[-1] < reads[0]
+
+    def test_diagnostics_endpoint_exposes_breaker_state(self, client):
+        """
+        [성공] 진단 API에서 서킷 브레이커 / 레플리카 / 엔드포인트 상태 조회
+        """
+        guard = guards.get("sentiment", model_client.ENDPOINT_TIMEOUTS["sentiment"])
+        for _ in range(guard.breaker.failure_threshold):
+            guard.breaker.on_failure()
+
+        response = client.get("/api/diagnostics/model-api")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["message"] == "get_model_api_diagnostics_success"
+        assert set(body["data"]) == {"endpoints", "replicas", "breakers", "cache", "batching"}
+        sentiment = body["data"]["breakers"]["sentiment"]
+        assert sentiment["state"] == STATE_OPEN
+        assert sentiment["retry_after"] > 0
+        assert sentiment["max_timeout"] == model_client.ENDPOINT_TIMEOUTS["sentiment"]
+
+
+class TestResultCache:
+    """텍스트 분석 결과 캐시 / 동시 요청 합치기 테스트"""
+
+    @pytest.fixture
+    def slow_api(self):
+        """50ms 뒤 응답하는 가짜 Model API (첫 sentiment 요청은 503)"""
+        requests = []
+        state = {"fail_first": False}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.05)
+            if request.url.path.endswith("/sentiment"):
+                if state["fail_first"]:
+                    state["fail_first"] = False
+                    return httpx.Response(503)
+                return httpx.Response(200, json={"label": "positive", "confidence": 0.9})
+            return httpx.Response(200, json={"summary": "요약"})
+
+        prober.reset(["http://model.test/api"])
+        guards.reset()
+        model_cache.reset()
+        yield requests, httpx.MockTransport(handler), state
+        prober.reset()
+        guards.reset()
+        model_cache.reset()
+
+    def _run(self, transport, coroutine_factory):
+        async def scenario():
+            await model_client.start_client(transport=transport)
+            try:
+                return await coroutine_factory()
+            finally:
+                await model_client.close_client()
+
+        return asyncio.run(scenario())
+
+    def test_repeated_text_served_from_cache(self, slow_api):
+        """
+        [성공] 같은 텍스트 / 파라미터는 한 번만 요청, 텍스트나 파라미터가 다르면 새로 요청
+        """
+        requests, transport, _ = slow_api
+
+        async def calls():
+            first = await model_client.analyze_sentiment("좋아요")
+            first["label"] = "changed"
+            again = await model_client.analyze_sentiment("좋아요")
+            await model_client.analyze_sentiment("좋아요", explain=True)
+            await model_client.analyze_sentiment("별로예요")
+            await model_client.summarize_text("좋아요")
+            return again
+
+        again = self._run(transport, calls)
+
+        # 캐시된 값은 호출자가 바꿔도 영향 없음
+        assert again["label"] == "positive"
+        assert len(requests) == 4
+        stats = model_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 4
+
+    def test_concurrent_identical_calls_are_coalesced(self, slow_api):
+        """
+        [성공] 진행 중인 같은 요청은 합쳐서 한 번만 보내고, 먼저 요청한 쪽이 취소돼도 나머지는 결과를 받음
+        """
+        requests, transport, _ = slow_api
+
+        async def calls():
+            leader = asyncio.create_task(model_client.summarize_text("본문"))
+            await asyncio.sleep(0)
+            followers = [asyncio.create_task(model_client.summarize_text("본문")) for _ in range(9)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await asyncio.gather(*followers)
+
+        results = self._run(transport, calls)
+
+        assert results == [{"summary": "요약"}] * 9
+        assert len(requests) == 1
+        stats = model_cache.stats()
+        assert stats["misses"] == 1
+        assert stats["coalesced"] == 9
+        assert stats["inflight"] == 0
+
+    def test_failures_are_not_cached(self, slow_api):
+        """
+        [실패] 실패한 호출은 캐시하지 않고 다음 호출에서 다시 요청
+        """
+        requests, transport, state = slow_api
+        state["fail_first"] = True
+
+        async def calls():
+            return [await model_client.analyze_sentiment("좋아요") for _ in range(3)]
+
+        failed, recovered, cached = self._run(transport, calls)
+
+        assert failed is None
+        assert recovered == cached == {"label": "positive", "confidence": 0.9}
+        assert len(requests) == 2
+
+    def test_lru_and_ttl_eviction(self):
+        """
+        [성공] 최대 개수를 넘으면 가장 오래 안 쓴 항목부터, TTL이 지나면 만료
+        """
+        cache = ModelResultCache(maxsize=2, ttl=0.05)
+        loads = []
+
+        def loader(value):
+            async def load():
+                loads.append(value)
+                return value
+            return load
+
+        async def scenario():
+            await cache.get_or_load(cache_key("summarize", "a"), loader("a"))
+            await cache.get_or_load(cache_key("summarize", "b"), loader("b"))
+            await cache.get_or_load(cache_key("summarize", "a"), loader("a"))
+            await cache.get_or_load(cache_key("summarize", "c"), loader("c"))
+            await cache.get_or_load(cache_key("summarize", "a"), loader("a"))
+            await cache.get_or_load(cache_key("summarize", "b"), loader("b"))
+            await asyncio.sleep(0.06)
+            await cache.get_or_load(cache_key("summarize", "b"), loader("b"))
+
+        asyncio.run(scenario())
+
+        # b는 c가 들어올 때 밀려남, TTL이 지나면 다시 요청
+        assert loads == ["a", "b", "c", "b", "b"]
+        assert cache.stats()["hits"] == 2
+
+
+class TestAutoBatching:
+    """텍스트 분석 자동 배치 테스트"""
+
+    @pytest.fixture
+    def batch_api(self):
+        """배치 API를 지원하는 가짜 Model API ("실패"가 들어간 텍스트는 항목 실패)"""
+        requests = []
+        state = {"batch_supported": True, "max_batch_size": 64}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            body = json.loads(request.content)
+            if request.url.path.endswith("/batch"):
+                if not state["batch_supported"]:
+                    return httpx.Response(404, json={"detail": "Not Found"})
+                if len(body["texts"]) > state["max_batch_size"]:
+                    return httpx.Response(422, json={"detail": "too many texts"})
+                results = [None if "실패" in text else {"label": "positive", "text": text} for text in body["texts"]]
+                errors = [{"index": i, "message": "text_required"} for i, r in enumerate(results) if r is None]
+                return httpx.Response(200, json={"results": results, "errors": errors})
+            return httpx.Response(200, json={"label": "positive", "text": body["text"]})
+
+        prober.reset(["http://model.test/api"])
+        guards.reset()
+        model_cache.reset()
+        model_client.batcher.reset()
+        with patch.object(model_client.batcher, "enabled", True):
+            yield requests, httpx.MockTransport(handler), state
+        prober.reset()
+        guards.reset()
+        model_cache.reset()
+        model_client.batcher.reset()
+
+    def _run(self, transport, texts):
+        async def scenario():
+            await model_client.start_client(transport=transport)
+            try:
+                return await asyncio.gather(*(model_client.analyze_sentiment(text) for text in texts))
+            finally:
+                await model_client.close_client()
+
+        return asyncio.run(scenario())
+
+    def test_concurrent_calls_sent_as_one_batch(self, batch_api):
+        """
+        [성공] 짧은 시간에 들어온 호출을 배치 API 한 번으로 보내고 결과를 호출 순서대로 나눠 줌
+        """
+        requests, transport, _ = batch_api
+        texts = [f"댓글 {i}" for i in range(10)]
+
+        results = self._run(transport, texts)
+
+        assert [result["text"] for result in results] == texts
+        assert [request.url.path for request in requests] == ["/api/sentiment/batch"]
+        assert json.loads(requests[0].content) == {"texts": texts, "explain": False}
+        stats = model_client.batcher.stats()
+        assert stats["batches"] == 1
+        assert stats["avg_batch_size"] == 10
+
+    def test_single_call_uses_single_endpoint(self, batch_api):
+        """
+        [성공] 한 건만 모이면 배치 없이 단건 API로 전송
+        """
+        requests, transport, _ = batch_api
+
+        (result,) = self._run(transport, ["혼자 쓴 댓글"])
+
+        assert result["text"] == "혼자 쓴 댓글"
+        assert [request.url.path for request in requests] == ["/api/sentiment"]
+
+    def test_batch_item_failure_only_fails_that_call(self, batch_api):
+        """
+        [실패] 배치 안에서 실패한 항목만 None, 나머지는 정상 결과
+        """
+        _, transport, _ = batch_api
+
+        results = self._run(transport, ["좋아요", "실패 댓글", "최고"])
+
+        assert results[0]["text"] == "좋아요"
+        assert results[1] is None
+        assert results[2]["text"] == "최고"
+
+    def test_falls_back_when_batch_endpoint_missing(self, batch_api):
+        """
+        [실패] 배치 API가 없는 Model 서버면 단건 호출로 대체하고, 이후로는 배치를 시도하지 않음
+        """
+        requests, transport, state = batch_api
+        state["batch_supported"] = False
+
+        first = self._run(transport, ["a 댓글", "b 댓글", "c 댓글"])
+        second = self._run(transport, ["d 댓글", "e 댓글"])
+
+        assert all(result is not None for result in first + second)
+        paths = [request.url.path for request in requests]
+        assert paths.count("/api/sentiment/batch") == 1
+        assert paths.count("/api/sentiment") == 5
+        assert model_client.batcher.stats()["unsupported"] == ["sentiment"]
+
+    def test_oversized_batch_is_split_and_limit_lowered(self, batch_api):
+        """
+        [실패] Model 서버 최대 배치 크기보다 큰 배치는 422 -> 나눠서 다시 보내고, 이후 배치는 줄인 크기로 전송
+        """
+        requests, transport, state = batch_api
+        state["max_batch_size"] = 4
+
+        first = self._run(transport, [f"a{i} 댓글" for i in range(10)])
+        sent_before = len(requests)
+        second = self._run(transport, [f"b{i} 댓글" for i in range(10)])
+
+        assert [result["text"] for result in first] == [f"a{i} 댓글" for i in range(10)]
+        assert [result["text"] for result in second] == [f"b{i} 댓글" for i in range(10)]
+        assert model_client.batcher.stats()["max_size"] <= 4
+        later_batches = [json.loads(request.content)["texts"] for request in requests[sent_before:]
+                         if request.url.path.endswith("/batch")]
+        assert later_batches and all(len(texts) <= 4 for texts in later_batches)
@@ -19,6 +19,8 @@
 """
 import pytest
 import io
+from datetime import datetime
+from sqlalchemy import text
 
 
 class TestGetPosts:
@@ -128,6 +130,369 @@ class TestGetPosts:
         assert response.status_code == 422
 
 
+class TestGetPostsCursor:
+    """
+    게시글 목록 커서(키셋) 페이지네이션 테스트
+
+    쿼리 파라미터:
+    - cursor: 빈 값이면 첫 페이지, 이후 next_cursor 전달
+    - include_total: total 포함 여부 (커서 모드 기본값 false)
+    """
+
+    def test_cursor_walks_all_posts_without_duplicates(self, client, post_factory):
+        """
+        [성공] next_cursor를 따라가면 모든 게시글을 중복 없이 최신순으로 조회
+
+        Given: 작성 시각이 같은 게시글 4개 + 더 최근 게시글 3개
+        When: limit=3, cursor 모드로 끝까지 조회
+        Then: 7개 게시글이 (작성일, ID) 역순으로 한 번씩 반환, 마지막 next_cursor는 None
+        """
+        older = post_factory(4, with_relations=False, created_at=datetime(2025, 1, 1, 12, 0, 0))
+        newer = post_factory(3, with_relations=False, created_at=datetime(2025, 1, 2, 12, 0, 0))
+
+        seen = []
+        cursor = ""
+        for _ in range(10):
+            response = client.get("/api/posts", params={"limit": 3, "cursor": cursor})
+            assert response.status_code == 200
+            data = response.json()["data"]
+            seen.extend(post["post_id"] for post in data["posts"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == sorted(newer, reverse=True) + sorted(older, reverse=True)
+
+    def test_cursor_mode_omits_total_by_default(self, client, post_factory):
+        """
+        [성공] 커서 모드는 기본적으로 total을 계산하지 않음
+        """
+        post_factory(2, with_relations=False)
+
+        data = client.get("/api/posts?cursor=").json()["data"]
+
+        assert "total" not in data
+        assert "page" not in data
+
+    def test_cursor_mode_include_total(self, client, post_factory):
+        """
+        [성공] include_total=true면 커서 모드에서도 total 반환
+        """
+        post_factory(2, with_relations=False)
+
+        data = client.get("/api/posts?cursor=&include_total=true").json()["data"]
+
+        assert data["total"] == 2
+
+    def test_offset_mode_keeps_total(self, client, post_factory):
+        """
+        [성공] 기존 OFFSET 모드 응답에는 total/page가 그대로 포함
+        """
+        post_factory(2, with_relations=False)
+
+        data = client.get("/api/posts?page=1&limit=1").json()["data"]
+
+        assert data["total"] == 2
+        assert data["page"] == 1
+        assert data["next_cursor"] is not None
+
+    def test_invalid_cursor(self, client):
+        """
+        [실패] 잘못된 커서 문자열
+
+        Then: 400 Bad Request (invalid_cursor)
+        """
+        response = client.get("/api/posts?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+        assert response.json()["message"] == "invalid_cursor"
+
+
+class TestGetPostsByTag:
+    """
+    태그 필터 목록 테스트 (GET /api/posts?tag=...&tag=...)
+
+    쿼리 파라미터:
+    - tag: 여러 번 지정 가능
+    - tag_match: all(기본, 모든 태그) / any(하나 이상)
+    태그 필터는 항상 커서 페이지네이션, 자주 조회되는 태그는 태그별 최신 게시글 목록 캐시에서 계산
+    """
+
+    @pytest.fixture
+    def tagged_posts(self, db_session, logged_in_user):
+        """태그 조합별 게시글 생성 -> 태그 튜플마다 post_id 목록 (작성 순서대로 1분씩 최근)"""
+        from datetime import timedelta
+        from tests.conftest import TestPost, TestTag
+
+        tags = {}
+
+        def _create(*tag_sets, board_type="couple"):
+            created = []
+            base = datetime(2025, 1, 1, 12, 0, 0) + timedelta(minutes=len(db_session.query(TestPost).all()))
+            for i, names in enumerate(tag_sets):
+                post = TestPost(user_id=logged_in_user["user_id"], title=f"게시글 {'/'.join(names)}",
+                                content="내용", board_type=board_type, created_at=base + timedelta(minutes=i))
+                for name in names:
+                    if name not in tags:
+                        tags[name] = TestTag(name=name)
+                    post.tags.append(tags[name])
+                db_session.add(post)
+                db_session.flush()
+                created.append(post.id)
+            db_session.commit()
+            return created
+
+        return _create
+
+    def _walk(self, client, params, limit):
+        """next_cursor를 끝까지 따라가며 post_id 수집"""
+        seen = []
+        cursor = ""
+        for _ in range(50):
+            response = client.get("/api/posts", params={**params, "limit": limit, "cursor": cursor})
+            assert response.status_code == 200
+            data = response.json()["data"]
+            seen.extend(post["post_id"] for post in data["posts"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return seen
+        raise AssertionError("cursor did not terminate")
+
+    def test_all_and_any_semantics(self, client, tagged_posts):
+        """
+        [성공] tag_match=all은 모든 태그, any는 하나 이상 달린 게시글 (최신순)
+
+        Given: {웨딩홀, 견적}, {웨딩홀}, {견적}, {} 게시글
+        """
+        both, hall, quote, _ = tagged_posts(("웨딩홀", "견적"), ("웨딩홀",), ("견적",), ())
+        params = [("tag", "웨딩홀"), ("tag", "견적")]
+
+        all_ids = [p["post_id"] for p in client.get("/api/posts", params=params).json()["data"]["posts"]]
+        any_ids = [p["post_id"] for p in
+                   client.get("/api/posts", params=params + [("tag_match", "any")]).json()["data"]["posts"]]
+
+        assert all_ids == [both]
+        assert any_ids == [quote, hall, both]
+
+    def test_unknown_tag(self, client, tagged_posts):
+        """
+        [성공] 없는 태그: all이면 빈 목록, any면 나머지 태그로 조회
+        """
+        (hall,) = tagged_posts(("웨딩홀",))
+        params = [("tag", "웨딩홀"), ("tag", "없는태그"), ("include_total", "true")]
+
+        all_data = client.get("/api/posts", params=params).json()["data"]
+        any_data = client.get("/api/posts", params=params + [("tag_match", "any")]).json()["data"]
+
+        assert (all_data["posts"], all_data["total"], all_data["next_cursor"]) == ([], 0, None)
+        assert [p["post_id"] for p in any_data["posts"]] == [hall]
+        assert any_data["total"] == 1
+
+    def test_invalid_tag_match(self, client):
+        """
+        [실패] tag_match는 all / any만 허용 (422)
+        """
+        response = client.get("/api/posts?tag=웨딩홀&tag_match=some")
+
+        assert response.status_code == 422
+
+    def test_cursor_walk_with_cache_and_db_fallback(self, client, tagged_posts):
+        """
+        [성공] 캐시 구간 안 / 밖 모두 커서를 따라가면 중복 없이 최신순, 게시판별로 분리
+
+        Given: 태그별 캐시 깊이 4, 게시글 11개 (웨딩홀 / 견적 / 둘 다) + 다른 게시판 게시글
+        When: limit=3으로 all / any 목록을 끝까지 조회
+        Then: 앞 페이지는 캐시, 깊이를 넘는 페이지는 DB에서 조회하고 결과는 DB 조회와 동일
+        """
+        from unittest.mock import patch
+        from app.services.tag_postings import tag_postings
+
+        tag_sets = [("웨딩홀",), ("견적",), ("웨딩홀", "견적")] * 3 + [("웨딩홀", "견적"), ("웨딩홀",)]
+        ids = tagged_posts(*tag_sets)
+        tagged_posts(("웨딩홀", "견적"), board_type="free")
+        newest_first = list(reversed(list(zip(ids, tag_sets))))
+        expected_all = [post_id for post_id, names in newest_first if len(names) == 2]
+        expected_any = [post_id for post_id, _ in newest_first]
+        params = {"tag": ["웨딩홀", "견적"]}
+
+        with patch.object(tag_postings, "depth", 4):
+            walked_all = self._walk(client, params, 3)
+            walked_any = self._walk(client, {**params, "tag_match": "any"}, 3)
+
+        assert walked_all == expected_all
+        assert walked_any == expected_any
+        stats = tag_postings.stats()
+        assert stats["hits"] > 0
+        assert stats["fallbacks"] > 0
+
+    def test_hot_tag_served_from_cache(self, client, tagged_posts, query_counter):
+        """
+        [성능] 캐시된 태그는 post_tags 조회 없이 게시글만 id로 로딩
+        """
+        tagged_posts(*[("웨딩홀",)] * 5)
+        client.get("/api/posts?tag=웨딩홀")
+
+        with query_counter() as counter:
+            response = client.get("/api/posts?tag=웨딩홀")
+
+        assert len(response.json()["data"]["posts"]) == 5
+        # 게시글 id 로딩 + 태그 eager load 2번뿐, tag_id로 찾는 쿼리 없음
+        assert len(counter["statements"]) == 2
+        assert not any("post_tags.tag_id = " in statement for statement in counter["statements"])
+
+    def test_new_and_deleted_posts_update_cache(self, client, auth_header, test_post_data, tagged_posts,
+                                                db_session):
+        """
+        [성공] 캐시된 태그 목록에 새 게시글은 바로 추가, 삭제된 게시글은 제거
+        (다른 경로로 지워진 게시글도 로딩 시 발견하면 제거 후 DB 조회)
+        """
+        from contextlib import ExitStack
+        from unittest.mock import patch
+
+        first, second = tagged_posts(("웨딩홀",), ("웨딩홀",))
+        client.get("/api/posts?tag=웨딩홀")
+
+        async def auto_tag_text(text, client=None):
+            return ["웨딩홀"]
+
+        async def no_result(*args, **kwargs):
+            return None
+
+        with ExitStack() as stack:
+            stack.enter_context(patch("app.services.model_client.auto_tag_text", new=auto_tag_text))
+            stack.enter_context(patch("app.services.model_client.summarize_text", new=no_result))
+            stack.enter_context(patch("app.services.model_client.analyze_sentiment", new=no_result))
+            created = client.post("/api/posts", json=test_post_data, headers=auth_header).json()["data"]["post_id"]
+        client.delete(f"/api/posts/{second}", headers=auth_header)
+        after_api = [p["post_id"] for p in client.get("/api/posts?tag=웨딩홀").json()["data"]["posts"]]
+
+        db_session.execute(text("DELETE FROM posts WHERE id = :id"), {"id": created})
+        db_session.commit()
+        after_direct = [p["post_id"] for p in client.get("/api/posts?tag=웨딩홀").json()["data"]["posts"]]
+
+        assert after_api == [created, first]
+        assert after_direct == [first]
+
+
+class TestGetPostsQueryCount:
+    """
+    게시글 목록 조회 쿼리 수 회귀 테스트
+
+    목록 조회는 limit 값과 무관하게 일정한 수의 SQL만 실행해야 함 (N+1 방지)
+    """
+
+    def test_query_count_constant_regardless_of_limit(self, client, auth_header, post_factory, query_counter):
+        """
+        [성능] limit 1 / 50 조회 시 SQL 실행 횟수 동일
+
+        Given: 댓글/좋아요/태그가 달린 게시글 50개
+        When: limit=1, limit=50으로 각각 목록 조회 (로그인 상태)
+        Then: 두 요청의 SQL 실행 횟수가 같음
+        """
+        post_factory(50)
+        # 게시판 게시글 수 캐시 적재
+        client.get("/api/posts")
+
+        with query_counter() as small:
+            small_res = client.get("/api/posts?limit=1", headers=auth_header)
+        with query_counter() as large:
+            large_res = client.get("/api/posts?limit=50", headers=auth_header)
+
+        assert small_res.status_code == 200
+        assert large_res.status_code == 200
+        assert len(large_res.json()["data"]["posts"]) == 50
+        assert small["count"] == large["count"]
+
+    def test_batched_fields_are_correct(self, client, auth_header, post_factory):
+        """
+        [성공] 일괄 로딩한 작성자/태그/댓글 수/좋아요 여부가 정확함
+        """
+        post_factory(3)
+
+        response = client.get("/api/posts?limit=10", headers=auth_header)
+        posts = response.json()["data"]["posts"]
+
+        assert len(posts) == 3
+        for post in posts:
+            assert post["nickname"] == "테스트유저"
+            assert post["tags"] == ["태그-couple"]
+            assert post["comment_count"] == 1
+            assert post["liked"] is True
+
+    def test_liked_false_for_anonymous(self, client, post_factory):
+        """
+        [성공] 비로그인 조회 시 liked는 항상 False
+        """
+        post_factory(2)
+
+        response = client.get("/api/posts")
+        posts = response.json()["data"]["posts"]
+
+        assert all(post["liked"] is False for post in posts)
+
+
+class TestBoardPostCount:
+    """
+    게시판별 게시글 수 캐시 테스트
+
+    목록 조회의 total은 메모리 캐시에서 제공되고, 작성/삭제 커밋 시 갱신됨
+    """
+
+    def test_total_served_without_count_query(self, client, post_factory, query_counter):
+        """
+        [성능] 첫 조회 이후에는 COUNT 쿼리를 실행하지 않음
+        """
+        post_factory(3, with_relations=False)
+        client.get("/api/posts")
+
+        with query_counter() as counter:
+            response = client.get("/api/posts")
+
+        assert response.json()["data"]["total"] == 3
+        assert not any("count(posts.id)" in stmt.lower() for stmt in counter["statements"])
+
+    def test_total_tracks_create_and_delete(self, client, auth_header, test_post_data):
+        """
+        [성공] 게시글 작성/삭제 후 total이 즉시 반영됨
+        """
+        assert client.get("/api/posts").json()["data"]["total"] == 0
+
+        created = client.post("/api/posts", json=test_post_data, headers=auth_header)
+        post_id = created.json()["data"]["post_id"]
+        assert client.get("/api/posts").json()["data"]["total"] == 1
+
+        client.delete(f"/api/posts/{post_id}", headers=auth_header)
+        assert client.get("/api/posts").json()["data"]["total"] == 0
+
+    def test_rolled_back_delta_is_discarded(self, client, db_session):
+        """
+        [성공] 롤백된 트랜잭션의 증감분은 반영되지 않음
+        """
+        from app.services.board_counter import board_counter
+
+        assert board_counter.get(db_session, "couple") == 0
+        board_counter.track(db_session, "couple", 1)
+        db_session.rollback()
+        db_session.commit()
+
+        assert board_counter.get(db_session, "couple") == 0
+
+    def test_reconcile_fixes_drift(self, client, post_factory, db_session):
+        """
+        [성공] 캐시를 거치지 않은 변경은 재집계로 보정됨
+        """
+        from app.services.board_counter import board_counter
+
+        assert client.get("/api/posts").json()["data"]["total"] == 0
+        post_factory(2, with_relations=False)
+        assert client.get("/api/posts").json()["data"]["total"] == 0
+
+        drift = board_counter.reconcile(db_session)
+
+        assert drift == {"couple": 2}
+        assert client.get("/api/posts").json()["data"]["total"] == 2
+
+
 class TestGetPost:
     """
     게시글 상세 조회 API 테스트
@@ -179,6 +544,612 @@ class TestGetPost:
         assert response.status_code == 422
 
 
+class TestPostDetailCache:
+    """
+    게시글 상세 응답 캐시 테스트
+
+    상세 본문은 캐시에서 제공되고, 변경 시 무효화되며 liked는 사용자별로 계산됨
+    """
+
+    def test_second_read_served_from_cache(self, client, created_post, query_counter):
+        """
+        [성능] 두 번째 비로그인 상세 조회는 SQL을 실행하지 않음
+        """
+        post_id = created_post["post_id"]
+        client.get(f"/api/posts/{post_id}")
+
+        with query_counter() as counter:
+            response = client.get(f"/api/posts/{post_id}")
+
+        assert response.status_code == 200
+        assert counter["count"] == 0
+
+    def test_update_invalidates_cache(self, client, auth_header, created_post):
+        """
+        [성공] 게시글 수정 후 상세 조회에 변경 내용 반영
+        """
+        post_id = created_post["post_id"]
+        client.get(f"/api/posts/{post_id}")
+
+        client.patch(f"/api/posts/{post_id}", json={"title": "수정된 제목"}, headers=auth_header)
+
+        assert client.get(f"/api/posts/{post_id}").json()["data"]["title"] == "수정된 제목"
+
+    def test_comment_invalidates_cache(self, client, auth_header, created_post, test_comment_data):
+        """
+        [성공] 댓글 작성 후 상세 조회에 새 댓글 반영
+        """
+        post_id = created_post["post_id"]
+        client.get(f"/api/posts/{post_id}")
+
+        client.post(f"/api/posts/{post_id}/comments", json=test_comment_data, headers=auth_header)
+
+        data = client.get(f"/api/posts/{post_id}").json()["data"]
+        assert len(data["comments"]) == 1
+        assert data["comment_count"] == 1
+
+    def test_liked_is_not_shared_between_users(self, client, auth_header, auth_header_2, created_post):
+        """
+        [성공] 캐시된 본문을 공유해도 liked는 요청 사용자 기준
+        """
+        post_id = created_post["post_id"]
+        client.post(f"/api/posts/{post_id}/like", headers=auth_header)
+
+        mine = client.get(f"/api/posts/{post_id}", headers=auth_header).json()["data"]
+        other = client.get(f"/api/posts/{post_id}", headers=auth_header_2).json()["data"]
+
+        assert mine["like_count"] == other["like_count"] == 1
+        assert mine["liked"] is True
+        assert other["liked"] is False
+
+    def test_pending_views_are_not_cached(self, client, auth_header, created_post):
+        """
+        [성공] 미반영 조회수 / liked는 캐시 본문에 남지 않음 (캐시 미스 후 히트해도 조회수가 다시 더해지지 않음)
+        """
+        from app.services.post_cache import post_cache
+
+        post_id = created_post["post_id"]
+        for _ in range(3):
+            client.patch(f"/api/posts/{post_id}/view")
+        post_cache.reset()
+
+        miss = client.get(f"/api/posts/{post_id}", headers=auth_header).json()["data"]
+        hit = client.get(f"/api/posts/{post_id}").json()["data"]
+
+        assert miss["view_count"] == hit["view_count"] == 3
+        assert post_cache.get(post_id)["view_count"] == 0
+        assert "liked" not in post_cache.get(post_id)
+
+    def test_read_racing_with_invalidation_is_not_cached(self, client, created_post):
+        """
+        [캐시] 상세를 읽는 도중 수정/삭제로 무효화되면 읽은 본문을 캐시하지 않음
+
+        Given: 캐시되지 않은 게시글
+        When: primary에서 본문을 읽는 사이 무효화 발생
+        Then: 응답은 하되 캐시에 남지 않음 / 무효화 이후 시작한 조회는 다시 캐시됨
+        """
+        from unittest.mock import patch
+        from app.controllers import post_controller
+        from app.services.post_cache import post_cache
+
+        post_id = created_post["post_id"]
+        build = post_controller._build_post_detail
+
+        def build_after_concurrent_update(post):
+            post_cache.invalidate(post_id)
+            return build(post)
+
+        with patch.object(post_controller, "_build_post_detail", side_effect=build_after_concurrent_update):
+            raced = client.get(f"/api/posts/{post_id}")
+        assert raced.status_code == 200
+        assert post_cache.get(post_id) is None
+
+        client.get(f"/api/posts/{post_id}")
+        assert post_cache.get(post_id) is not None
+
+    def test_shared_backend_between_workers(self):
+        """
+        [성공] 공유 백엔드를 통해 다른 워커의 캐시 본문을 읽고, 무효화도 공유됨
+        """
+        from app.services.post_cache import PostDetailCache, InMemoryCacheBackend
+
+        shared = InMemoryCacheBackend()
+        worker_a = PostDetailCache(shared=shared)
+        worker_b = PostDetailCache(shared=shared)
+
+        worker_a.set(1, {"post_id": 1, "title": "제목"})
+        assert worker_b.get(1) == {"post_id": 1, "title": "제목"}
+
+        worker_a.invalidate(1)
+        assert shared.get("post_detail:1") is None
+
+    def test_local_cache_ttl_and_lru(self):
+        """
+        [성공] L1 캐시는 TTL이 지나거나 용량을 넘으면 제거됨
+        """
+        from app.services.post_cache import PostDetailCache
+
+        expired = PostDetailCache(ttl=0)
+        expired.set(1, {"post_id": 1})
+        assert expired.get(1) is None
+
+        small = PostDetailCache(maxsize=2)
+        for post_id in (1, 2, 3):
+            small.set(post_id, {"post_id": post_id})
+        assert small.get(1) is None
+        assert small.get(3) == {"post_id": 3}
+
+
+class TestImageClassBackfill:
+    """
+    이미지 분류 백필 워커 테스트
+
+    상세 조회는 Model API를 호출하지 않고, 비어 있는 image_class는 워커가 채움
+    """
+
+    def _image_post(self, db_session, user_id, image_url):
+        from tests.conftest import TestPost
+
+        post = TestPost(user_id=user_id, title="이미지", content="내용", image_url=image_url)
+        db_session.add(post)
+        db_session.commit()
+        return post.id
+
+    def test_detail_does_not_call_model_api(self, client, db_session, logged_in_user):
+        """
+        [성공] image_class가 비어 있어도 상세 조회는 분류를 기다리지 않음
+        """
+        from unittest.mock import AsyncMock, patch
+
+        post_id = self._image_post(db_session, logged_in_user["user_id"], "http://localhost:8000/uploads/a.png")
+
+        with patch("app.services.model_client.predict_image", new=AsyncMock()) as predict:
+            response = client.get(f"/api/posts/{post_id}")
+
+        assert response.status_code == 200
+        assert response.json()["data"]["image_class"] is None
+        predict.assert_not_called()
+
+    def test_backfill_classifies_missing_image_class(self, client, db_session, logged_in_user, tmp_path, valid_png_image):
+        """
+        [성공] 로컬 파일이 있는 게시글은 분류해서 기록, 파일이 없는 게시글은 재시도 대기
+        """
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+        from app.services.image_backfill import ImageClassBackfill
+        from tests.conftest import TestingSessionLocal
+
+        (tmp_path / "dog.png").write_bytes(valid_png_image)
+        user_id = logged_in_user["user_id"]
+        found = self._image_post(db_session, user_id, "http://localhost:8000/uploads/dog.png")
+        missing = self._image_post(db_session, user_id, "http://localhost:8000/uploads/missing.png")
+        client.get(f"/api/posts/{found}")
+
+        backfill = ImageClassBackfill(upload_dir=str(tmp_path))
+        prediction = {"class_name": "Dog", "confidence_score": 0.9}
+        with patch("app.services.model_client.predict_image", new=AsyncMock(return_value=prediction)) as predict:
+            assert asyncio.run(backfill.run_once(TestingSessionLocal)) == 1
+            # 실패한 게시글은 retry_after 동안 다시 시도하지 않음
+            assert asyncio.run(backfill.run_once(TestingSessionLocal)) == 0
+
+        assert predict.await_count == 1
+        assert client.get(f"/api/posts/{found}").json()["data"]["image_class"] == "Dog"
+        assert client.get(f"/api/posts/{missing}").json()["data"]["image_class"] is None
+
+
+class TestPostEnrichment:
+    """
+    게시글 작성 시 AI 부가 정보 동시 호출 테스트
+
+    태그 / 요약 / 감성 호출은 하나의 클라이언트로 동시에 실행되고, 예산을 넘기면 받은 결과만 저장
+    """
+
+    def _fake_model_api(self, delays):
+        import asyncio
+
+        clients = []
+
+        async def auto_tag_text(text, client=None):
+            clients.append(client)
+            await asyncio.sleep(delays.get("tags", 0))
+            return ["여행", "여행", "맛집"]
+
+        async def summarize_text(text, client=None):
+            clients.append(client)
+            await asyncio.sleep(delays.get("summary", 0))
+            return {"summary": "요약"}
+
+        async def analyze_sentiment(text, explain=False, client=None):
+            clients.append(client)
+            await asyncio.sleep(delays.get("sentiment", 0))
+            return {"label": "positive", "confidence": 0.9}
+
+        return clients, {
+            "app.services.model_client.auto_tag_text": auto_tag_text,
+            "app.services.model_client.summarize_text": summarize_text,
+            "app.services.model_client.analyze_sentiment": analyze_sentiment,
+        }
+
+    def _create(self, client, auth_header, test_post_data, fakes):
+        import time
+        from contextlib import ExitStack
+        from unittest.mock import patch
+
+        with ExitStack() as stack:
+            for target, fake in fakes.items():
+                stack.enter_context(patch(target, new=fake))
+            started = time.perf_counter()
+            response = client.post("/api/posts", json=test_post_data, headers=auth_header)
+            elapsed = time.perf_counter() - started
+
+        assert response.status_code == 201
+        return response.json()["data"]["post_id"], elapsed
+
+    def test_calls_run_concurrently_over_shared_client(self, client, auth_header, test_post_data):
+        """
+        [성공] 세 호출의 지연이 합산되지 않고, 같은 클라이언트를 공유
+        """
+        clients, fakes = self._fake_model_api({"tags": 0.3, "summary": 0.3, "sentiment": 0.3})
+
+        post_id, elapsed = self._create(client, auth_header, test_post_data, fakes)
+
+        assert elapsed < 0.8
+        assert len(clients) == 3 and clients[0] is not None
+        assert clients[0] is clients[1] is clients[2]
+
+        data = client.get(f"/api/posts/{post_id}").json()["data"]
+        assert data["tags"] == ["여행", "맛집"]
+        assert data["summary"] == "요약"
+        assert data["sentiment_label"] == "positive"
+
+    def test_budget_exceeded_stores_partial_results(self, client, auth_header, test_post_data):
+        """
+        [성공] 예산을 넘긴 호출은 취소되고, 게시글은 도착한 결과만으로 저장
+        """
+        from unittest.mock import patch
+
+        _, fakes = self._fake_model_api({"summary": 5})
+
+        with patch("app.services.post_enrichment.ENRICHMENT_BUDGET", 0.3):
+            post_id, elapsed = self._create(client, auth_header, test_post_data, fakes)
+
+        assert elapsed < 2
+        data = client.get(f"/api/posts/{post_id}").json()["data"]
+        assert data["summary"] is None
+        assert data["tags"] == ["여행", "맛집"]
+        assert data["sentiment_label"] == "positive"
+
+
+class TestTagResolver:
+    """
+    게시글 태그 일괄 조회 / 생성 테스트
+
+    태그 수와 무관하게 고정된 왕복 수로 태그를 연결하고, 같은 새 태그를 동시에 만들어도 충돌하지 않음
+    """
+
+    def _create_with_tags(self, client, auth_header, test_post_data, tags):
+        from contextlib import ExitStack
+        from unittest.mock import patch
+
+        async def auto_tag_text(text, client=None):
+            return tags
+
+        async def no_result(*args, **kwargs):
+            return None
+
+        with ExitStack() as stack:
+            stack.enter_context(patch("app.services.model_client.auto_tag_text", new=auto_tag_text))
+            stack.enter_context(patch("app.services.model_client.summarize_text", new=no_result))
+            stack.enter_context(patch("app.services.model_client.analyze_sentiment", new=no_result))
+            response = client.post("/api/posts", json=test_post_data, headers=auth_header)
+        assert response.status_code == 201
+        return response.json()["data"]["post_id"]
+
+    def test_create_post_query_count_constant_regardless_of_tags(self, client, auth_header, test_post_data,
+                                                                 query_counter):
+        """
+        [성능] 새 태그 1개 / 8개로 게시글 작성 시 SQL 실행 횟수 동일, 캐시된 태그는 조회 없음
+        """
+        with query_counter() as one:
+            self._create_with_tags(client, auth_header, test_post_data, ["태그0"])
+        with query_counter() as many:
+            post_id = self._create_with_tags(client, auth_header, test_post_data, [f"새태그{i}" for i in range(8)])
+        with query_counter() as cached:
+            self._create_with_tags(client, auth_header, test_post_data, [f"새태그{i}" for i in range(8)])
+
+        assert one["count"] == many["count"]
+        # 태그 IN 조회 / INSERT / 재조회 3번이 캐시로 생략됨
+        assert cached["count"] == many["count"] - 3
+        assert client.get(f"/api/posts/{post_id}").json()["data"]["tags"] == [f"새태그{i}" for i in range(8)]
+
+    def test_reuses_existing_tags(self, client, auth_header, test_post_data, db_session):
+        """
+        [성공] 이미 있는 태그는 새로 만들지 않고 연결
+        """
+        first = self._create_with_tags(client, auth_header, test_post_data, ["산책", "여행"])
+        from app.services.tag_resolver import tag_resolver
+        tag_resolver.reset()
+        second = self._create_with_tags(client, auth_header, test_post_data, ["여행", "맛집"])
+
+        tags = dict(db_session.execute(text("SELECT name, id FROM tags")).all())
+        assert sorted(tags) == ["맛집", "산책", "여행"]
+        assert client.get(f"/api/posts/{first}").json()["data"]["tags"] == ["산책", "여행"]
+        assert client.get(f"/api/posts/{second}").json()["data"]["tags"] == ["여행", "맛집"]
+
+    def test_stale_cache_entry_is_recreated(self, client, auth_header, test_post_data, db_session):
+        """
+        [성공] 캐시에 있던 태그가 삭제됐으면 다시 만들어 연결 (FK 위반 없음)
+        """
+        from app.services.tag_resolver import tag_resolver
+
+        self._create_with_tags(client, auth_header, test_post_data, ["산책"])
+        db_session.execute(text("DELETE FROM tags WHERE name = '산책'"))
+        db_session.commit()
+
+        post_id = self._create_with_tags(client, auth_header, test_post_data, ["산책"])
+
+        assert client.get(f"/api/posts/{post_id}").json()["data"]["tags"] == ["산책"]
+        assert tag_resolver.stats()["stale"] == 1
+
+    def test_concurrent_creation_of_same_new_tags(self, file_session_factory):
+        """
+        [동시성] 여러 세션이 같은 새 태그를 동시에 만들어도 IntegrityError 없이 같은 id
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from app.services.tag_resolver import TagResolver
+
+        names = ["동시", "태그", "생성"]
+
+        def resolve(_):
+            db = file_session_factory()
+            try:
+                ids = TagResolver().resolve(db, names)
+                db.commit()
+                return ids
+            finally:
+                db.close()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(resolve, range(16)))
+
+        check = file_session_factory()
+        rows = dict(check.execute(text("SELECT name, id FROM tags")).all())
+        check.close()
+        assert rows.keys() == set(names)
+        assert all(result == rows for result in results)
+
+
+class TestDeferredEnrichment:
+    """
+    게시글 AI 부가 정보 비동기 처리 테스트 (POST_ENRICHMENT_MODE=async)
+
+    게시글은 pending 상태로 즉시 저장되고, 워커가 (post_id, 본문 해시) 단위 작업으로 나중에 채움
+    """
+
+    @pytest.fixture
+    def pool(self):
+        from unittest.mock import patch
+        from app.services.enrichment_queue import InMemoryJobQueue
+        from app.services.enrichment_worker import EnrichmentWorkerPool
+
+        pool = EnrichmentWorkerPool(queue=InMemoryJobQueue(), base_delay=0, max_attempts=3)
+        with patch("app.services.post_enrichment.ENRICHMENT_MODE", "async"), \
+                patch("app.controllers.post_controller.enrichment_pool", pool):
+            yield pool
+
+    def _model_api(self, summaries):
+        """summarize 호출마다 summaries에서 순서대로 응답 (None은 실패)"""
+        from contextlib import ExitStack
+        from unittest.mock import AsyncMock, patch
+
+        calls = {"summary": 0}
+
+        async def summarize_text(text, client=None):
+            calls["summary"] += 1
+            return summaries[min(calls["summary"], len(summaries)) - 1]
+
+        stack = ExitStack()
+        stack.enter_context(patch("app.services.model_client.auto_tag_text", new=AsyncMock(return_value=["산책"])))
+        stack.enter_context(patch("app.services.model_client.summarize_text", new=summarize_text))
+        stack.enter_context(patch("app.services.model_client.analyze_sentiment",
+                                  new=AsyncMock(return_value={"label": "positive", "confidence": 0.9})))
+        return calls, stack
+
+    def _drain(self, pool):
+        import asyncio
+        from tests.conftest import TestingSessionLocal
+
+        return asyncio.run(pool.drain(TestingSessionLocal))
+
+    def test_post_saved_pending_then_filled_by_worker(self, client, auth_header, test_post_data, pool):
+        """
+        [성공] 작성 응답은 Model API를 기다리지 않고, 워커 처리 후 상태가 done으로 바뀜
+        """
+        calls, model_api = self._model_api([{"summary": "요약"}])
+        with model_api:
+            response = client.post("/api/posts", json=test_post_data, headers=auth_header)
+            assert response.status_code == 201
+            assert response.json()["data"]["enrichment_status"] == "pending"
+            assert calls["summary"] == 0
+
+            post_id = response.json()["data"]["post_id"]
+            assert client.get(f"/api/posts/{post_id}").json()["data"]["enrichment_status"] == "pending"
+
+            assert self._drain(pool) == 1
+
+        data = client.get(f"/api/posts/{post_id}/enrichment").json()["data"]
+        assert data["status"] == "done"
+        assert data["summary"] == "요약"
+        assert data["sentiment_label"] == "positive"
+        assert data["tags"] == ["산책"]
+        # 상세 캐시도 무효화되어 채워진 결과가 보임
+        assert client.get(f"/api/posts/{post_id}").json()["data"]["summary"] == "요약"
+
+    def test_retry_with_backoff_until_complete(self, client, auth_header, test_post_data, pool):
+        """
+        [성공] 요약이 빠지면 재시도하고, 성공한 결과로 저장
+        """
+        calls, model_api = self._model_api([None, {"summary": "두 번째"}])
+        with model_api:
+            post_id = client.post("/api/posts", json=test_post_data, headers=auth_header).json()["data"]["post_id"]
+            self._drain(pool)
+
+        assert calls["summary"] == 2
+        data = client.get(f"/api/posts/{post_id}/enrichment").json()["data"]
+        assert data["status"] == "done"
+        assert data["summary"] == "두 번째"
+        assert pool.queue.size() == 0
+
+    def test_failed_after_max_attempts(self, client, auth_header, test_post_data, pool):
+        """
+        [실패] 최대 시도 횟수 동안 아무 결과도 없으면 failed
+        """
+        from contextlib import ExitStack
+        from unittest.mock import AsyncMock, patch
+
+        with ExitStack() as stack:
+            stack.enter_context(patch("app.services.model_client.auto_tag_text", new=AsyncMock(return_value=[])))
+            stack.enter_context(patch("app.services.model_client.summarize_text", new=AsyncMock(return_value=None)))
+            sentiment = stack.enter_context(
+                patch("app.services.model_client.analyze_sentiment", new=AsyncMock(return_value=None)))
+            post_id = client.post("/api/posts", json=test_post_data, headers=auth_header).json()["data"]["post_id"]
+            self._drain(pool)
+
+        assert sentiment.await_count == pool.max_attempts
+        assert client.get(f"/api/posts/{post_id}/enrichment").json()["data"]["status"] == "failed"
+
+    def test_idempotent_on_post_and_content_hash(self, client, auth_header, test_post_data, pool):
+        """
+        [성공] 같은 작업은 한 번만 들어가고, 본문이 바뀐 이전 작업은 건너뜀
+        """
+        from app.services.post_enrichment import content_hash
+
+        calls, model_api = self._model_api([{"summary": "요약"}])
+        with model_api:
+            post_id = client.post("/api/posts", json=test_post_data, headers=auth_header).json()["data"]["post_id"]
+            assert pool.enqueue(post_id, content_hash(test_post_data["content"])) is False
+
+            client.patch(f"/api/posts/{post_id}", json={"content": "수정된 본문"}, headers=auth_header)
+            assert pool.queue.size() == 2
+
+            assert self._drain(pool) == 2
+
+        # 이전 본문 작업은 Model API를 호출하지 않고 종료
+        assert calls["summary"] == 1
+        assert client.get(f"/api/posts/{post_id}/enrichment").json()["data"]["status"] == "done"
+
+        # 이미 채워진 (post_id, 해시) 작업을 다시 넣어도 다시 호출하지 않음
+        with model_api:
+            pool.enqueue(post_id, content_hash("수정된 본문"))
+            self._drain(pool)
+        assert calls["summary"] == 1
+
+    def test_recover_pending_posts(self, client, auth_header, test_post_data, pool):
+        """
+        [성공] 큐가 유실돼도 (재시작) pending 게시글을 다시 큐에 넣음
+        """
+        from app.services.enrichment_queue import InMemoryJobQueue
+        from tests.conftest import TestingSessionLocal
+
+        client.post("/api/posts", json=test_post_data, headers=auth_header)
+        pool._queue = InMemoryJobQueue()
+
+        assert pool.recover_pending(TestingSessionLocal) == 1
+        assert pool.recover_pending(TestingSessionLocal) == 0
+
+    def test_sqlite_queue_survives_restart(self, tmp_path):
+        """
+        [성공] SQLite 큐는 재시작 후에도 작업을 보존하고, 임대 기한이 지난 실행 중 작업을 다시 가져감
+        """
+        from app.services.enrichment_queue import SqliteJobQueue
+
+        path = str(tmp_path / "queue.db")
+        queue = SqliteJobQueue(path)
+        assert queue.put(1, "hash") is True
+        assert queue.put(1, "hash") is False
+        assert queue.claim().post_id == 1
+        assert queue.claim() is None
+        queue.close()
+
+        reopened = SqliteJobQueue(path, lease_seconds=0)
+        job = reopened.claim()
+        assert (job.post_id, job.content_hash) == (1, "hash")
+
+        reopened.retry(job, delay=60)
+        assert reopened.claim() is None
+        assert reopened.size() == 1
+
+        reopened.complete(job)
+        assert reopened.size() == 0
+        reopened.close()
+
+    def test_sqlite_queue_shared_between_processes(self, tmp_path):
+        """
+        [성공] 여러 프로세스가 같은 큐 파일을 써도 다른 프로세스가 실행 중인 작업을 가져가지 않음
+
+        Given: 워커 A가 작업을 실행 중
+        When: 워커 B가 새로 기동해 작업 요청
+        Then: 임대 기한 전에는 가져가지 않고, 기한이 지나면 B가 가져감 (이후 A의 완료 / 재시도는 무시)
+        """
+        from app.services.enrichment_queue import SqliteJobQueue
+
+        path = str(tmp_path / "queue.db")
+        worker_a = SqliteJobQueue(path)
+        worker_a.put(1, "hash")
+        job_a = worker_a.claim()
+
+        worker_b = SqliteJobQueue(path)
+        assert worker_b.claim() is None
+
+        worker_b.lease_seconds = 0
+        job_b = worker_b.claim()
+        assert (job_b.post_id, job_b.id) == (1, job_a.id)
+
+        worker_a.retry(job_a, delay=0)
+        worker_a.complete(job_a)
+        assert worker_a.claim() is None
+        assert worker_b.size() == 1
+
+        worker_b.complete(job_b)
+        assert worker_b.size() == 0
+        worker_a.close()
+        worker_b.close()
+
+    def test_sqlite_queue_upgrades_legacy_file(self, tmp_path):
+        """
+        [성공] 임대 컬럼이 없던 큐 파일의 실행 중 작업은 바로 다시 가져감
+        """
+        import sqlite3
+        from app.services.enrichment_queue import SqliteJobQueue
+
+        path = str(tmp_path / "queue.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE enrichment_jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, post_id INTEGER NOT NULL,"
+            " content_hash TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, available_at REAL NOT NULL,"
+            " status TEXT NOT NULL DEFAULT 'queued', UNIQUE (post_id, content_hash))"
+        )
+        conn.execute("INSERT INTO enrichment_jobs (post_id, content_hash, available_at, status)"
+                     " VALUES (1, 'hash', 0, 'running')")
+        conn.commit()
+        conn.close()
+
+        queue = SqliteJobQueue(path)
+        job = queue.claim()
+
+        assert (job.post_id, job.content_hash) == (1, "hash")
+        queue.complete(job)
+        assert queue.size() == 0
+        queue.close()
+
+    def test_enrichment_status_not_found(self, client):
+        """
+        [실패] 존재하지 않는 게시글
+        """
+        response = client.get("/api/posts/99999/enrichment")
+        assert response.status_code == 404
+
+
 class TestCreatePost:
     """
     게시글 생성 API 테스트
@@ -556,6 +1527,103 @@ class TestToggleLike:
         assert response.status_code in [401, 403, 422]
 
 
+class TestToggleLikeConcurrency:
+    """
+    좋아요 토글 원자성 테스트
+
+    like_count는 재집계 없이 상대 증감으로 유지되며 post_likes 행 수와 항상 일치해야 함
+    """
+
+    def test_toggle_sequence_updates_count(self, client, auth_header, auth_header_2, created_post):
+        """
+        [성공] 두 사용자의 추가/취소가 like_count와 liked에 정확히 반영
+        """
+        post_id = created_post["post_id"]
+
+        first = client.post(f"/api/posts/{post_id}/like", headers=auth_header).json()["data"]
+        second = client.post(f"/api/posts/{post_id}/like", headers=auth_header_2).json()["data"]
+        undo = client.post(f"/api/posts/{post_id}/like", headers=auth_header).json()["data"]
+
+        assert (first["liked"], first["like_count"]) == (True, 1)
+        assert (second["liked"], second["like_count"]) == (True, 2)
+        assert (undo["liked"], undo["like_count"]) == (False, 1)
+
+    def test_parallel_toggles_keep_counter_consistent(self, file_session_factory, file_async_session_factory):
+        """
+        [동시성] 수백 건의 병렬 토글 후 like_count == post_likes 행 수
+
+        Given: 게시글 1개, 사용자 20명
+        When: 세션 16개로 동시에 사용자별 15회씩 총 300회 토글 (같은 사용자 동시 토글 포함)
+        Then: 최종 like_count가 실제 좋아요 행 수와 같음
+        """
+        import asyncio
+        from app.controllers.post_controller import toggle_like_controller
+        from tests.conftest import TestUser, TestPost
+
+        setup = file_session_factory()
+        user_ids = []
+        for i in range(20):
+            user = TestUser(email=f"like{i}@example.com", password="pw", nickname=f"like{i}")
+            setup.add(user)
+            setup.flush()
+            user_ids.append(user.id)
+        post = TestPost(user_id=user_ids[0], title="hot", content="c", like_count=0)
+        setup.add(post)
+        setup.commit()
+        post_id = post.id
+        setup.close()
+
+        async def toggle(user_id, slots):
+            async with slots, file_async_session_factory() as db:
+                return await toggle_like_controller(post_id, user_id, db)
+
+        async def run_all(requests):
+            slots = asyncio.Semaphore(16)
+            return await asyncio.gather(*(toggle(user_id, slots) for user_id in requests))
+
+        requests = [user_id for user_id in user_ids for _ in range(15)]
+        results = asyncio.run(run_all(requests))
+
+        check = file_session_factory()
+        like_count = check.execute(text("SELECT like_count FROM posts WHERE id = :id"), {"id": post_id}).scalar()
+        rows = check.execute(text("SELECT COUNT(*) FROM post_likes WHERE post_id = :id"), {"id": post_id}).scalar()
+        check.close()
+
+        assert len(results) == 300
+        assert like_count == rows
+        # 사용자별 15회(홀수) 토글이므로 모두 좋아요 상태
+        assert rows == len(user_ids)
+
+    def test_lock_conflict_is_retried_once(self, client, auth_header, created_post):
+        """
+        [동시성] 교착 상태(MySQL 1213)로 실패한 토글은 롤백 후 한 번 다시 실행, 다른 OperationalError는 그대로 실패
+
+        (SQLite는 행 잠금 / gap lock이 없어 실제 교착은 재현되지 않으므로 드라이버 오류를 주입)
+        """
+        from unittest.mock import patch
+        from sqlalchemy.exc import OperationalError
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        post_id = created_post["post_id"]
+        original = AsyncSession.execute
+        errors = [Exception(1213, "Deadlock found when trying to get lock; try restarting transaction")]
+
+        async def flaky_execute(self, statement, *args, **kwargs):
+            if errors and getattr(statement, "is_delete", False):
+                raise OperationalError("DELETE FROM post_likes", {}, errors.pop())
+            return await original(self, statement, *args, **kwargs)
+
+        with patch.object(AsyncSession, "execute", flaky_execute):
+            retried = client.post(f"/api/posts/{post_id}/like", headers=auth_header)
+            errors.extend([Exception(2013, "Lost connection to MySQL server during query")])
+            with pytest.raises(OperationalError):
+                client.post(f"/api/posts/{post_id}/like", headers=auth_header)
+
+        assert retried.status_code == 200
+        assert (retried.json()["data"]["liked"], retried.json()["data"]["like_count"]) == (True, 1)
+        assert errors == []
+
+
 class TestIncrementView:
     """
     조회수 증가 API 테스트
@@ -589,7 +1657,134 @@ class TestIncrementView:
         assert response.status_code in [400, 404]
 
 
-class TestUploadPostImage:
+class TestViewCountBuffer:
+    """
+    조회수 write-behind 버퍼 테스트
+
+    조회수는 메모리에 누적되었다가 flush 시 한 번의 UPDATE로 반영됨
+    """
+
+    def test_views_are_buffered_then_flushed(self, client, created_post, db_session):
+        """
+        [성공] 응답 조회수는 즉시 증가하고, DB에는 flush 시점에 일괄 반영
+        """
+        from app.services.view_counter import view_buffer
+
+        post_id = created_post["post_id"]
+        counts = [
+            client.patch(f"/api/posts/{post_id}/view").json()["data"]["view_count"]
+            for _ in range(50)
+        ]
+        assert counts == list(range(1, 51))
+
+        row = db_session.execute(text("SELECT view_count FROM posts WHERE id = :id"), {"id": post_id}).one()
+        assert row[0] == 0
+        assert client.get(f"/api/posts/{post_id}").json()["data"]["view_count"] == 50
+
+        assert view_buffer.flush(db_session) == 50
+        row = db_session.execute(text("SELECT view_count FROM posts WHERE id = :id"), {"id": post_id}).one()
+        assert row[0] == 50
+        assert client.patch(f"/api/posts/{post_id}/view").json()["data"]["view_count"] == 51
+
+    def test_load_flushed_counts_match_issued_views(self, file_session_factory):
+        """
+        [부하] 여러 스레드가 동시에 조회수를 올려도 flush 결과가 발생한 조회 수와 일치
+
+        Given: 게시글 5개, 임계치 flush가 자주 일어나도록 작은 threshold
+        When: 8개 스레드가 각각 500회 조회 (중간 중간 임계치 flush)
+        Then: 최종 flush 후 DB 조회수 합계 == 4000, 게시글별 값도 일치
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from app.services.view_counter import ViewCountBuffer
+        from tests.conftest import TestUser, TestPost
+
+        setup = file_session_factory()
+        user = TestUser(email="load@example.com", password="pw", nickname="load")
+        setup.add(user)
+        setup.flush()
+        post_ids = []
+        for i in range(5):
+            post = TestPost(user_id=user.id, title=f"p{i}", content="c", view_count=0)
+            setup.add(post)
+            setup.flush()
+            post_ids.append(post.id)
+        setup.commit()
+        setup.close()
+
+        buffer = ViewCountBuffer(flush_threshold=97)
+        threads, views_per_thread = 8, 500
+
+        def worker(thread_no):
+            db = file_session_factory()
+            issued = {post_id: 0 for post_id in post_ids}
+            try:
+                for i in range(views_per_thread):
+                    post_id = post_ids[(thread_no + i) % len(post_ids)]
+                    assert buffer.increment(db, post_id) is not None
+                    issued[post_id] += 1
+            finally:
+                db.close()
+            return issued
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(worker, range(threads)))
+        buffer.flush_with(file_session_factory)
+
+        expected = {post_id: sum(r[post_id] for r in results) for post_id in post_ids}
+        check = file_session_factory()
+        actual = dict(check.execute(text("SELECT id, view_count FROM posts")).all())
+        check.close()
+
+        assert sum(actual.values()) == threads * views_per_thread
+        assert actual == expected
+
+    def test_views_during_flush_are_not_undercounted(self, file_session_factory):
+        """
+        [성공] flush 커밋 직전에 들어온 조회도 커밋 이후 응답 조회수에 반영
+
+        Given: 미반영 조회 3회가 쌓인 게시글
+        When: flush의 UPDATE 후 커밋 전에 다른 세션에서 조회, flush 완료 후 다시 조회
+        Then: 조회수 응답이 4 -> 5로 이어짐 (커밋 전 기준값을 캐시해 줄어들지 않음)
+        """
+        from app.services.view_counter import ViewCountBuffer
+        from tests.conftest import TestUser, TestPost
+
+        setup = file_session_factory()
+        user = TestUser(email="mid@example.com", password="pw", nickname="mid")
+        setup.add(user)
+        setup.flush()
+        post = TestPost(user_id=user.id, title="p", content="c", view_count=0)
+        setup.add(post)
+        setup.commit()
+        post_id = post.id
+        setup.close()
+
+        buffer = ViewCountBuffer(flush_threshold=1000)
+        reader = file_session_factory()
+        for _ in range(3):
+            buffer.increment(reader, post_id)
+        reader.rollback()
+
+        flusher = file_session_factory()
+        real_commit = flusher.commit
+        mid_flush = []
+
+        def commit_after_concurrent_view():
+            mid_flush.append(buffer.increment(reader, post_id))
+            reader.rollback()
+            real_commit()
+
+        flusher.commit = commit_after_concurrent_view
+        try:
+            assert buffer.flush(flusher) == 3
+        finally:
+            flusher.close()
+
+        after_flush = buffer.increment(reader, post_id)
+        reader.close()
+
+        assert mid_flush == [4]
+        assert after_flush == 5
     """
     게시글 이미지 업로드 API 테스트
 
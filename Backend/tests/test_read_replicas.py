@@ -0,0 +1,143 @@
+"""
+읽기 레플리카 라우팅 테스트 케이스
+- primary(테스트 DB) + 레플리카(두 번째 SQLite 파일), 레플리카에는 직접 넣은 데이터만 있음 (복제 지연 재현)
+- 읽기 요청은 레플리카, 쓰기 요청은 primary
+- 쓰기 직후 같은 사용자의 읽기는 잠시 primary (read-your-writes, 실제로 행을 커밋한 요청만)
+- 가입 직후 로그인은 레플리카에 없어도 primary에서 확인
+- 레플리카에서 읽은 이전 본문이 게시글 상세 캐시에 남지 않음
+"""
+from unittest.mock import patch
+
+from app.core import database
+from app.services.post_cache import post_cache
+from tests.conftest import TestingSessionLocal
+
+
+def _seed(session_factory, title, user_id=1, email="reader@example.com"):
+    """사용자 1명과 게시글 1개 생성 -> post_id"""
+    from tests.conftest import TestPost, TestUser
+
+    db = session_factory()
+    try:
+        db.add(TestUser(id=user_id, email=email, password="Password1!", nickname=f"user{user_id}",
+                        profile_image_url="https://example.com/profile.jpg"))
+        post = TestPost(user_id=user_id, title=title, content="내용", board_type="couple")
+        db.add(post)
+        db.commit()
+        return post.id
+    finally:
+        db.close()
+
+
+def _titles(response):
+    return [post["title"] for post in response.json()["data"]["posts"]]
+
+
+class TestReadReplicaRouting:
+    """읽기 / 쓰기 라우팅 테스트"""
+
+    def test_anonymous_reads_go_to_replica(self, replica_client, replica):
+        """[성공] 로그인하지 않은 목록 / 상세 / 댓글 조회는 레플리카에서 읽음"""
+        _seed(TestingSessionLocal, "primary 게시글")
+        post_id = _seed(replica, "replica 게시글")
+
+        listing = replica_client.get("/api/posts")
+        detail = replica_client.get(f"/api/posts/{post_id}")
+        comments = replica_client.get(f"/api/posts/{post_id}/comments")
+
+        assert _titles(listing) == ["replica 게시글"]
+        assert detail.json()["data"]["title"] == "replica 게시글"
+        assert comments.status_code == 200
+        assert database.read_router.stats()["replica_reads"] == 3
+
+    def test_writer_reads_own_write_from_primary(self, replica_client, replica):
+        """
+        [성공] read-your-writes
+
+        Given: 게시글이 primary / 레플리카에 모두 있음 (좋아요 없음)
+        When: 사용자 1이 좋아요를 누른 직후 목록 조회
+        Then: 사용자 1은 primary에서 좋아요가 반영된 목록, 사용자 2는 레플리카 목록
+        """
+        post_id = _seed(TestingSessionLocal, "게시글")
+        _seed(replica, "게시글")
+
+        like = replica_client.post(f"/api/posts/{post_id}/like", headers={"X-User-Id": "1"})
+        writer = replica_client.get("/api/posts", headers={"X-User-Id": "1"})
+        other = replica_client.get("/api/posts", headers={"X-User-Id": "2"})
+
+        assert like.status_code == 200
+        assert writer.json()["data"]["posts"][0]["like_count"] == 1
+        assert writer.json()["data"]["posts"][0]["liked"] is True
+        assert other.json()["data"]["posts"][0]["like_count"] == 0
+        stats = database.read_router.stats()
+        assert (stats["sticky_reads"], stats["replica_reads"]) == (1, 1)
+
+    def test_requests_without_commits_do_not_pin(self, replica_client, replica):
+        """
+        [성공] 조회수 증가(메모리 버퍼)나 실패한 쓰기 요청 뒤에는 같은 사용자도 레플리카에서 읽음
+
+        Given: 게시글이 primary / 레플리카에 모두 있음, 조회수 증가마다 버퍼를 DB에 반영(임계치 1)
+        When: 사용자 1이 조회수 증가 후 상세 조회, 없는 게시글에 좋아요 후 목록 조회
+        Then: 두 읽기 모두 레플리카
+        """
+        from app.services.view_counter import view_buffer
+
+        post_id = _seed(TestingSessionLocal, "게시글")
+        _seed(replica, "게시글")
+
+        with patch.object(view_buffer, "flush_threshold", 1):
+            view = replica_client.patch(f"/api/posts/{post_id}/view", headers={"X-User-Id": "1"})
+        detail = replica_client.get(f"/api/posts/{post_id}", headers={"X-User-Id": "1"})
+        missing = replica_client.post("/api/posts/99999/like", headers={"X-User-Id": "1"})
+        listing = replica_client.get("/api/posts", headers={"X-User-Id": "1"})
+
+        assert view.status_code == detail.status_code == listing.status_code == 200
+        assert missing.status_code == 404
+        stats = database.read_router.stats()
+        assert (stats["sticky_reads"], stats["replica_reads"], stats["sticky_users"]) == (0, 2, 0)
+
+    def test_stickiness_expires(self, replica_client, replica):
+        """[성공] 고정 시간이 지나면 쓴 사용자의 읽기도 다시 레플리카"""
+        post_id = _seed(TestingSessionLocal, "게시글")
+        _seed(replica, "게시글")
+
+        with patch.object(database.read_router, "sticky_seconds", 0):
+            replica_client.post(f"/api/posts/{post_id}/like", headers={"X-User-Id": "1"})
+        response = replica_client.get("/api/posts", headers={"X-User-Id": "1"})
+
+        assert response.json()["data"]["posts"][0]["liked"] is False
+        assert database.read_router.stats()["sticky_reads"] == 0
+
+    def test_login_falls_back_to_primary(self, replica_client, replica):
+        """[성공] 가입 직후 레플리카에 아직 없는 계정도 로그인 (틀린 비밀번호는 그대로 실패)"""
+        _seed(TestingSessionLocal, "게시글", email="new@example.com")
+
+        success = replica_client.post("/api/auth/login",
+                                      json={"email": "new@example.com", "password": "Password1!"})
+        failure = replica_client.post("/api/auth/login",
+                                      json={"email": "new@example.com", "password": "Wrong1234!"})
+
+        assert success.status_code == 200
+        assert success.json()["data"]["user_id"] == 1
+        assert failure.status_code == 400
+        assert failure.json()["message"] == "invalid_credentials"
+
+    def test_replica_read_after_invalidation_is_not_cached(self, replica_client, replica):
+        """
+        [캐시] 방금 무효화된 게시글을 레플리카에서 읽으면 응답만 하고 캐시하지 않음
+
+        Given: primary는 수정된 제목, 레플리카는 이전 제목 (복제 지연)
+        When: 수정 직후(무효화 직후) 다른 사용자가 상세 조회
+        Then: 이전 제목이 캐시에 남지 않음 / 무효화 기록이 없는 게시글은 캐시됨
+        """
+        post_id = _seed(TestingSessionLocal, "수정된 제목")
+        _seed(replica, "이전 제목")
+
+        post_cache.invalidate(post_id)
+        stale = replica_client.get(f"/api/posts/{post_id}")
+        assert stale.json()["data"]["title"] == "이전 제목"
+        assert post_cache.get(post_id) is None
+
+        post_cache.reset()
+        replica_client.get(f"/api/posts/{post_id}")
+        assert post_cache.get(post_id) is not None
@@ -35,6 +35,26 @@ PORT = int(os.getenv("PORT", "8001"))
 # 모델 설정
 # ============================================
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+# 배치 API(/sentiment/batch, /summarize/batch, /auto-tag/batch) 한 번에 받을 최대 텍스트 수
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "64"))
+# 시작 시 백그라운드에서 모델 로딩 + 워밍업 (false면 첫 요청에서 로딩)
+MODEL_WARMUP = os.getenv("MODEL_WARMUP", "true").lower() == "true"
+# 모델 로딩 실패 후 재시도 간격(초): 기본값부터 두 배씩 늘려 최대값까지
+MODEL_LOAD_RETRY_BASE = float(os.getenv("MODEL_LOAD_RETRY_BASE", "5"))
+MODEL_LOAD_RETRY_MAX = float(os.getenv("MODEL_LOAD_RETRY_MAX", "300"))
+# 이미지 분류 추론 스케줄러: 배치 최대 크기 / 배치를 모으는 최대 대기(ms) / 대기열 크기
+INFERENCE_MAX_BATCH_SIZE = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", "8"))
+INFERENCE_MAX_WAIT_MS = float(os.getenv("INFERENCE_MAX_WAIT_MS", "5"))
+INFERENCE_QUEUE_SIZE = int(os.getenv("INFERENCE_QUEUE_SIZE", "64"))
+# 이미지 디코딩/리사이즈 풀 (thread / process) 과 워커 수
+PREPROCESS_EXECUTOR = os.getenv("PREPROCESS_EXECUTOR", "thread")
+PREPROCESS_WORKERS = int(os.getenv("PREPROCESS_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 리사이즈 필터 (nearest / box / bilinear / hamming / bicubic / lanczos) 와 JPEG 축소 디코딩(draft) 사용 여부
+PREPROCESS_RESAMPLE = os.getenv("PREPROCESS_RESAMPLE", "bilinear").lower()
+PREPROCESS_DRAFT = os.getenv("PREPROCESS_DRAFT", "true").lower() == "true"
+# 동시에 처리할 /api/predict 최대 수 (넘으면 503 + Retry-After 초)
+PIPELINE_MAX_INFLIGHT = int(os.getenv("PIPELINE_MAX_INFLIGHT", "32"))
+PIPELINE_RETRY_AFTER = int(os.getenv("PIPELINE_RETRY_AFTER", "1"))
 
 # ============================================
 # 검증 및 디버깅
@@ -3,20 +3,25 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 
 class APIError(Exception):
-    def __init__(self, message: str, status_code: int, data=None):
+    def __init__(self, message: str, status_code: int, data=None, headers=None):
         self.message = message
         self.status_code = status_code
         self.data = data
+        self.headers = headers
 
 def bad_request(msg: str, data=None):   return APIError(msg, status.HTTP_400_BAD_REQUEST, data)
 def not_found(msg: str):                return APIError(msg, status.HTTP_404_NOT_FOUND, data=None)
 def unprocessable(msg: str, data=None): return APIError(msg, status.HTTP_422_UNPROCESSABLE_ENTITY, data)
 def internal_server_error(msg: str="internal_server_error"): return APIError(msg, status.HTTP_500_INTERNAL_SERVER_ERROR, data=None)
+def service_unavailable(msg: str, data=None, retry_after: int = None):
+    headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+    return APIError(msg, status.HTTP_503_SERVICE_UNAVAILABLE, data, headers)
 
 async def api_error_handler(_: Request, exc: APIError):
     return JSONResponse(
         status_code=exc.status_code,
-        content={"message": exc.message, "data": exc.data}
+        content={"message": exc.message, "data": exc.data},
+        headers=exc.headers
     )
 
 async def validation_error_handler(_: Request, exc: RequestValidationError):
@@ -3,29 +3,24 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from app.routers import predict_routes, sentiment_routes, chat_routes, summarization_routes, tagging_routes, embedding_routes
+from app.routers import predict_routes, sentiment_routes, chat_routes, summarization_routes, tagging_routes, embedding_routes, health_routes
 from app.core.exceptions import APIError, api_error_handler, RequestValidationError, validation_error_handler, global_exception_handler
-from app.services.model_service import load_ai_model
-from app.services.sentiment_service import get_sentiment_service
+from app.core.config import MODEL_WARMUP
+from app.services.model_service import shutdown_scheduler
+from app.services.image_pipeline import pipeline
+from app.services.model_warmup import warmup
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Load image classification model on startup
-    # try:
-    #     load_ai_model()
-    #     print("✅ Image classification model loaded")
-    # except Exception as e:
-    #     print(f"⚠️  WARNING: Failed to load image classification model: {e}")
-    
-    # Load sentiment analysis model on startup
-    # try:
-    #     get_sentiment_service()
-    #     print("✅ Sentiment analysis model loaded")
-    # except Exception as e:
-    #     print(f"⚠️  WARNING: Failed to load sentiment analysis model: {e}")
-    
+    # 이미지 분류 / 감성 분석 모델을 백그라운드에서 로딩 + 워밍업 (준비 상태는 /health/ready)
+    if MODEL_WARMUP:
+        warmup.start()
+
     yield
-    # Clean up if needed
+    # warm-up / 전처리 풀 / 추론 워커 스레드 종료
+    warmup.stop()
+    pipeline.shutdown()
+    shutdown_scheduler()
 
 app = FastAPI(
     title="AI Model Serving API",
@@ -56,6 +51,7 @@ app.include_router(chat_routes.router, prefix="/api", tags=["Chat"])
 app.include_router(summarization_routes.router, prefix="/api", tags=["Summarization"])
 app.include_router(tagging_routes.router, prefix="/api", tags=["Auto Tagging"])
 app.include_router(embedding_routes.router, prefix="/api", tags=["Embedding"])
+app.include_router(health_routes.router, tags=["System"])
 
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
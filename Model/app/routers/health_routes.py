@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from app.services.model_warmup import warmup
+from app.core.exceptions import service_unavailable
+
+router = APIRouter()
+
+@router.get("/health/live")
+async def live():
+    """
+    Liveness probe: the process is up and serving requests (models may still be loading).
+    """
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def ready():
+    """
+    Readiness probe: 200 once every model is loaded and warmed up, otherwise 503 with per-model state.
+    """
+    models = warmup.snapshot()
+    if not warmup.ready():
+        raise service_unavailable("not_ready", {"models": models}, retry_after=1)
+    return {"status": "ready", "models": models}
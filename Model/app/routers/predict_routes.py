@@ -1,5 +1,5 @@
 from fastapi import APIRouter, UploadFile, File
-from app.services.model_service import predict_image
+from app.services.image_pipeline import pipeline
 from app.schemas.prediction import PredictionResponse
 from app.core.exceptions import bad_request
 
@@ -18,8 +18,13 @@ async def predict(file: UploadFile = File(...)):
         
     file_data = await file.read()
     
-    # Pass file-like object (BytesIO)
-    from io import BytesIO
-    result = predict_image(BytesIO(file_data))
-    
-    return result
+    # Decode / resize on the preprocess pool, inference batched on the scheduler thread
+    return await pipeline.classify(file_data)
+
+
+@router.get("/predict/metrics")
+async def predict_metrics():
+    """
+    Image classification pipeline metrics: in-flight requests, queue depth and per-stage latency.
+    """
+    return pipeline.metrics()
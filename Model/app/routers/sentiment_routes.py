@@ -1,5 +1,8 @@
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
+from typing import List, Optional
+from app.core.config import MAX_BATCH_SIZE
 from app.services.sentiment_service import SentimentAnalysisService, get_sentiment_service
 from app.services.gemini_service import analyze_sentiment_with_gemini
 from app.core.exceptions import bad_request, unprocessable
@@ -19,6 +22,21 @@ class SentimentResponse(BaseModel):
     top_tokens: list = None
 
 
+class SentimentBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE, description="분석할 텍스트 목록")
+    explain: bool = Field(default=False, description="토큰 영향도 포함 여부")
+
+
+class BatchItemError(BaseModel):
+    index: int
+    message: str
+
+
+class SentimentBatchResponse(BaseModel):
+    results: List[Optional[SentimentResponse]]
+    errors: List[BatchItemError] = []
+
+
 class GeminiSentimentResponse(BaseModel):
     label: str
     confidence: float
@@ -40,13 +58,7 @@ async def analyze_sentiment(
         if not payload.text or not payload.text.strip():
             raise bad_request("text_required")
         
-        result = service.predict(payload.text)
-        
-        # explain이 False면 top_tokens 제거
-        if not payload.explain:
-            result["top_tokens"] = []
-        
-        return result
+        return _predict(service, payload.text, payload.explain)
         
     except ValueError as e:
         raise bad_request(str(e))
@@ -54,6 +66,42 @@ async def analyze_sentiment(
         raise unprocessable("sentiment_analysis_failed", {"details": str(e)})
 
 
+@router.post("/sentiment/batch", response_model=SentimentBatchResponse)
+async def analyze_sentiment_batch(
+    payload: SentimentBatchRequest,
+    service: SentimentAnalysisService = Depends(get_sentiment_service)
+):
+    """
+    텍스트 여러 개 감성 분석 API (요청 1번에 최대 MAX_BATCH_SIZE개)
+    - results: 입력 순서대로 결과, 분석에 실패한 항목은 null
+    - errors: 실패한 항목의 index와 사유
+    """
+    # 텍스트 최대 MAX_BATCH_SIZE개의 CPU 추론은 이벤트 루프 밖(스레드 풀)에서
+    return await run_in_threadpool(_predict_batch, service, payload.texts, payload.explain)
+
+
+def _predict_batch(service: SentimentAnalysisService, texts: List[str], explain: bool) -> dict:
+    results = []
+    errors = []
+    for index, text in enumerate(texts):
+        try:
+            if not text or not text.strip():
+                raise ValueError("text_required")
+            results.append(_predict(service, text, explain))
+        except Exception as e:
+            results.append(None)
+            errors.append({"index": index, "message": str(e)})
+    return {"results": results, "errors": errors}
+
+
+def _predict(service: SentimentAnalysisService, text: str, explain: bool) -> dict:
+    result = service.predict(text)
+    # explain이 False면 top_tokens 제거
+    if not explain:
+        result["top_tokens"] = []
+    return result
+
+
 @router.post("/sentiment/gemini", response_model=GeminiSentimentResponse)
 async def analyze_sentiment_gemini(payload: SentimentRequest):
     """
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
+from typing import List, Optional
+from app.core.config import MAX_BATCH_SIZE
 
 router = APIRouter()
 
@@ -11,13 +13,42 @@ class SummarizeResponse(BaseModel):
     original_length: int
     summary_length: int
 
+class SummarizeBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE, description="Texts to summarize")
+
+class BatchItemError(BaseModel):
+    index: int
+    message: str
+
+class SummarizeBatchResponse(BaseModel):
+    results: List[Optional[SummarizeResponse]]
+    errors: List[BatchItemError] = []
+
 @router.post("/summarize", response_model=SummarizeResponse)
 async def summarize_text(payload: SummarizeRequest):
     """
     Simple rule-based summarization for MVP.
     In a real scenario, this would call an LLM (e.g., Gemini, GPT).
     """
-    text = payload.text
+    return _summarize(payload.text)
+
+@router.post("/summarize/batch", response_model=SummarizeBatchResponse)
+async def summarize_text_batch(payload: SummarizeBatchRequest):
+    """
+    Summarize up to MAX_BATCH_SIZE texts in one request.
+    Texts shorter than 10 characters get a null result and an entry in errors.
+    """
+    results = []
+    errors = []
+    for index, text in enumerate(payload.texts):
+        if len(text) < 10:
+            results.append(None)
+            errors.append({"index": index, "message": "text_too_short"})
+            continue
+        results.append(_summarize(text))
+    return {"results": results, "errors": errors}
+
+def _summarize(text: str) -> dict:
     # Simple heuristic: Take the first 2 sentences or first 100 chars
     sentences = text.split('.')
     summary = '. '.join(sentences[:2])
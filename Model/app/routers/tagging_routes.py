@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 from typing import List
+from app.core.config import MAX_BATCH_SIZE
 
 router = APIRouter()
 
@@ -10,12 +11,29 @@ class TaggingRequest(BaseModel):
 class TaggingResponse(BaseModel):
     tags: List[str]
 
+class TaggingBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE, description="Texts to extract tags from")
+
+class TaggingBatchResponse(BaseModel):
+    results: List[TaggingResponse]
+    errors: List[dict] = []
+
 @router.post("/auto-tag", response_model=TaggingResponse)
 async def auto_tag_text(payload: TaggingRequest):
     """
     Rule-based auto-tagging for MVP.
     """
-    text = payload.text.lower()
+    return _extract_tags(payload.text)
+
+@router.post("/auto-tag/batch", response_model=TaggingBatchResponse)
+async def auto_tag_text_batch(payload: TaggingBatchRequest):
+    """
+    Auto-tag up to MAX_BATCH_SIZE texts in one request (results in input order).
+    """
+    return {"results": [_extract_tags(text) for text in payload.texts], "errors": []}
+
+def _extract_tags(text: str) -> dict:
+    text = text.lower()
     tags = []
     
     keywords = {
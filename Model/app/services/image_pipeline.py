@@ -0,0 +1,159 @@
+"""
+이미지 분류 파이프라인 (전처리 풀 + 추론 스케줄러 + 백프레셔 + 단계별 지표).
+
+/api/predict 가 async 라우트 안에서 Image.open / ImageOps.fit / 정규화를 그대로 실행해
+업로드 하나가 채팅 스트리밍을 포함한 프로세스의 모든 요청을 멈추게 하던 것을 분리합니다.
+- 모델 로딩 / 디코딩 / 리사이즈 / 정규화: 크기가 정해진 풀(PREPROCESS_EXECUTOR=thread|process)에서 실행
+- 추론: InferenceScheduler 전용 스레드에서 배치로 실행
+- 백프레셔: 처리 중 요청이 PIPELINE_MAX_INFLIGHT 이상이거나 추론 대기열이 가득 차면
+  즉시 503 + Retry-After
+- 지표: 처리 중 요청 수, 대기열 깊이, 단계별(queue_wait / preprocess / inference / total) 지연 p50·p99
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import (
+    PIPELINE_MAX_INFLIGHT, PIPELINE_RETRY_AFTER, PREPROCESS_EXECUTOR, PREPROCESS_WORKERS,
+)
+from app.core.exceptions import service_unavailable, unprocessable
+from app.services import image_preprocess, model_service
+from app.services.inference_scheduler import InferenceQueueFull
+
+STAGES = ("queue_wait", "preprocess", "inference", "total")
+_LATENCY_WINDOW = 512
+
+
+def _preprocess_timed(data: bytes, submitted_at: float) -> Tuple[np.ndarray, float, float]:
+    """풀 워커에서 실행: (uint8 픽셀, 대기 시간, 전처리 시간)"""
+    started = time.time()
+    image = image_preprocess.load_pixels(BytesIO(data))
+    return image, started - submitted_at, time.time() - started
+
+
+class StageStats:
+    """단계 하나의 최근 지연 기록 (ms)"""
+
+    def __init__(self, window: int = _LATENCY_WINDOW):
+        self.count = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self._latencies.append(seconds * 1000)
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self._latencies)
+
+        def pct(p: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))], 2)
+
+        return {"count": self.count, "p50_ms": pct(50), "p99_ms": pct(99)}
+
+
+class ImagePipeline:
+    """업로드 바이트 -> 분류 결과 (이벤트 루프에서는 대기만 함)"""
+
+    def __init__(self, workers: int = PREPROCESS_WORKERS, executor_kind: str = PREPROCESS_EXECUTOR,
+                 max_inflight: int = PIPELINE_MAX_INFLIGHT, retry_after: int = PIPELINE_RETRY_AFTER):
+        self.workers = workers
+        self.executor_kind = executor_kind
+        self.max_inflight = max_inflight
+        self.retry_after = retry_after
+        self.inflight = 0
+        self.preprocessing = 0
+        self.rejected = 0
+        self.stages = {stage: StageStats() for stage in STAGES}
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.executor_kind == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="preprocess")
+            return self._executor
+
+    def _busy(self, reason: str):
+        self.rejected += 1
+        return service_unavailable(reason, {"retry_after": self.retry_after}, retry_after=self.retry_after)
+
+    async def classify(self, data: bytes) -> dict:
+        if self.inflight >= self.max_inflight:
+            raise self._busy("inference_busy")
+        self.inflight += 1
+        started = time.perf_counter()
+        try:
+            # 디코딩을 준비 상태 확인보다 먼저: 빈 파일 / 손상된 이미지는 모델 상태와 무관하게 422
+            loop = asyncio.get_running_loop()
+            self.preprocessing += 1
+            try:
+                image, waited, preprocess_time = await loop.run_in_executor(
+                    self._get_executor(), _preprocess_timed, data, time.time())
+            except Exception as e:
+                print(f"Prediction error: {e}")
+                raise unprocessable("prediction_failed", {"details": str(e)})
+            finally:
+                self.preprocessing -= 1
+            self.stages["queue_wait"].record(max(0.0, waited))
+            self.stages["preprocess"].record(preprocess_time)
+
+            # 첫 요청의 모델 로딩(TensorFlow import 포함)도 이벤트 루프 밖에서
+            await asyncio.to_thread(model_service.ensure_model)
+
+            inference_started = time.perf_counter()
+            try:
+                prediction = await model_service.get_scheduler().infer(image)
+            except InferenceQueueFull:
+                raise self._busy("inference_queue_full")
+            except Exception as e:
+                print(f"Prediction error: {e}")
+                raise unprocessable("prediction_failed", {"details": str(e)})
+            self.stages["inference"].record(time.perf_counter() - inference_started)
+
+            result = model_service.decode_prediction(prediction)
+            self.stages["total"].record(time.perf_counter() - started)
+            return result
+        finally:
+            self.inflight -= 1
+
+    def metrics(self) -> Dict[str, Any]:
+        scheduler = model_service.get_scheduler()
+        return {
+            "inflight": self.inflight,
+            "max_inflight": self.max_inflight,
+            "rejected": self.rejected,
+            "preprocess": {"executor": self.executor_kind, "workers": self.workers, "pending": self.preprocessing},
+            "inference": {
+                "queue_depth": scheduler.queue_depth(),
+                "batches": scheduler.batches,
+                "images": scheduler.images,
+                "avg_batch_size": round(scheduler.images / scheduler.batches, 2) if scheduler.batches else None,
+            },
+            "stages": {stage: stats.to_dict() for stage, stats in self.stages.items()},
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def reset_metrics(self) -> None:
+        self.rejected = 0
+        self.stages = {stage: StageStats() for stage in STAGES}
+
+
+pipeline = ImagePipeline()
@@ -0,0 +1,76 @@
+"""
+이미지 분류 전처리 엔진 (축소 디코딩 + 가벼운 리사이즈 + 배치 버퍼에 바로 정규화).
+
+기존 경로는 최대 5MB 업로드를 원본 해상도로 전부 디코딩한 뒤 LANCZOS로 224x224까지 줄였습니다.
+- JPEG은 draft 모드로 디코딩 단계에서 1/2 ~ 1/8로 줄여 읽음 (버려질 픽셀을 만들지 않음)
+- 중앙 크롭 + 리사이즈를 resize(box=...) 한 번으로 처리, 필터는 PREPROCESS_RESAMPLE 로 선택
+- 큰 배율 축소는 reducing_gap 으로 정수 배 축소(reduce)를 먼저 적용
+- 결과는 uint8 (224, 224, 3) 로 넘기고, [-1, 1] float32 정규화는 추론 배치 버퍼의 해당 칸에 바로 기록
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+from PIL import Image
+
+from app.core.config import PREPROCESS_DRAFT, PREPROCESS_RESAMPLE
+
+TARGET_SIZE: Tuple[int, int] = (224, 224)
+# 리사이즈 전에 목표 크기의 이 배수까지는 reduce()로 먼저 줄임
+REDUCING_GAP = 2.0
+
+RESAMPLING_FILTERS = {
+    "nearest": Image.Resampling.NEAREST,
+    "box": Image.Resampling.BOX,
+    "bilinear": Image.Resampling.BILINEAR,
+    "hamming": Image.Resampling.HAMMING,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+
+
+def resolve_resample(name: str) -> Image.Resampling:
+    try:
+        return RESAMPLING_FILTERS[name]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 리사이즈 필터: {name} ({', '.join(RESAMPLING_FILTERS)})")
+
+
+def _center_crop_box(width: int, height: int, size: Tuple[int, int]) -> Tuple[float, float, float, float]:
+    """ImageOps.fit 과 같은 중앙 크롭 영역 (목표 비율에 맞춤)"""
+    target_ratio = size[0] / size[1]
+    if width / height > target_ratio:
+        crop_width = height * target_ratio
+        left = (width - crop_width) / 2
+        return left, 0.0, left + crop_width, float(height)
+    crop_height = width / target_ratio
+    top = (height - crop_height) / 2
+    return 0.0, top, float(width), top + crop_height
+
+
+def load_pixels(image_file, size: Tuple[int, int] = TARGET_SIZE, resample: str = PREPROCESS_RESAMPLE,
+                draft: bool = PREPROCESS_DRAFT) -> np.ndarray:
+    """이미지 파일 -> 중앙 크롭 + 리사이즈된 uint8 (H, W, 3) 배열"""
+    image = Image.open(image_file)
+    if draft and image.format == "JPEG":
+        # 크롭 후에도 목표 크기 이상이 남도록 짧은 변 기준으로 요청
+        scale = max(size[0] / image.width, size[1] / image.height)
+        image.draft("RGB", (int(image.width * scale + 0.5), int(image.height * scale + 0.5)))
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    box = _center_crop_box(image.width, image.height, size)
+    image = image.resize(size, resolve_resample(resample), box=box, reducing_gap=REDUCING_GAP)
+    return np.asarray(image, dtype=np.uint8)
+
+
+def normalize_into(pixels: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """uint8 픽셀을 [-1, 1] float32 로 out 에 직접 기록 (중간 배열 없음)"""
+    np.multiply(pixels, np.float32(1 / 127.5), out=out, casting="unsafe")
+    np.subtract(out, np.float32(1), out=out)
+    return out
+
+
+def normalize(pixels: np.ndarray) -> np.ndarray:
+    return normalize_into(pixels, np.empty(pixels.shape, dtype=np.float32))
@@ -0,0 +1,151 @@
+"""
+이미지 분류 추론 스케줄러 (동적 마이크로 배치).
+
+/api/predict 요청마다 이벤트 루프 안에서 (1, 224, 224, 3) 배열로 MODEL.predict 를 부르던 것을
+전용 워커 스레드 하나가 모아서 처리합니다.
+- 요청은 제한된 크기의 큐(INFERENCE_QUEUE_SIZE)에 들어가고, 가득 차면 즉시 InferenceQueueFull
+- 워커는 첫 요청을 받은 뒤 최대 INFERENCE_MAX_WAIT_MS 동안 INFERENCE_MAX_BATCH_SIZE개까지 모아
+  미리 할당한 float32 배치 버퍼에 채운 뒤 한 번에 추론 (uint8 픽셀은 버퍼 칸에 바로 정규화)
+- 요청별 결과(예측 행)는 concurrent.futures.Future로 전달 (async 라우트는 await)
+  -> 기다리던 요청이 취소된 Future는 추론에서 빼고, 워커 스레드는 결과 전달 실패로 죽지 않음
+"""
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import INFERENCE_MAX_BATCH_SIZE, INFERENCE_MAX_WAIT_MS, INFERENCE_QUEUE_SIZE
+from app.services.image_preprocess import normalize_into
+
+INPUT_SHAPE: Tuple[int, int, int] = (224, 224, 3)
+
+PredictFn = Callable[[np.ndarray], np.ndarray]
+
+# 종료 신호를 큐에 넣지 못했을 때(대기열이 가득 참) 워커가 종료 여부를 확인하는 간격
+_STOP_POLL_SECONDS = 0.1
+
+
+class InferenceQueueFull(Exception):
+    """추론 대기열이 가득 참 (호출자는 잠시 후 재시도)"""
+
+
+@dataclass
+class _Request:
+    image: np.ndarray
+    future: Future = field(default_factory=Future)
+
+
+class InferenceScheduler:
+    """요청을 배치로 묶어 전용 스레드에서 추론"""
+
+    def __init__(self, predict_fn: PredictFn, max_batch_size: int = INFERENCE_MAX_BATCH_SIZE,
+                 max_wait_ms: float = INFERENCE_MAX_WAIT_MS, queue_size: int = INFERENCE_QUEUE_SIZE):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue(maxsize=queue_size)
+        self._buffer = np.zeros((max_batch_size, *INPUT_SHAPE), dtype=np.float32)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping: Optional[threading.Event] = None
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.images = 0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stopping,),
+                                            name="inference-worker", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """대기 중인 요청을 처리한 뒤 워커 종료"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            stopping = self._stopping
+        if thread is None:
+            return
+        stopping.set()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            # 대기열이 가득 차 있으면 워커가 남은 요청을 비운 뒤 stopping을 보고 종료
+            pass
+        thread.join(timeout)
+
+    def submit(self, image: np.ndarray) -> Future:
+        """(224, 224, 3) uint8 픽셀 또는 정규화된 float32 배열 하나를 대기열에 넣고 예측 행을 받을 Future 반환"""
+        self.start()
+        request = _Request(image)
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            raise InferenceQueueFull()
+        return request.future
+
+    async def infer(self, image: np.ndarray) -> np.ndarray:
+        return await asyncio.wrap_future(self.submit(image))
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self, stopping: threading.Event) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=_STOP_POLL_SECONDS)
+            except queue.Empty:
+                if stopping.is_set():
+                    return
+                continue
+            if first is None:
+                return
+            batch = [first]
+            stop = self._collect(batch)
+            self._predict(batch)
+            if stop:
+                return
+
+    def _collect(self, batch: List[_Request]) -> bool:
+        """max_wait 동안 배치를 채움 (종료 신호를 받으면 True)"""
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                return False
+            if request is None:
+                return True
+            batch.append(request)
+        return False
+
+    def _predict(self, batch: List[_Request]) -> None:
+        # 취소된 요청은 빼고, 남은 Future는 RUNNING으로 바꿔 이후 cancel()로 결과 전달이 실패하지 않게 함
+        batch = [request for request in batch if request.future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        size = len(batch)
+        try:
+            for index, request in enumerate(batch):
+                if request.image.dtype == np.uint8:
+                    normalize_into(request.image, self._buffer[index])
+                else:
+                    self._buffer[index] = request.image
+            predictions = self.predict_fn(self._buffer[:size])
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+        self.batches += 1
+        self.images += size
+        for index, request in enumerate(batch):
+            request.future.set_result(np.array(predictions[index]))
@@ -1,13 +1,22 @@
 import os
+import threading
+from typing import Optional
 import numpy as np
-from PIL import Image, ImageOps
 # from keras.models import load_model  # Moved to lazy load
-from app.core.exceptions import internal_server_error, unprocessable
+from app.core.config import INFERENCE_MAX_BATCH_SIZE
+from app.core.exceptions import unprocessable
+from app.services.image_preprocess import load_pixels, normalize
+from app.services.inference_scheduler import INPUT_SHAPE, InferenceScheduler
+from app.services.model_warmup import ModelSlot, warmup
 
 # Global variables to hold model and labels
 MODEL = None
 CLASS_NAMES = []
 
+# /api/predict 요청을 배치로 묶어 추론하는 스케줄러 (처음 사용할 때 생성)
+_scheduler: Optional[InferenceScheduler] = None
+_scheduler_lock = threading.Lock()
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 MODEL_PATH = os.path.join(ASSETS_DIR, "keras_model.h5")
@@ -40,55 +49,86 @@ def load_ai_model():
         MODEL = None
         CLASS_NAMES = []
 
+def _load_classifier():
+    load_ai_model()
+    if MODEL is None or not CLASS_NAMES:
+        raise RuntimeError("model_not_loaded")
+
+
+def _warm_classifier():
+    """Run dummy batches (1 and the scheduler's max batch size) so graph tracing happens before traffic."""
+    for size in sorted({1, INFERENCE_MAX_BATCH_SIZE}):
+        _predict_batch(np.zeros((size, *INPUT_SHAPE), dtype=np.float32))
+
+
+CLASSIFIER = warmup.register(ModelSlot("image_classifier", _load_classifier, _warm_classifier))
+
+
+def ensure_model():
+    if MODEL is None or not CLASS_NAMES:
+        # 로딩은 warm-up 스레드가 담당, 준비 전이면 503 (실패 후 재시도는 간격을 두고만)
+        warmup.require(CLASSIFIER.name)
+
+
+def preprocess_image(image_file) -> np.ndarray:
+    """Decode, resize and normalize an image into a (224, 224, 3) float32 array in [-1, 1]."""
+    # /api/predict 는 uint8 픽셀을 넘기고 추론 배치 버퍼에서 정규화 (image_pipeline)
+    return normalize(load_pixels(image_file))
+
+
+def decode_prediction(prediction) -> dict:
+    """One row of model output -> {"class_name", "confidence_score"}"""
+    index = int(np.argmax(prediction))
+    class_name = CLASS_NAMES[index]
+    confidence_score = float(prediction[index])
+
+    # Clean class name (remove index if present, e.g., "0 Cat" -> "Cat")
+    # The reference code did class_name[2:], assuming "0 " prefix.
+    # We'll be safer.
+    if " " in class_name:
+        class_name = class_name.split(" ", 1)[1]
+
+    return {
+        "class_name": class_name,
+        "confidence_score": confidence_score
+    }
+
+
+def _predict_batch(batch: np.ndarray) -> np.ndarray:
+    return MODEL.predict(batch, verbose=0)
+
+
+def get_scheduler() -> InferenceScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = InferenceScheduler(_predict_batch)
+        return _scheduler
+
+
+def shutdown_scheduler():
+    """Stop the inference worker thread (app shutdown / tests)."""
+    global _scheduler
+    with _scheduler_lock:
+        scheduler, _scheduler = _scheduler, None
+    if scheduler is not None:
+        scheduler.stop()
+
+
 def predict_image(image_file) -> dict:
     """
-    Predict the class of the image.
+    Predict the class of the image (synchronous, single image; scripts and tools).
     Args:
         image_file: file-like object (bytes)
     Returns:
         dict: {"class_name": str, "confidence_score": float}
     """
-    global MODEL, CLASS_NAMES
-    
-    if MODEL is None or not CLASS_NAMES:
-        # Try loading again if not loaded
-        load_ai_model()
-        if MODEL is None:
-            raise internal_server_error("model_not_loaded")
+    ensure_model()
 
     try:
-        # Open image
-        image = Image.open(image_file).convert("RGB")
-        
-        # Resize and preprocess
-        size = (224, 224)
-        image = ImageOps.fit(image, size, Image.Resampling.LANCZOS)
-        image_array = np.asarray(image)
-        
-        # Normalize
-        normalized_image_array = (image_array.astype(np.float32) / 127.5) - 1
-        
-        # Prepare data array
-        data = np.ndarray(shape=(1, 224, 224, 3), dtype=np.float32)
-        data[0] = normalized_image_array
-        
-        # Predict
-        prediction = MODEL.predict(data)
-        index = np.argmax(prediction)
-        class_name = CLASS_NAMES[index]
-        confidence_score = float(prediction[0][index])
-        
-        # Clean class name (remove index if present, e.g., "0 Cat" -> "Cat")
-        # The reference code did class_name[2:], assuming "0 " prefix.
-        # We'll be safer.
-        if " " in class_name:
-            class_name = class_name.split(" ", 1)[1]
-            
-        return {
-            "class_name": class_name,
-            "confidence_score": confidence_score
-        }
-        
+        data = preprocess_image(image_file)[np.newaxis, ...]
+        prediction = _predict_batch(data)
+        return decode_prediction(prediction[0])
     except Exception as e:
         print(f"Prediction error: {e}")
         raise unprocessable("prediction_failed", {"details": str(e)})
@@ -0,0 +1,173 @@
+"""
+모델 로딩 / 워밍업 관리 (시작 시 백그라운드 로딩 + 준비 상태 + 재시도 폭주 방지).
+
+lifespan 의 모델 로딩이 주석 처리되어 있어 첫 /api/predict 요청이 TensorFlow import, load_model,
+그래프 트레이싱 비용을 모두 떠안았고, 로딩에 실패하면 요청마다 load_ai_model()을 다시 실행했습니다.
+- 서비스마다 ModelSlot(로딩 함수 + 워밍업 함수)을 등록하고, 시작 시 전용 스레드가 순서대로 로딩/워밍업
+- required=False 슬롯은 첫 요청이 차갑지 않도록 미리 실행만 하고 준비 상태(/health/ready)에는 포함하지 않음
+- 요청 경로는 로딩하지 않고 상태만 확인: 로딩 중이면 503 model_loading, 실패면 503 model_unavailable
+  (둘 다 Retry-After 포함)
+- 실패한 모델은 MODEL_LOAD_RETRY_BASE 초부터 두 배씩(최대 MODEL_LOAD_RETRY_MAX) 늘어나는 간격으로만 재시도
+- MODEL_WARMUP=false 면 백그라운드 로딩 없이 첫 요청에서 한 번 로딩 (실패 시 같은 재시도 간격 적용)
+- /health/live, /health/ready 에서 모델별 상태 조회
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import MODEL_LOAD_RETRY_BASE, MODEL_LOAD_RETRY_MAX
+from app.core.exceptions import service_unavailable
+
+STATE_PENDING = "pending"
+STATE_LOADING = "loading"
+STATE_READY = "ready"
+STATE_FAILED = "failed"
+
+
+class ModelSlot:
+    """모델 하나의 로딩 / 워밍업 상태"""
+
+    def __init__(self, name: str, load: Callable[[], None], warm: Optional[Callable[[], None]] = None,
+                 retry_base: float = MODEL_LOAD_RETRY_BASE, retry_max: float = MODEL_LOAD_RETRY_MAX,
+                 required: bool = True):
+        self.name = name
+        self.load = load
+        self.warm = warm
+        self.required = required
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.state = STATE_PENDING
+        self.attempts = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.warm_seconds: Optional[float] = None
+        self.next_retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def due(self) -> bool:
+        return self.state != STATE_READY and time.monotonic() >= self.next_retry_at
+
+    def retry_after(self) -> int:
+        """다음 재시도까지 남은 시간 (Retry-After 초, 최소 1)"""
+        return max(1, math.ceil(self.next_retry_at - time.monotonic()))
+
+    def attempt(self, blocking: bool = False) -> str:
+        """로딩 + 워밍업 한 번 (이미 다른 스레드가 진행 중이면 blocking=False일 때 바로 반환)"""
+        if not self._lock.acquire(blocking=blocking):
+            return self.state
+        try:
+            if not self.due():
+                return self.state
+            self.state = STATE_LOADING
+            self.attempts += 1
+            started = time.perf_counter()
+            try:
+                self.load()
+                loaded = time.perf_counter()
+                if self.warm is not None:
+                    self.warm()
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e) or type(e).__name__
+                delay = min(self.retry_max, self.retry_base * 2 ** (self.failures - 1))
+                self.next_retry_at = time.monotonic() + delay
+                self.state = STATE_FAILED
+                print(f"⚠️ 모델 로딩 실패 ({self.name}, {self.failures}회째): {self.last_error} -> {delay:g}초 후 재시도")
+                return self.state
+            self.load_seconds = round(loaded - started, 3)
+            self.warm_seconds = round(time.perf_counter() - loaded, 3)
+            self.failures = 0
+            self.last_error = None
+            self.state = STATE_READY
+            print(f"✅ 모델 준비 완료: {self.name} (로딩 {self.load_seconds}s, 워밍업 {self.warm_seconds}s)")
+            return self.state
+        finally:
+            self._lock.release()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "required": self.required,
+            "attempts": self.attempts,
+            "last_error": self.last_error,
+            "retry_after": self.retry_after() if self.state == STATE_FAILED else None,
+            "load_seconds": self.load_seconds,
+            "warm_seconds": self.warm_seconds,
+        }
+
+
+class ModelWarmup:
+    """등록된 모델을 백그라운드 스레드에서 로딩하고 요청 경로에 준비 상태를 알려줌"""
+
+    def __init__(self):
+        self._slots: Dict[str, ModelSlot] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def register(self, slot: ModelSlot) -> ModelSlot:
+        self._slots[slot.name] = slot
+        return slot
+
+    def slot(self, name: str) -> ModelSlot:
+        return self._slots[name]
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="model-warmup", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            for slot in list(self._slots.values()):
+                if self._stop.is_set():
+                    return
+                if slot.due():
+                    slot.attempt()
+            waiting = [slot.next_retry_at for slot in self._slots.values() if slot.state != STATE_READY]
+            if not waiting:
+                return
+            self._stop.wait(max(0.0, min(waiting) - time.monotonic()))
+
+    def require(self, name: str) -> None:
+        """요청 경로: 모델이 준비되지 않았으면 503 (백그라운드 로딩이 꺼져 있으면 여기서 한 번 로딩)"""
+        slot = self._slots[name]
+        if slot.state == STATE_READY:
+            return
+        if not self.running and slot.due():
+            slot.attempt(blocking=True)
+            if slot.state == STATE_READY:
+                return
+        if slot.state == STATE_FAILED:
+            retry_after = slot.retry_after()
+            raise service_unavailable("model_unavailable",
+                                      {"model": name, "details": slot.last_error, "retry_after": retry_after},
+                                      retry_after=retry_after)
+        raise service_unavailable("model_loading", {"model": name}, retry_after=1)
+
+    def ready(self) -> bool:
+        return all(slot.state == STATE_READY for slot in self._slots.values() if slot.required)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: slot.to_dict() for name, slot in self._slots.items()}
+
+
+warmup = ModelWarmup()
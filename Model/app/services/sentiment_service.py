@@ -11,6 +11,7 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 from models.sentiment import SentimentPrediction, get_default_model
+from app.services.model_warmup import ModelSlot, warmup
 
 
 class SentimentAnalysisService:
@@ -36,3 +37,10 @@ def get_sentiment_service() -> SentimentAnalysisService:
     return service
 
 
+def _warm_sentiment():
+    # 토크나이저 / 우도 계산 경로를 한 번 실행
+    service.predict("warm up the sentiment model")
+
+
+# 메모리 상주 모델이라 요청 경로에서 기다리지 않음 -> 준비 상태와 무관하게 첫 요청 전에 미리 실행만
+warmup.register(ModelSlot("sentiment", get_default_model, _warm_sentiment, required=False))
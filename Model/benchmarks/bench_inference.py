@@ -0,0 +1,100 @@
+"""
+이미지 분류 추론 처리량 벤치마크 (배치 크기 1 / 8 / 32, CPU).
+
+추론 스케줄러(InferenceScheduler)에 이미지를 한꺼번에 넣고 초당 처리 이미지 수와 배치 수를 비교합니다.
+- keras    : assets/keras_model.h5 (TensorFlow 필요)
+- synthetic: TensorFlow 없이 스케줄러 효과를 보기 위한 numpy 모델 (224x224x3 -> 64 -> 2 dense)
+  가중치를 한 번 읽어 여러 이미지에 쓰는 배치 행렬 곱이라 Keras 모델과 같은 방향의 배치 효과를 보임
+
+    python -m benchmarks.bench_inference --images 256 --backend auto
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.inference_scheduler import INPUT_SHAPE, InferenceScheduler  # noqa: E402
+
+PredictFn = Callable[[np.ndarray], np.ndarray]
+
+
+def synthetic_model(seed: int = 0) -> PredictFn:
+    rng = np.random.default_rng(seed)
+    features = int(np.prod(INPUT_SHAPE))
+    hidden = rng.standard_normal((features, 64), dtype=np.float32) / np.sqrt(features)
+    output = rng.standard_normal((64, 2), dtype=np.float32)
+
+    def predict(batch: np.ndarray) -> np.ndarray:
+        activations = np.maximum(batch.reshape(len(batch), -1) @ hidden, 0) @ output
+        exps = np.exp(activations - activations.max(axis=1, keepdims=True))
+        return exps / exps.sum(axis=1, keepdims=True)
+
+    return predict
+
+
+def keras_model() -> PredictFn:
+    from app.services import model_service
+
+    model_service.load_ai_model()
+    if model_service.MODEL is None:
+        raise RuntimeError("Keras 모델을 불러오지 못했습니다 (TensorFlow 설치 확인)")
+    return lambda batch: model_service.MODEL.predict(batch, verbose=0)
+
+
+def resolve_backend(name: str) -> Tuple[str, PredictFn]:
+    if name == "synthetic":
+        return name, synthetic_model()
+    if name == "keras":
+        return name, keras_model()
+    try:
+        import tensorflow  # noqa: F401
+    except ImportError:
+        print("ℹ️ TensorFlow가 없어 synthetic 모델로 측정합니다")
+        return "synthetic", synthetic_model()
+    return "keras", keras_model()
+
+
+def run(predict: PredictFn, images: int, batch_size: int, wait_ms: float) -> Tuple[float, int]:
+    """images장을 한꺼번에 넣고 (초당 처리 이미지 수, 실행된 배치 수) 반환"""
+    scheduler = InferenceScheduler(predict, max_batch_size=batch_size, max_wait_ms=wait_ms, queue_size=images)
+    image = np.random.default_rng(1).uniform(-1, 1, INPUT_SHAPE).astype(np.float32)
+    # 워커 스레드 / BLAS 초기화 비용 제외
+    scheduler.submit(image).result()
+    warm_batches = scheduler.batches
+
+    started = time.perf_counter()
+    futures = [scheduler.submit(image) for _ in range(images)]
+    for future in futures:
+        future.result()
+    elapsed = time.perf_counter() - started
+    scheduler.stop()
+    return images / elapsed, scheduler.batches - warm_batches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--images", type=int, default=256)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--wait-ms", type=float, default=5)
+    parser.add_argument("--backend", choices=["auto", "keras", "synthetic"], default="auto")
+    args = parser.parse_args()
+
+    backend, predict = resolve_backend(args.backend)
+    print(f"\n이미지 분류 추론 처리량 ({backend}, 이미지 {args.images}장, 최대 대기 {args.wait_ms:g}ms)")
+    print(f"{'batch':>6}{'img/s':>10}{'batches':>10}{'speedup':>10}")
+    baseline = None
+    for batch_size in args.batch_sizes:
+        throughput, batches = run(predict, args.images, batch_size, args.wait_ms)
+        baseline = baseline or throughput
+        print(f"{batch_size:>6}{throughput:>10.1f}{batches:>10}{throughput / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
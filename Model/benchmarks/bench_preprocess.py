@@ -0,0 +1,91 @@
+"""
+이미지 분류 전처리 시간 벤치마크 (이미지 1장당 ms, 단일 스레드).
+
+/api/predict 전처리의 기존 경로와 새 경로를 같은 JPEG 업로드로 비교합니다.
+- legacy      : 원본 해상도 전체 디코딩 -> ImageOps.fit(LANCZOS) -> float32 새 배열로 정규화 (이전 구현)
+- full+bilinear: draft 없이 전체 디코딩, resize(box) BILINEAR, 배치 버퍼에 바로 정규화
+- draft+<필터> : JPEG 축소 디코딩(draft) + resize(box) + 배치 버퍼에 바로 정규화 (PREPROCESS_RESAMPLE)
+
+    python -m benchmarks.bench_preprocess --repeat 30
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import sys
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+from PIL import Image, ImageOps
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.image_preprocess import load_pixels, normalize_into  # noqa: E402
+from app.services.inference_scheduler import INPUT_SHAPE  # noqa: E402
+
+Preprocess = Callable[[bytes, np.ndarray], None]
+
+SIZES: List[Tuple[int, int]] = [(640, 480), (1920, 1080), (4032, 3024)]
+
+
+def sample_jpeg(size: Tuple[int, int], seed: int = 0) -> bytes:
+    """그라데이션 + 노이즈 사진 (실제 사진에 가까운 JPEG 크기)"""
+    width, height = size
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)
+    xx, yy = np.meshgrid(x, y)
+    pixels = np.stack([xx, yy, (xx + yy) / 2], axis=-1) + rng.normal(0, 12, (height, width, 3))
+    buffer = io.BytesIO()
+    Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8)).save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def legacy(data: bytes, slot: np.ndarray) -> None:
+    image = ImageOps.fit(Image.open(io.BytesIO(data)).convert("RGB"), (224, 224), Image.Resampling.LANCZOS)
+    slot[...] = (np.asarray(image).astype(np.float32) / 127.5) - 1
+
+
+def engine(resample: str, draft: bool) -> Preprocess:
+    def preprocess(data: bytes, slot: np.ndarray) -> None:
+        normalize_into(load_pixels(io.BytesIO(data), resample=resample, draft=draft), slot)
+
+    return preprocess
+
+
+def measure(preprocess: Preprocess, data: bytes, repeat: int) -> float:
+    """이미지 1장당 중앙값 (ms)"""
+    buffer = np.zeros((1, *INPUT_SHAPE), dtype=np.float32)
+    preprocess(data, buffer[0])
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        preprocess(data, buffer[0])
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--filters", nargs="+", default=["bilinear", "lanczos"])
+    args = parser.parse_args()
+
+    paths = [("legacy", legacy), ("full+bilinear", engine("bilinear", draft=False))]
+    paths += [(f"draft+{name}", engine(name, draft=True)) for name in args.filters]
+
+    for size in SIZES:
+        data = sample_jpeg(size)
+        print(f"\nJPEG {size[0]}x{size[1]} ({len(data) / 1024:.0f}KB), 중앙값 {args.repeat}회")
+        print(f"{'path':>16}{'ms/img':>10}{'speedup':>10}")
+        baseline = None
+        for name, preprocess in paths:
+            elapsed = measure(preprocess, data, args.repeat)
+            baseline = baseline or elapsed
+            print(f"{name:>16}{elapsed:>10.2f}{baseline / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -165,6 +165,21 @@ def valid_jpeg_image():
     return b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00\xff\xd9'
 
 
+@pytest.fixture
+def sample_photo_jpeg():
+    """디코딩 가능한 실제 JPEG 사진 크기 이미지 (640x480, 그라데이션)"""
+    import io
+    import numpy as np
+    from PIL import Image
+
+    x = np.linspace(0, 255, 640, dtype=np.uint8)
+    y = np.linspace(0, 255, 480, dtype=np.uint8)
+    pixels = np.stack(np.broadcast_arrays(x[None, :], y[:, None], x[None, :] // 2 + y[:, None] // 2), axis=-1)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels.astype(np.uint8)).save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
 @pytest.fixture
 def invalid_image_data():
     """유효하지 않은 이미지 데이터 (텍스트)"""
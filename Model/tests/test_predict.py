@@ -1,9 +1,51 @@
 """
 이미지 분류(Predict) API 테스트 케이스
 - 이미지 분류 예측
+- 추론 스케줄러 (동시 요청 배치 처리 / 대기열 제한)
+- 전처리 풀 / 백프레셔(503 + Retry-After) / 단계별 지표
+- 전처리 엔진 (JPEG 축소 디코딩, 중앙 크롭 리사이즈, 배치 버퍼 정규화)
 """
 import pytest
+import asyncio
 import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image, ImageOps
+
+import httpx
+
+from app.main import app
+from app.services import image_preprocess, model_service
+from app.services.image_pipeline import pipeline
+from app.services.inference_scheduler import INPUT_SHAPE, InferenceQueueFull, InferenceScheduler
+
+
+class FakeKerasModel:
+    """Keras 모델 대신 쓰는 가짜 모델: 이미지 평균이 0보다 크면 Dog, 아니면 Cat"""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, batch, verbose=0):
+        self.batch_sizes.append(len(batch))
+        means = batch.reshape(len(batch), -1).mean(axis=1)
+        dog = 1 / (1 + np.exp(-means * 10))
+        return np.stack([1 - dog, dog], axis=1)
+
+
+@pytest.fixture
+def fake_model():
+    """가짜 모델 / 라벨을 올리고 끝나면 추론 스케줄러 정리"""
+    model = FakeKerasModel()
+    with patch.object(model_service, "MODEL", model), \
+            patch.object(model_service, "CLASS_NAMES", ["0 Cat", "1 Dog"]):
+        yield model
+    model_service.shutdown_scheduler()
+    pipeline.reset_metrics()
 
 
 class TestPredict:
@@ -15,8 +57,8 @@ class TestPredict:
         
         response = client.post("/api/predict", files=files)
         
-        # 모델이 로드되지 않았을 수 있으므로 다양한 상태 코드 허용
-        assert response.status_code in [200, 500, 422]
+        # 모델이 준비되지 않았으면 503 (로딩 중 / 로딩 실패)
+        assert response.status_code in [200, 500, 422, 503]
         
         if response.status_code == 200:
             data = response.json()
@@ -28,8 +70,8 @@ class TestPredict:
         
         response = client.post("/api/predict", files=files)
         
-        # 모델이 로드되지 않았거나 유효하지 않은 이미지일 수 있음
-        assert response.status_code in [200, 400, 422, 500]
+        # 모델이 준비되지 않았거나(503) 유효하지 않은 이미지일 수 있음
+        assert response.status_code in [200, 400, 422, 500, 503]
     
     def test_predict_invalid_file_type(self, client):
         """잘못된 파일 타입 테스트"""
@@ -72,3 +114,306 @@ class TestPredict:
         response = client.post("/api/predict", files=files)
         
         assert response.status_code in [400, 422, 500]
+
+
+class TestPredictWithModel:
+    """모델이 로드된 상태의 이미지 분류 API 테스트 (가짜 모델)"""
+
+    def test_predict_success(self, client, fake_model, sample_photo_jpeg):
+        """[성공] 스케줄러를 거쳐 분류 결과 반환"""
+        files = {"file": ("photo.jpg", io.BytesIO(sample_photo_jpeg), "image/jpeg")}
+
+        response = client.post("/api/predict", files=files)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["class_name"] in ("Cat", "Dog")
+        assert 0 <= data["confidence_score"] <= 1
+        assert fake_model.batch_sizes == [1]
+
+    def test_queue_full_returns_503(self, client, fake_model, sample_photo_jpeg):
+        """[실패] 추론 대기열이 가득 차면 503"""
+        files = {"file": ("photo.jpg", io.BytesIO(sample_photo_jpeg), "image/jpeg")}
+
+        with patch.object(InferenceScheduler, "submit", side_effect=InferenceQueueFull()):
+            response = client.post("/api/predict", files=files)
+
+        assert response.status_code == 503
+        assert response.json()["message"] == "inference_queue_full"
+        assert response.headers["Retry-After"] == str(pipeline.retry_after)
+
+    def test_too_many_inflight_returns_503(self, client, fake_model, sample_photo_jpeg):
+        """[실패] 처리 중 요청이 한도에 도달하면 전처리 전에 503 + Retry-After"""
+        files = {"file": ("photo.jpg", io.BytesIO(sample_photo_jpeg), "image/jpeg")}
+
+        with patch.object(pipeline, "max_inflight", 0):
+            response = client.post("/api/predict", files=files)
+
+        assert response.status_code == 503
+        assert response.json()["message"] == "inference_busy"
+        assert response.headers["Retry-After"] == str(pipeline.retry_after)
+        assert fake_model.batch_sizes == []
+
+    def test_metrics_report_stage_latency(self, client, fake_model, sample_photo_jpeg):
+        """[성공] 요청 후 단계별 지연과 대기열 지표 조회"""
+        for _ in range(3):
+            files = {"file": ("photo.jpg", io.BytesIO(sample_photo_jpeg), "image/jpeg")}
+            assert client.post("/api/predict", files=files).status_code == 200
+
+        response = client.get("/api/predict/metrics")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["inflight"] == 0
+        assert data["inference"]["queue_depth"] == 0
+        assert data["inference"]["images"] == 3
+        for stage in ("queue_wait", "preprocess", "inference", "total"):
+            assert data["stages"][stage]["count"] == 3
+            assert data["stages"][stage]["p99_ms"] is not None
+
+    def test_slow_preprocess_does_not_block_event_loop(self, fake_model, sample_photo_jpeg):
+        """[성공] 전처리가 오래 걸려도 다른 API는 바로 응답"""
+        original = image_preprocess.load_pixels
+
+        def slow_preprocess(image_file):
+            time.sleep(0.5)
+            return original(image_file)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://model.test") as http:
+                files = {"file": ("photo.jpg", sample_photo_jpeg, "image/jpeg")}
+                upload = asyncio.create_task(http.post("/api/predict", files=files))
+                await asyncio.sleep(0.1)
+                started = time.perf_counter()
+                other = await http.post("/api/auto-tag", json={"text": "웨딩홀 주차"})
+                other_latency = time.perf_counter() - started
+                return await upload, other, other_latency
+
+        with patch.object(image_preprocess, "load_pixels", slow_preprocess):
+            upload, other, other_latency = asyncio.run(scenario())
+
+        assert upload.status_code == 200
+        assert other.status_code == 200
+        assert other_latency < 0.3
+
+
+class TestInferenceScheduler:
+    """동적 마이크로 배치 추론 스케줄러 테스트"""
+
+    def _image(self, value):
+        return np.full(INPUT_SHAPE, value, dtype=np.float32)
+
+    def test_concurrent_requests_are_batched(self):
+        """[성공] 동시에 들어온 요청을 배치로 묶고 요청별 결과를 돌려줌"""
+        model = FakeKerasModel()
+        scheduler = InferenceScheduler(model.predict, max_batch_size=8, max_wait_ms=50, queue_size=64)
+        values = [(-1) ** i * (i + 1) / 20 for i in range(16)]
+        try:
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                futures = list(pool.map(lambda v: scheduler.submit(self._image(v)), values))
+            predictions = [future.result(timeout=5) for future in futures]
+        finally:
+            scheduler.stop()
+
+        for value, prediction in zip(values, predictions):
+            assert (np.argmax(prediction) == 1) == (value > 0)
+        assert sum(model.batch_sizes) == 16
+        assert max(model.batch_sizes) <= 8
+        assert len(model.batch_sizes) < 16
+        assert scheduler.batches == len(model.batch_sizes)
+
+    def test_bounded_queue_rejects_when_full(self):
+        """[실패] 워커가 밀려 대기열이 가득 차면 InferenceQueueFull"""
+        release = threading.Event()
+
+        def blocking_predict(batch):
+            release.wait(5)
+            return np.zeros((len(batch), 2), dtype=np.float32)
+
+        scheduler = InferenceScheduler(blocking_predict, max_batch_size=1, max_wait_ms=0, queue_size=2)
+        try:
+            first = scheduler.submit(self._image(0))
+            # 워커가 첫 요청을 꺼내 추론을 시작할 때까지 대기
+            while scheduler.queue_depth() > 0:
+                pass
+            queued = [scheduler.submit(self._image(0)) for _ in range(2)]
+            with pytest.raises(InferenceQueueFull):
+                scheduler.submit(self._image(0))
+        finally:
+            release.set()
+        assert all(future.result(timeout=5) is not None for future in [first, *queued])
+        scheduler.stop()
+
+    def test_uint8_pixels_are_normalized_into_buffer(self):
+        """[성공] uint8 픽셀은 배치 버퍼에서 [-1, 1] float32로 정규화되어 모델에 전달"""
+        seen = []
+
+        def recording_predict(batch):
+            seen.append((batch.dtype, float(batch.min()), float(batch.max())))
+            return np.zeros((len(batch), 2), dtype=np.float32)
+
+        scheduler = InferenceScheduler(recording_predict, max_batch_size=2, max_wait_ms=0)
+        try:
+            scheduler.submit(np.full(INPUT_SHAPE, 255, dtype=np.uint8)).result(timeout=5)
+            scheduler.submit(np.zeros(INPUT_SHAPE, dtype=np.uint8)).result(timeout=5)
+        finally:
+            scheduler.stop()
+
+        assert seen == [(np.float32, 1.0, 1.0), (np.float32, -1.0, -1.0)]
+
+    def test_model_error_fails_whole_batch(self):
+        """[실패] 추론 중 예외는 배치의 모든 요청에 전달되고 워커는 계속 동작"""
+        calls = []
+
+        def flaky_predict(batch):
+            calls.append(len(batch))
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return np.zeros((len(batch), 2), dtype=np.float32)
+
+        scheduler = InferenceScheduler(flaky_predict, max_batch_size=4, max_wait_ms=0)
+        try:
+            with pytest.raises(RuntimeError):
+                scheduler.submit(self._image(0)).result(timeout=5)
+            assert scheduler.submit(self._image(0)).result(timeout=5).shape == (2,)
+        finally:
+            scheduler.stop()
+
+
+    def test_cancelled_request_does_not_kill_worker(self):
+        """[실패] 기다리던 요청이 취소되어도 같은 배치의 다른 요청과 이후 요청은 결과를 받음"""
+        release = threading.Event()
+        batches = []
+
+        def blocking_predict(batch):
+            release.wait(5)
+            batches.append(len(batch))
+            return np.zeros((len(batch), 2), dtype=np.float32)
+
+        scheduler = InferenceScheduler(blocking_predict, max_batch_size=4, max_wait_ms=50)
+        try:
+            first = scheduler.submit(self._image(0))
+            while scheduler.queue_depth() > 0:
+                pass
+            cancelled = scheduler.submit(self._image(0))
+            batch_mate = scheduler.submit(self._image(0))
+            assert cancelled.cancel()
+            release.set()
+
+            assert first.result(timeout=5).shape == (2,)
+            assert batch_mate.result(timeout=5).shape == (2,)
+            assert scheduler.submit(self._image(0)).result(timeout=5).shape == (2,)
+        finally:
+            release.set()
+            scheduler.stop()
+        assert cancelled.cancelled()
+        assert sum(batches) == 3
+
+    def test_awaiting_task_cancelled(self):
+        """[실패] infer()를 기다리던 코루틴이 취소되어도 워커는 계속 동작"""
+        release = threading.Event()
+
+        def blocking_predict(batch):
+            release.wait(5)
+            return np.zeros((len(batch), 2), dtype=np.float32)
+
+        scheduler = InferenceScheduler(blocking_predict, max_batch_size=4, max_wait_ms=50)
+
+        async def scenario():
+            blocker = scheduler.submit(self._image(0))
+            while scheduler.queue_depth() > 0:
+                await asyncio.sleep(0)
+            task = asyncio.create_task(scheduler.infer(self._image(0)))
+            other = asyncio.create_task(scheduler.infer(self._image(0)))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            release.set()
+            await asyncio.wrap_future(blocker)
+            return await asyncio.wait_for(other, 5), await asyncio.wait_for(scheduler.infer(self._image(0)), 5)
+
+        try:
+            results = asyncio.run(scenario())
+        finally:
+            release.set()
+            scheduler.stop()
+        assert [result.shape for result in results] == [(2,), (2,)]
+
+    def test_stop_with_full_queue(self):
+        """[성공] 대기열이 가득 찬 상태에서 stop()해도 멈추지 않고 남은 요청을 처리한 뒤 종료"""
+        release = threading.Event()
+
+        def blocking_predict(batch):
+            release.wait(5)
+            return np.zeros((len(batch), 2), dtype=np.float32)
+
+        scheduler = InferenceScheduler(blocking_predict, max_batch_size=1, max_wait_ms=0, queue_size=1)
+        first = scheduler.submit(self._image(0))
+        while scheduler.queue_depth() > 0:
+            pass
+        queued = scheduler.submit(self._image(0))
+        worker = scheduler._thread
+
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        scheduler.stop(timeout=5)
+
+        assert first.result(timeout=0).shape == (2,)
+        assert queued.result(timeout=0).shape == (2,)
+        assert not worker.is_alive()
+
+
+class TestImagePreprocess:
+    """전처리 엔진 테스트"""
+
+    def _photo(self, size=(1600, 1200), fmt="JPEG", mode="RGB"):
+        width, height = size
+        x = np.linspace(0, 255, width, dtype=np.float32)
+        y = np.linspace(0, 255, height, dtype=np.float32)
+        xx, yy = np.meshgrid(x, y)
+        pixels = np.stack([xx, yy, (xx + yy) / 2], axis=-1).astype(np.uint8)
+        image = Image.fromarray(pixels).convert(mode)
+        buffer = io.BytesIO()
+        image.save(buffer, format=fmt, quality=90) if fmt == "JPEG" else image.save(buffer, format=fmt)
+        buffer.seek(0)
+        return buffer
+
+    def _legacy(self, image_file):
+        image = ImageOps.fit(Image.open(image_file).convert("RGB"), (224, 224), Image.Resampling.LANCZOS)
+        return (np.asarray(image).astype(np.float32) / 127.5) - 1
+
+    def test_draft_decode_matches_full_decode(self):
+        """[성공] JPEG 축소 디코딩 결과가 원본 해상도 LANCZOS 경로와 거의 같음"""
+        fast = image_preprocess.normalize(image_preprocess.load_pixels(self._photo()))
+        legacy = self._legacy(self._photo())
+
+        assert fast.shape == (224, 224, 3)
+        assert fast.dtype == np.float32
+        assert np.abs(fast - legacy).mean() < 0.03
+
+    def test_non_jpeg_is_center_cropped(self):
+        """[성공] draft가 없는 형식(RGBA PNG)도 중앙 크롭 + 리사이즈"""
+        pixels = image_preprocess.load_pixels(self._photo((400, 200), fmt="PNG", mode="RGBA"))
+
+        assert pixels.shape == (224, 224, 3)
+        assert pixels.dtype == np.uint8
+        # 가로 그라데이션의 가운데 절반만 남음
+        assert 50 < pixels[112, 0, 0] < 80
+        assert 175 < pixels[112, -1, 0] < 205
+
+    def test_normalize_into_writes_in_place(self):
+        """[성공] 정규화 결과를 주어진 버퍼 칸에 바로 기록"""
+        buffer = np.zeros((2, *INPUT_SHAPE), dtype=np.float32)
+        pixels = np.zeros(INPUT_SHAPE, dtype=np.uint8)
+        pixels[0, 0] = [0, 127, 255]
+
+        result = image_preprocess.normalize_into(pixels, buffer[1])
+
+        assert np.shares_memory(result, buffer)
+        assert buffer[1, 0, 0].tolist() == pytest.approx([-1.0, -0.00392, 1.0], abs=1e-4)
+        assert not buffer[0].any()
+
+    def test_unknown_resample_filter(self):
+        """[실패] 지원하지 않는 필터 이름"""
+        with pytest.raises(ValueError):
+            image_preprocess.load_pixels(self._photo(), resample="fastest")
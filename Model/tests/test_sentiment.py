@@ -4,6 +4,7 @@
 테스트 대상:
 - POST /api/sentiment        : ML 모델 기반 감정 분석
 - POST /api/sentiment/gemini : Gemini API 기반 감정 분석
+- POST /api/sentiment/batch  : 여러 텍스트 한 번에 감정 분석
 
 테스트 전략:
 1. 엔드포인트 존재 확인 (서비스 가용성과 무관)
@@ -183,6 +184,82 @@ class TestSentimentAnalysisEndpoint:
         assert response.status_code in [200, 500, 503]
 
 
+class TestSentimentBatchEndpoint:
+    """
+    여러 텍스트 감정 분석 API 테스트
+
+    엔드포인트: POST /api/sentiment/batch
+    요청 형식: JSON
+    {
+        "texts": ["텍스트1", "텍스트2"],
+        "explain": false
+    }
+    """
+
+    def test_batch_results_in_input_order(self, client, sample_text_positive, sample_text_negative):
+        """
+        [성공] 입력 순서대로 결과 반환, 단건 API와 같은 결과
+        """
+        payload = {"texts": [sample_text_positive, sample_text_negative], "explain": False}
+        response = client.post("/api/sentiment/batch", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["label"] for item in data["results"]] == ["positive", "negative"]
+        assert data["errors"] == []
+
+        single = client.post("/api/sentiment", json={"text": sample_text_positive}).json()
+        assert data["results"][0]["confidence"] == single["confidence"]
+
+    def test_batch_item_failure_does_not_fail_batch(self, client, sample_text_positive):
+        """
+        [실패] 분석할 수 없는 항목은 null + errors, 나머지는 정상 결과
+        """
+        payload = {"texts": [sample_text_positive, "   ", "1234"]}
+        response = client.post("/api/sentiment/batch", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["results"][0]["label"] == "positive"
+        assert data["results"][1] is None and data["results"][2] is None
+        assert [error["index"] for error in data["errors"]] == [1, 2]
+
+    def test_batch_size_limit(self, client):
+        """
+        [실패] 빈 목록이나 최대 개수를 넘는 요청은 422
+        """
+        from app.core.config import MAX_BATCH_SIZE
+
+        assert client.post("/api/sentiment/batch", json={"texts": []}).status_code == 422
+        too_many = {"texts": ["good"] * (MAX_BATCH_SIZE + 1)}
+        assert client.post("/api/sentiment/batch", json=too_many).status_code == 422
+
+
+    def test_batch_runs_off_event_loop(self, client, sample_text_positive):
+        """
+        [성능] 배치 추론은 이벤트 루프 밖(스레드 풀)에서 실행
+        """
+        import asyncio
+        from unittest.mock import patch
+        from app.services.sentiment_service import service
+
+        original = service.predict
+        loop_running = []
+
+        def recording_predict(text):
+            try:
+                asyncio.get_running_loop()
+                loop_running.append(True)
+            except RuntimeError:
+                loop_running.append(False)
+            return original(text)
+
+        with patch.object(service, "predict", side_effect=recording_predict):
+            response = client.post("/api/sentiment/batch", json={"texts": [sample_text_positive] * 3})
+
+        assert response.status_code == 200
+        assert loop_running == [False, False, False]
+
 class TestGeminiSentimentEndpoint:
     """
     Gemini API 기반 감정 분석 테스트
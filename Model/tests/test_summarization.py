@@ -114,3 +114,29 @@ class TestLLMSummarization:
         response = client.post("/api/summarize", json=payload)
         
         assert response.status_code in [200, 404, 422, 500, 503]
+
+
+class TestBatchSummarization:
+    """여러 텍스트 요약 / 자동 태깅 배치 API 테스트"""
+
+    def test_summarize_batch(self, client, sample_summarization_text):
+        """배치 요약: 입력 순서대로 결과, 너무 짧은 텍스트는 null + errors"""
+        payload = {"texts": [sample_summarization_text["text"], "짧음"]}
+
+        response = client.post("/api/summarize/batch", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        single = client.post("/api/summarize", json=sample_summarization_text).json()
+        assert data["results"][0] == single
+        assert data["results"][1] is None
+        assert data["errors"] == [{"index": 1, "message": "text_too_short"}]
+
+    def test_auto_tag_batch(self, client):
+        """배치 자동 태깅: 입력 순서대로 태그 목록"""
+        payload = {"texts": ["웨딩홀 주차가 편해요", "오늘 날씨"]}
+
+        response = client.post("/api/auto-tag/batch", json=payload)
+
+        assert response.status_code == 200
+        assert [item["tags"] for item in response.json()["results"]] == [["웨딩홀", "주차"], ["일반"]]
@@ -2,6 +2,10 @@
 시스템 및 기본 엔드포인트 테스트 케이스
 """
 import pytest
+import io
+import threading
+import time
+from unittest.mock import patch
 
 
 class TestSystem:
@@ -76,3 +80,140 @@ class TestCORS:
         
         # Preflight 요청 성공
         assert response.status_code in [200, 204]
+
+
+class TestHealth:
+    """모델 warm-up / 헬스 체크 테스트"""
+
+    def _slot(self, name, load=None, warm=None, **options):
+        from app.services.model_warmup import ModelSlot
+        return ModelSlot(name, load or (lambda: None), warm, **options)
+
+    def _failing_slot(self, name, calls, retry_base=60):
+        def load():
+            calls.append(name)
+            raise RuntimeError("No module named 'tensorflow'")
+        return self._slot(name, load, retry_base=retry_base, retry_max=600)
+
+    def test_live(self, client):
+        """[성공] 프로세스가 살아 있으면 모델 상태와 무관하게 200"""
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+
+    def test_ready_when_all_models_loaded(self, client):
+        """[성공] 모든 모델이 준비되면 200 + 모델별 상태"""
+        from app.services.model_warmup import warmup
+        slot = self._slot("image_classifier")
+        slot.attempt()
+
+        with patch.dict(warmup._slots, {"image_classifier": slot}, clear=True):
+            response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["models"]["image_classifier"]["state"] == "ready"
+
+    def test_not_ready_reports_failed_model(self, client):
+        """[실패] 로딩에 실패한 모델이 있으면 503 + 실패 원인 / 재시도 시간"""
+        from app.services.model_warmup import warmup
+        calls = []
+        failed = self._failing_slot("image_classifier", calls)
+        failed.attempt()
+
+        with patch.dict(warmup._slots, {"image_classifier": failed, "sentiment": self._slot("sentiment")}, clear=True):
+            response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        models = response.json()["data"]["models"]
+        assert models["image_classifier"]["state"] == "failed"
+        assert "tensorflow" in models["image_classifier"]["last_error"]
+        assert models["image_classifier"]["retry_after"] > 0
+        assert models["sentiment"]["state"] == "pending"
+
+    def test_predict_while_model_failed_does_not_reload(self, client, sample_photo_jpeg):
+        """[실패] 로딩 실패 후 재시도 간격 동안 요청은 로딩 없이 503 + Retry-After"""
+        from app.services.model_warmup import warmup
+        calls = []
+        failed = self._failing_slot("image_classifier", calls)
+        failed.attempt()
+
+        with patch.dict(warmup._slots, {"image_classifier": failed}):
+            responses = [
+                client.post("/api/predict", files={"file": ("photo.jpg", io.BytesIO(sample_photo_jpeg), "image/jpeg")})
+                for _ in range(5)
+            ]
+
+        assert calls == ["image_classifier"]
+        for response in responses:
+            assert response.status_code == 503
+            assert response.json()["message"] == "model_unavailable"
+            assert 0 < int(response.headers["Retry-After"]) <= 60
+
+    def test_failed_load_retries_with_backoff(self):
+        """[실패] 재시도 간격이 두 배씩 늘어나고 최대값에서 멈춤"""
+        calls = []
+        slot = self._failing_slot("image_classifier", calls, retry_base=100)
+
+        delays = []
+        for _ in range(5):
+            slot.next_retry_at = 0
+            slot.attempt()
+            delays.append(round(slot.next_retry_at - time.monotonic(), -1))
+
+        assert delays == [100, 200, 400, 600, 600]
+        assert len(calls) == 5
+
+    def test_background_warmup_loads_and_warms(self):
+        """[성공] 백그라운드 스레드가 로딩 + 워밍업, 그동안 요청은 503 model_loading"""
+        from app.core.exceptions import APIError
+        from app.services.model_warmup import ModelWarmup
+        release = threading.Event()
+        warmed = []
+        manager = ModelWarmup()
+        manager.register(self._slot("image_classifier", lambda: release.wait(5), lambda: warmed.append(True)))
+
+        manager.start()
+        try:
+            with pytest.raises(APIError) as exc_info:
+                manager.require("image_classifier")
+            assert exc_info.value.status_code == 503
+            assert exc_info.value.message == "model_loading"
+
+            release.set()
+            manager._thread.join(5)
+            manager.require("image_classifier")
+        finally:
+            manager.stop()
+
+        assert manager.ready()
+        assert warmed == [True]
+
+    def test_optional_slot_is_primed_but_not_gated(self):
+        """[성공] required=False 슬롯(감성 분석)은 백그라운드에서 미리 실행되지만 준비 상태에는 영향 없음"""
+        from app.services.model_warmup import ModelWarmup
+        primed = []
+        manager = ModelWarmup()
+        manager.register(self._slot("image_classifier"))
+        manager.register(self._slot("sentiment", warm=lambda: primed.append(True), required=False))
+        manager.slot("image_classifier").attempt()
+
+        assert manager.ready()
+
+        manager.start()
+        manager._thread.join(5)
+        manager.stop()
+
+        assert primed == [True]
+        assert manager.snapshot()["sentiment"]["state"] == "ready"
+        assert manager.snapshot()["sentiment"]["required"] is False
+
+    def test_sentiment_service_registers_prime_slot(self):
+        """[성공] 감성 분석 모델은 준비 상태와 무관한 프라임 슬롯으로 등록됨"""
+        import app.services.sentiment_service  # noqa: F401  (슬롯 등록)
+        from app.services.model_warmup import warmup
+
+        slot = warmup.slot("sentiment")
+        assert slot.required is False
+        assert slot.warm is not None